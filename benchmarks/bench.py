@@ -0,0 +1,173 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmarks of the lexer, the parser and `csv_det`.
+
+Usage:
+
+    python -m benchmarks.bench --sizes 1000 10000 100000 > bench.jsonl
+
+Every line of the output is a JSON record: the benchmark, the case, the
+number of rows, the time, the rows per second and the peak memory (traced
+by `tracemalloc` in a second run), plus the commit and the Python version,
+so that the results of two commits can be compared.
+"""
+import argparse
+import csv
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Mapping, Optional, Sequence, TextIO
+
+from benchmarks.generators import get_cases
+from columndet.lexer import Lexer, TableLexer
+from columndet.npcolumn import HAS_NUMPY
+from columndet.parser import Parser
+from columndet.tool import csv_det
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5]
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    arg_parser.add_argument("--sizes", type=int, nargs="+",
+                            default=DEFAULT_SIZES,
+                            help="the numbers of rows (1e3 to 1e7)")
+    arg_parser.add_argument("--benchmarks", nargs="+",
+                            default=["lex", "lex_many", "parse", "csv_det"])
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--no-memory", action="store_true",
+                            help="skip the tracemalloc runs")
+    args = arg_parser.parse_args(argv)
+
+    runner = BenchmarkRunner(sys.stdout, not args.no_memory)
+    for size in args.sizes:
+        rows_by_case = {f"{category}/{name}": generate(size,
+                                                       random.Random(args.seed))
+                        for category, name, generate in get_cases()}
+        if "lex" in args.benchmarks:
+            bench_lex(runner, rows_by_case)
+        if "lex_many" in args.benchmarks:
+            bench_lex_many(runner, rows_by_case)
+        if "parse" in args.benchmarks:
+            bench_parse(runner, rows_by_case)
+        if "csv_det" in args.benchmarks:
+            bench_csv_det(runner, rows_by_case)
+
+
+class BenchmarkRunner:
+    def __init__(self, out: TextIO, with_memory: bool = True):
+        self._out = out
+        self._with_memory = with_memory
+        self._context = {"commit": _get_commit(),
+                         "python": platform.python_version()}
+
+    def run(self, benchmark: str, case: str, rows: int,
+            func: Callable[[], object]):
+        start = time.perf_counter()
+        result = func()
+        seconds = time.perf_counter() - start
+        record = {"benchmark": benchmark, "case": case, "rows": rows,
+                  "seconds": seconds,
+                  "rows_per_s": rows / seconds if seconds else None}
+        if self._with_memory:
+            tracemalloc.start()
+            try:
+                func()
+                _, record["peak_memory"] = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        if result is not None:
+            record["result"] = str(result)
+        record.update(self._context)
+        self._out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._out.flush()
+
+
+def bench_lex(runner: BenchmarkRunner, rows_by_case: Mapping[str, List[str]]):
+    for lexer in [Lexer(), TableLexer()]:
+        for case, rows in rows_by_case.items():
+            runner.run(f"lex/{type(lexer).__name__}", case, len(rows),
+                       lambda: _lex_all(lexer, rows))
+
+
+def _lex_all(lexer: Lexer, rows: List[str]):
+    for row in rows:
+        lexer.lex(row)
+
+
+def _lex_many(lexer: Lexer, rows: List[str]):
+    lexer.lex_many(rows)
+
+
+def bench_lex_many(runner: BenchmarkRunner,
+                   rows_by_case: Mapping[str, List[str]]):
+    for lexer in [Lexer(), TableLexer()]:
+        for case, rows in rows_by_case.items():
+            runner.run(f"lex_many/{type(lexer).__name__}", case, len(rows),
+                       lambda: _lex_many(lexer, rows))
+
+
+def bench_parse(runner: BenchmarkRunner,
+                rows_by_case: Mapping[str, List[str]]):
+    parsers = [("parse", Parser.create())]
+    if HAS_NUMPY:
+        parsers.append(("parse/numpy", Parser.create(numpy_backend=True)))
+    for benchmark, parser in parsers:
+        for case, rows in rows_by_case.items():
+            runner.run(benchmark, case, len(rows),
+                       lambda: parser.parse(rows))
+
+
+def bench_csv_det(runner: BenchmarkRunner,
+                  rows_by_case: Mapping[str, List[str]]):
+    """
+    One CSV file with a column per case.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory, "bench.csv")
+        with path.open("w", encoding="utf-8", newline="") as dest:
+            writer = csv.writer(dest, delimiter=";")
+            writer.writerow(rows_by_case.keys())
+            writer.writerows(zip(*rows_by_case.values()))
+        size = min(len(rows) for rows in rows_by_case.values())
+        runner.run("csv_det", "all", size, lambda: len(
+            csv_det(path, chunk_size=path.stat().st_size + 1
+                    ).field_descriptions))
+
+
+def _get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, cwd=Path(__file__).parent,
+            universal_newlines=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Synthetic data generators for the benchmarks: one generator per fixture
+category of `tests/fixtures`.
+"""
+import datetime
+import random
+from typing import Callable, List, Tuple
+
+from columndet.datedet import RANGES_BY_FORMAT
+from columndet.i18n import (get_names_by_datecode_by_locale,
+                            get_true_false_by_locale_name)
+
+Generator = Callable[[int, random.Random], List[str]]
+
+STRFTIME_BY_CODE = [("yyyy", "%Y"), ("yy", "%y"), ("MM", "%m"), ("dd", "%d"),
+                    ("HH", "%H"), ("mm", "%M"), ("ss", "%S")]
+
+DATE_FORMATS = list(RANGES_BY_FORMAT) + ["dd/MM/yyyy", "MM/dd/yyyy",
+                                         "yyyy-MM-dd"]
+DATETIME_FORMATS = ["yyyyMMddHHmmss", "dd/MM/yyyy HH:mm:ss",
+                    "yyyy-MM-ddTHH:mm:ss"]
+
+EPOCH = datetime.datetime(1950, 1, 1)
+
+
+def _to_strftime(date_format: str) -> str:
+    for code, directive in STRFTIME_BY_CODE:
+        date_format = date_format.replace(code, directive)
+    return date_format
+
+
+def _random_datetime(rng: random.Random) -> datetime.datetime:
+    return EPOCH + datetime.timedelta(seconds=rng.randrange(100 * 365 * 86400))
+
+
+def dates(date_format: str) -> Generator:
+    strftime = _to_strftime(date_format)
+
+    def generate(n: int, rng: random.Random) -> List[str]:
+        return [_random_datetime(rng).strftime(strftime) for _ in range(n)]
+
+    return generate
+
+
+def month_names(locale: str) -> Generator:
+    """
+    Dates like "26 septembre 2040" with the month names of a locale.
+    """
+    months = sorted(name for name in
+                    get_names_by_datecode_by_locale()[locale]["month"]
+                    if " " not in name)
+
+    def generate(n: int, rng: random.Random) -> List[str]:
+        return [f"{rng.randint(1, 28):02} {rng.choice(months)} "
+                f"{rng.randint(1950, 2049)}" for _ in range(n)]
+
+    return generate
+
+
+def floats(thousands_sep: str, decimal_sep: str) -> Generator:
+    def generate(n: int, rng: random.Random) -> List[str]:
+        return [_format_number(rng.uniform(-1e6, 1e6), thousands_sep,
+                               decimal_sep) for _ in range(n)]
+
+    return generate
+
+
+def _format_number(value: float, thousands_sep: str, decimal_sep: str
+                   ) -> str:
+    text = f"{value:,.2f}"
+    return text.replace(",", "\0").replace(".", decimal_sep).replace(
+        "\0", thousands_sep)
+
+
+def integers(n: int, rng: random.Random) -> List[str]:
+    # the parser does not support the signed integers yet
+    return [str(rng.randint(0, 10 ** 6)) for _ in range(n)]
+
+
+def currencies(n: int, rng: random.Random) -> List[str]:
+    return ["$" + _format_number(rng.uniform(0, 1e5), ",", ".")
+            for _ in range(n)]
+
+
+def percentages(n: int, rng: random.Random) -> List[str]:
+    return [_format_number(rng.uniform(0, 100), "", ",") + " %"
+            for _ in range(n)]
+
+
+def booleans(locale: str) -> Generator:
+    true, false = get_true_false_by_locale_name()[locale]
+
+    def generate(n: int, rng: random.Random) -> List[str]:
+        return [rng.choice((true, false)) for _ in range(n)]
+
+    return generate
+
+
+def booleans_01(n: int, rng: random.Random) -> List[str]:
+    return [rng.choice("01") for _ in range(n)]
+
+
+def texts(n: int, rng: random.Random) -> List[str]:
+    words = ["route", "chemin", "entrée", "rue", "du", "de", "la", "pays",
+             "soule", "place"]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+            for _ in range(n)]
+
+
+def get_cases() -> List[Tuple[str, str, Generator]]:
+    """
+    :return: the cases: category, name and generator
+    """
+    cases = []
+    for date_format in DATE_FORMATS:
+        cases.append(("date", date_format, dates(date_format)))
+    for locale in ["en_US", "fr_FR", "de_DE"]:
+        cases.append(("date", f"dd month yyyy/{locale}", month_names(locale)))
+    for date_format in DATETIME_FORMATS:
+        cases.append(("datetime", date_format, dates(date_format)))
+    cases += [
+        ("float", "EN", floats(",", ".")),
+        ("float", "FR", floats(" ", ",")),
+        ("float", "FR_nbsp", floats("\xa0", ",")),
+        ("integer", "integer", integers),
+        ("currency", "US", currencies),
+        ("percentage", "FR", percentages),
+        ("bool", "01", booleans_01),
+        ("bool", "en_US", booleans("en_US")),
+        ("bool", "el_GR", booleans("el_GR")),
+        ("text", "text", texts),
+    ]
+    return cases
@@ -0,0 +1,93 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Benchmark of the import time of columndet, for short-lived workers.
+
+Usage:
+
+    python -m benchmarks.import_time --repeat 20 > import_time.jsonl
+
+Every module is imported in `repeat` fresh interpreters. Every line of the
+output is a JSON record: the module, the median and min import times, the
+median time of the first access to the locale tables, whether NumPy was
+imported (it should not: see `columndet.npcolumn`), whether the marshal
+blob of the tables exists (see `python -m columndet.i18n`), plus the commit
+and the Python version.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Mapping, Optional, Sequence
+
+from benchmarks.bench import _get_commit
+from columndet.i18n import BLOB_PATH
+
+DEFAULT_MODULES = ["columndet", "columndet.parser", "columndet.tool"]
+
+SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+numpy = "numpy" in sys.modules
+from columndet.i18n import get_names_by_datecode_by_locale
+get_names_by_datecode_by_locale()
+loaded = time.perf_counter()
+print(json.dumps({{"import": imported - start, "first_use": loaded - imported,
+                  "numpy": numpy}}))
+"""
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    arg_parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    arg_parser.add_argument("--repeat", type=int, default=20)
+    args = arg_parser.parse_args(argv)
+
+    context = {"commit": _get_commit(), "python": platform.python_version(),
+               "blob": os.path.exists(BLOB_PATH)}
+    for module in args.modules:
+        timings = [_time_import(module) for _ in range(args.repeat)]
+        imports = [timing["import"] for timing in timings]
+        record = {"benchmark": "import", "case": module,
+                  "repeat": args.repeat,
+                  "seconds": statistics.median(imports),
+                  "min_seconds": min(imports),
+                  "first_use_seconds": statistics.median(
+                      timing["first_use"] for timing in timings),
+                  "numpy": any(timing["numpy"] for timing in timings)}
+        record.update(context)
+        sys.stdout.write(json.dumps(record) + "\n")
+        sys.stdout.flush()
+
+
+def _time_import(module: str) -> Mapping[str, float]:
+    output = subprocess.run(
+        [sys.executable, "-c", SNIPPET.format(module=module)],
+        stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+    return json.loads(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import collections
+import random
+from typing import Iterable, List, Optional, Sequence, Tuple, Counter
+
+from mcsv.meta_csv_data import FieldDescription
+from columndet.parser import Parser
+from columndet.util import OpCode, Token, TokenRow
+
+SLOT_WIDTH = 2
+
+
+class ColumnAccumulator:
+    """
+    An online accumulator for the values of a column: feed the values by
+    batches, then get the field description.
+
+    The counts of the distinct values are exact up to `max_distinct` values.
+    Beyond that, the new values are summarized by shape (see
+    `TokenRow.shape`): a count, and the min/max of every two-digits slot of
+    the numbers. Sizes, first/last tokens and separators only depend on the
+    shape and remain exact, while the date parts keep their ranges.
+
+    Beyond `max_shapes` shapes, the values with a new shape are dropped, but
+    a uniform sample of `max_shapes` dropped values is kept: the sample
+    stands for all the dropped values in the counts, so that the thresholds
+    are still applied to the whole column. The memory is
+    O(max_distinct + max_shapes).
+    """
+
+    @staticmethod
+    def create(parser: Parser, max_distinct: int = 100000,
+               max_shapes: int = 10000, seed: int = 0
+               ) -> "ColumnAccumulator":
+        """
+        :param parser: the parser. Its lexer is used to find the shapes.
+        :param max_distinct: the maximum number of distinct values
+        :param max_shapes: the maximum number of shapes, and the size of the
+                           sample of the dropped values
+        :param seed: the seed of the sample of the dropped values
+        :return: the accumulator
+        """
+        return ColumnAccumulator(parser, max_distinct, max_shapes,
+                                 random.Random(seed))
+
+    def __init__(self, parser: Parser, max_distinct: int, max_shapes: int,
+                 rng: random.Random):
+        self._parser = parser
+        self._lexer = parser.lexer
+        self._max_distinct = max_distinct
+        self._max_shapes = max_shapes
+        self._rng = rng
+        self._counts = collections.Counter()
+        self._summaries = {}
+        self._dropped_sample = []
+        self.dropped = 0
+
+    def feed(self, values: Iterable[str]):
+        """
+        :param values: some values of the column
+        """
+        counts = self._counts
+        for value in values:
+            text = value.strip()
+            count = counts.get(text)
+            if count is not None:
+                counts[text] = count + 1
+            elif len(counts) < self._max_distinct:
+                counts[text] = 1
+            else:
+                self._summarize(text)
+
+    def _summarize(self, text: str):
+        tokens = self._lexer.lex(text)
+        shape = TokenRow(tokens).shape()
+        summary = self._summaries.get(shape)
+        if summary is not None:
+            summary.add(tokens)
+        elif len(self._summaries) < self._max_shapes:
+            self._summaries[shape] = _ShapeSummary(tokens)
+        else:
+            self._drop(text)
+
+    def _drop(self, text: str):
+        self.dropped += 1
+        if len(self._dropped_sample) < self._max_shapes:
+            self._dropped_sample.append(text)
+        else:
+            j = self._rng.randrange(self.dropped)
+            if j < self._max_shapes:
+                self._dropped_sample[j] = text
+
+    def counts(self) -> Counter[str]:
+        """
+        :return: the counts of the distinct values, where the summarized
+        values are replaced by their min/max values, and the dropped values
+        by their sample.
+        """
+        counts = collections.Counter(self._counts)
+        for summary in self._summaries.values():
+            for text, count in summary.texts():
+                counts[text] += count
+        if self._dropped_sample:
+            # spread the number of dropped values over the sample
+            base, extra = divmod(self.dropped, len(self._dropped_sample))
+            for i, text in enumerate(self._dropped_sample):
+                counts[text] += base + (i < extra)
+        return counts
+
+    def result(self, name: Optional[str] = None) -> FieldDescription:
+        """
+        May be called at any time.
+
+        :param name: the name of the column, for the stats
+        :return: the field description of the values fed so far
+        """
+        return self._parser.parse_counts(self.counts(), name)
+
+
+class _ShapeSummary:
+    """
+    The summary of the values of a shape: the values are replaced by two
+    values made of the min (resp. max) of every slot of the numbers.
+    """
+
+    def __init__(self, tokens: Sequence[Token]):
+        self._texts = [t.text for t in tokens]
+        self._mins = {i: _slots(t.text) for i, t in enumerate(tokens)
+                      if t.opcode == OpCode.NUMBER}
+        self._maxs = {i: list(slots) for i, slots in self._mins.items()}
+        self._count = 1
+
+    def add(self, tokens: Sequence[Token]):
+        for i, mins in self._mins.items():
+            maxs = self._maxs[i]
+            for j, slot in enumerate(_slots(tokens[i].text)):
+                if slot < mins[j]:
+                    mins[j] = slot
+                elif slot > maxs[j]:
+                    maxs[j] = slot
+        self._count += 1
+
+    def texts(self) -> List[Tuple[str, int]]:
+        """
+        :return: the values that replace the values of the shape, and their
+        number of occurrences.
+        """
+        min_text = self._build(self._mins)
+        max_text = self._build(self._maxs)
+        if min_text == max_text:
+            return [(min_text, self._count)]
+        half = self._count // 2
+        return [(min_text, self._count - half), (max_text, half)]
+
+    def _build(self, slots_by_index) -> str:
+        texts = list(self._texts)
+        for i, slots in slots_by_index.items():
+            texts[i] = "".join(slots)
+        return "".join(texts)
+
+
+def _slots(text: str) -> List[str]:
+    return [text[i:i + SLOT_WIDTH] for i in range(0, len(text), SLOT_WIDTH)]
@@ -19,27 +19,69 @@
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import collections
-from typing import Set
+import functools
+from typing import Set, Optional, Tuple, Union
 
 from mcsv.meta_csv_data import FieldDescription, BooleanDescription
-from columndet.i18n import TRUE_FALSE_BY_LOCALE_NAME
+from columndet.cache import ShapeCache
+from columndet.i18n import (get_true_false_by_locale_name, LocaleSelection,
+                            SELECTION_CACHE_SIZE)
+from columndet.i18n_index import MmapIndex, get_sections, true_false_entries
+from columndet.index import InvertedIndex
 from columndet.util import get_some
 
 
 class BooleanSniffer:
-    def __init__(self, texts: Set[str], threshold: float):
+    def __init__(self, texts: Set[str], threshold: float,
+                 shape_cache: Optional[ShapeCache] = None,
+                 locale_selection: Optional[LocaleSelection] = None):
+        """
+        :param texts: the texts of the column
+        :param threshold: the threshold
+        :param shape_cache: the cache of the decisions
+        :param locale_selection: the candidate locales, None for every locale
+        """
         self._texts = texts
         self._threshold = threshold
+        self._shape_cache = shape_cache
+        self._locale_selection = locale_selection
 
     def sniff(self) -> FieldDescription:
         counter = collections.Counter(self._texts)
         t_f = get_some(counter, 2, self._threshold)
         if t_f:
-            # can't create the reverse dict because of UTF-8
-            for locale_name, locale_t_f in TRUE_FALSE_BY_LOCALE_NAME.items():
-                if set(t_f) <= set(locale_t_f):
-                    return BooleanDescription(*locale_t_f)
-
-            raise ValueError()
+            if self._shape_cache is None:
+                locale_t_f = self._find_t_f(t_f)
+            else:
+                locale_t_f = self._shape_cache.get_or_compute(
+                    ("bool", self._locale_selection, frozenset(t_f)),
+                    lambda: self._find_t_f(t_f))
+            if locale_t_f is None:
+                raise ValueError()
+            return BooleanDescription(*locale_t_f)
         else:
             raise ValueError("Empty int_values")  # should not happen
+
+    def _find_t_f(self, t_f: Tuple[str, ...]) -> Optional[Tuple[str, str]]:
+        return get_true_false_index(self._locale_selection).find_first(t_f)
+
+
+@functools.lru_cache(maxsize=SELECTION_CACHE_SIZE)
+def get_true_false_index(locale_selection: Optional[LocaleSelection] = None
+                         ) -> Union[InvertedIndex[Tuple[str, str]],
+                                    MmapIndex]:
+    """
+    :param locale_selection: the candidate locales, None for every locale
+    :return: the index of the localized true/false pairs: the compiled index
+    if it was built (see `columndet.i18n_index`), else an index built from
+    the table. With a selection, an index of the selected locales. The
+    indexes of the last `SELECTION_CACHE_SIZE` selections are kept.
+    """
+    if locale_selection is not None:
+        return InvertedIndex.create(true_false_entries(
+            locale_selection.select(get_true_false_by_locale_name())))
+    index = get_sections().get("true_false")
+    if index is None:
+        index = InvertedIndex.create(
+            true_false_entries(get_true_false_by_locale_name()))
+    return index
@@ -0,0 +1,159 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import collections
+import hashlib
+import threading
+import time
+from array import array
+from typing import Callable, Hashable, Mapping, Optional, TypeVar
+
+T = TypeVar('T')
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    A thread safe LRU cache, with hit/miss/eviction counters. If `ttl` is
+    not None, the entries expire `ttl` seconds after they were stored.
+    Expired entries count as evictions.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        :param maxsize: the maximum number of entries
+        :param ttl: the time to live of the entries, in seconds, None for
+                    no expiration
+        :param clock: the clock, in seconds
+        """
+        if maxsize <= 0:
+            raise ValueError(f"Expected a positive size, got {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Expected a positive ttl, got {ttl}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key: Hashable, default: Optional[T] = None
+            ) -> Optional[T]:
+        """
+        :param key: the key
+        :param default: the value returned if the key is missing or expired
+        :return: the cached value
+        """
+        with self._lock:
+            try:
+                value, expires_at = self._values[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if expires_at is not None and expires_at <= self._clock():
+                del self._values[key]
+                self.evictions += 1
+                self.misses += 1
+                return default
+            self._values.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: T):
+        """
+        :param key: the key
+        :param value: the value
+        """
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._values[key] = value, expires_at
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        The value is computed outside of the lock.
+
+        :param key: the key
+        :param func: the function to compute the value if the key is missing
+        :return: the cached or computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = func()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def stats(self) -> Mapping[str, int]:
+        """
+        :return: the size, the maximum size and the counters.
+        """
+        with self._lock:
+            return {"size": len(self._values), "maxsize": self.maxsize,
+                    "hits": self.hits, "misses": self.misses,
+                    "evictions": self.evictions}
+
+
+class ShapeCache(LRUCache):
+    """
+    A cache of the decisions that only depend on the shape of the tokens:
+    the separators of a number with a given opcode/width signature, the
+    locale of a set of month names, the locale of a pair of booleans.
+
+    May be shared by many parsers, e.g. in a long-lived process.
+    """
+
+
+class ColumnCache(LRUCache):
+    """
+    A cache of the field descriptions of whole columns, by fingerprint of
+    the counts of the distinct values (see `fingerprint`). A repeated column
+    skips the lexing and the sniffing.
+
+    The descriptions depend on the settings of the parser: a cache belongs
+    to one parser.
+    """
+
+
+def fingerprint(counts: Mapping[str, int]) -> bytes:
+    """
+    :param counts: the number of occurrences of every distinct text
+    :return: a digest of the multiset of the texts, that does not depend on
+    the order of the texts.
+    """
+    items = sorted(counts.items())
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(array("q", [len(text) for text, _ in items]).tobytes())
+    digest.update(array("q", [count for _, count in items]).tobytes())
+    digest.update("".join(text for text, _ in items).encode(
+        "utf-8", "surrogatepass"))
+    return digest.digest()
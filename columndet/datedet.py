@@ -19,14 +19,20 @@
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import collections
+import functools
 from enum import Enum
 from typing import (List, Optional, Mapping, Collection, Iterable,
-                    Set)
+                    Set, AbstractSet, Sequence, Tuple, Union)
 
 from mcsv.meta_csv_data import (FieldDescription, DateDescription,
                                 DatetimeDescription)
 # Types
-from columndet.i18n import NAMES_BY_DATECODE_BY_LOCALE
+from columndet.cache import ShapeCache
+from columndet.i18n import (get_names_by_datecode_by_locale, LocaleSelection,
+                            SELECTION_CACHE_SIZE)
+from columndet.i18n_index import MmapIndex, get_sections, names_entries
+from columndet.index import InvertedIndex
+from columndet.npcolumn import digit_slot_bounds
 from columndet.util import (ColumnInfos, OpCode, get_unique,
                             TokenRow)
 
@@ -54,17 +60,29 @@ class DateSniffer:
 
     def __init__(self, ymd_col_type_sniffer: "YMDColumnTypeSniffer",
                  hms_col_type_sniffer: "HMSColumnTypeSniffer",
-                 token_rows: List[TokenRow], threshold: float):
+                 token_rows: List[TokenRow], threshold: float,
+                 tokens_cols: Optional[List[ColumnInfos]] = None):
+        """
+        :param token_rows: the rows, all of the same size
+        :param threshold: the threshold
+        :param tokens_cols: the infos of every position of the rows, if
+                            already computed
+        """
         self._seen_datecodes = set()
         self._ymd_col_type_sniffer = ymd_col_type_sniffer
         self._hms_col_type_sniffer = hms_col_type_sniffer
         self._token_rows = token_rows
+        self._tokens_cols = tokens_cols
         self._threshold = threshold
         self._date_field_factory = DateFieldDescriptionFactory()
 
     def sniff(self) -> FieldDescription:
-        tokens_cols = [ColumnInfos.create(ts, None, self._threshold) for ts
-                       in zip(*self._token_rows)]
+        tokens_cols = self._tokens_cols
+        if tokens_cols is None:
+            weights = [tr.weight for tr in self._token_rows]
+            tokens_cols = [
+                ColumnInfos.create(ts, None, self._threshold, weights)
+                for ts in zip(*self._token_rows)]
         ret_date_parts = []
         for tokens_col in tokens_cols:
             try:
@@ -141,7 +159,8 @@ class DateSniffer:
 
     def _find_HMS(self, tokens_col: ColumnInfos) -> DatePart:
         try:
-            date_part = self._hms_col_type_sniffer.find_hms(tokens_col)
+            date_part = self._hms_col_type_sniffer.find_hms(
+                tokens_col, self._seen_datecodes)
         except ValueError:
             try:
                 t = tokens_col.unique_token
@@ -157,19 +176,74 @@ class DateSniffer:
                 for p in date_parts]
 
 
+@functools.lru_cache(maxsize=SELECTION_CACHE_SIZE)
+def get_names_index(locale_selection: Optional[LocaleSelection] = None
+                    ) -> Union[InvertedIndex[Tuple[str, str]], MmapIndex]:
+    """
+    :param locale_selection: the candidate locales, None for every locale
+    :return: the index of the localized day and month names: the compiled
+    index if it was built (see `columndet.i18n_index`), else an index built
+    from the tables. With a selection, an index of the selected locales. The
+    indexes of the last `SELECTION_CACHE_SIZE` selections are kept.
+    """
+    if locale_selection is not None:
+        return _create_names_index(
+            locale_selection.select(get_names_by_datecode_by_locale()))
+    index = get_sections().get("names")
+    if index is None:
+        index = _create_names_index(get_names_by_datecode_by_locale())
+    return index
+
+
+def _create_names_index(names_by_datecode_by_locale: Mapping[
+    str, Mapping[str, Collection[str]]]) -> InvertedIndex[Tuple[str, str]]:
+    return InvertedIndex.create(names_entries(names_by_datecode_by_locale))
+
+
 class YMDColumnTypeSniffer:
     """
     A column sniffer. Takes a l
     """
 
     @staticmethod
-    def create(threshold: float):
-        return YMDColumnTypeSniffer(threshold, NAMES_BY_DATECODE_BY_LOCALE)
-
-    def __init__(self, threshold: float, names_by_datecode_by_locale: Mapping[
-        DateCode, Mapping[str, Mapping]]):
+    def create(threshold: float, shape_cache: Optional[ShapeCache] = None,
+               locale_selection: Optional[LocaleSelection] = None):
+        """
+        :param threshold: the threshold
+        :param shape_cache: the cache of the decisions
+        :param locale_selection: the candidate locales of the names, None
+                                 for every locale
+        :return: the sniffer
+        """
+        return YMDColumnTypeSniffer(threshold, None, shape_cache, None,
+                                    locale_selection)
+
+    def __init__(self, threshold: float,
+                 names_by_datecode_by_locale: Optional[Mapping[
+                     str, Mapping[str, Collection[str]]]] = None,
+                 shape_cache: Optional[ShapeCache] = None,
+                 names_index: Optional[Union[
+                     InvertedIndex[Tuple[str, str]], MmapIndex]] = None,
+                 locale_selection: Optional[LocaleSelection] = None):
+        """
+        :param names_by_datecode_by_locale: the day and month names, None for
+                                            the names of `columndet.i18n`
+                                            (loaded on first use)
+        :param names_index: the index of `names_by_datecode_by_locale`,
+                            built on first use if None
+        :param locale_selection: the candidate locales of the default names
+        """
         self._threshold = threshold
         self._names_by_datecode_by_locale = names_by_datecode_by_locale
+        self._shape_cache = shape_cache
+        self._names_index = names_index
+        self._locale_selection = locale_selection
+        if names_by_datecode_by_locale is None and names_index is None:
+            self._names_key = None  # the names of `columndet.i18n`
+        else:
+            # the names are not hashable: the decisions made with them are
+            # not shared with another sniffer
+            self._names_key = object()
 
     def find_day_month_part(self, tokens_col: ColumnInfos) -> DatePart:
         """
@@ -183,12 +257,29 @@ class YMDColumnTypeSniffer:
             raise ValueError()
 
         values = tokens_col.texts
-        for locale, names_by_datecode in self._names_by_datecode_by_locale.items():
-            for code, names in names_by_datecode.items():
-                if values <= names:
-                    datecode = self._get_datecode(code)
-                    return DatePart(datecode, code, locale)
-        raise ValueError
+        if self._shape_cache is None:
+            date_part = self._find_names(values)
+        else:
+            date_part = self._shape_cache.get_or_compute(
+                ("day_month", self._names_key, self._locale_selection,
+                 frozenset(values)),
+                lambda: self._find_names(values))
+        if date_part is None:
+            raise ValueError
+        return date_part
+
+    def _find_names(self, values: Set[str]) -> Optional[DatePart]:
+        if self._names_index is None:
+            if self._names_by_datecode_by_locale is None:
+                self._names_index = get_names_index(self._locale_selection)
+            else:
+                self._names_index = _create_names_index(
+                    self._names_by_datecode_by_locale)
+        locale_code = self._names_index.find_first(values)
+        if locale_code is None:
+            return None
+        locale, code = locale_code
+        return DatePart(self._get_datecode(code), code, locale)
 
     def _get_datecode(self, code: str) -> DateCode:
         if code in {"mon", "month"}:
@@ -249,24 +340,35 @@ class YMDColumnTypeSniffer:
 
 
 class HMSColumnTypeSniffer:
+    """
+    A column sniffer. Stateless: the date codes already seen in the column
+    are passed by the caller, hence the sniffer may be shared by threads.
+    """
+
     @staticmethod
     def create(threshold: float):
         return HMSColumnTypeSniffer(threshold)
 
     def __init__(self, threshold: float):
         self._threshold = threshold
-        self._seen_datecodes = set()
 
-    def find_hms(self, tokens_col: ColumnInfos) -> DatePart:
+    def find_hms(self, tokens_col: ColumnInfos,
+                 seen_datecodes: AbstractSet[DateCode]) -> DatePart:
+        """
+        :param tokens_col: the tokens
+        :param seen_datecodes: the date codes already found in the column
+        :return: the hours, minutes, seconds or milliseconds part
+        :raise ValueError: if the column is not a part of a time.
+        """
         assert tokens_col.unique_opcode == OpCode.NUMBER
         values = list(map(int, tokens_col.texts))
         min_v, max_v = min(values), max(values)
         if min_v < 0:
             raise ValueError()
         t = None
-        if DateCode.HOURS in self._seen_datecodes:
-            if DateCode.MINUTES in self._seen_datecodes:
-                if DateCode.SECONDS in self._seen_datecodes:
+        if DateCode.HOURS in seen_datecodes:
+            if DateCode.MINUTES in seen_datecodes:
+                if DateCode.SECONDS in seen_datecodes:
                     for i in range(1, 10):
                         if max_v < 10 ** i:
                             t = DatePart(DateCode.MILLISECONDS, 'S' * i, None)
@@ -281,7 +383,6 @@ class HMSColumnTypeSniffer:
         if t is None:
             raise ValueError("Time")
         else:
-            self._seen_datecodes.add(t.datecode)
             return t
 
 
@@ -327,6 +428,8 @@ RANGES_BY_FORMAT = {
     "MMddyy": [M_RANGE, D_RANGE, Y2_RANGE],
 }
 
+HMS_RANGES = [range(0, 24), range(0, 60), range(0, 60)]
+
 FORMAT8_BY_PATTERN = {
     "YMD": "yyyyMMdd",
     "DMY": "ddMMyyyy",
@@ -365,20 +468,14 @@ class YMDBlockSniffer:
             raise ValueError(f"Expected at least 6 digits, got {size}")
 
     def _sniff(self, formats: str) -> str:
-        ds = self._column.texts
-        twos = [[d[i:i + 2] for i in range(0, len(d), 2)] for d in ds]
-        two_cols = [set(vs) for vs in zip(*twos)]
-
+        bounds = _slot_bounds(self._column.texts)
         for date_format in formats:
             ranges = RANGES_BY_FORMAT[date_format]
-            if self._match(ranges, two_cols):
+            if _in_ranges(ranges, bounds):
                 return date_format
 
         raise ValueError()
 
-    def _match(self, ranges: List[range], value_sets: List[Set[str]]) -> bool:
-        return all(int(v) in r for r, vs in zip(ranges, value_sets) for v in vs)
-
     # def _sniff6(self) -> List[DatePart]:
     #     ds = self._column.texts
     #     twos = [[d[i:i + 2] for i in range(0, len(d), 2)] for d in ds]
@@ -422,13 +519,32 @@ class HMSBlockSniffer:
             raise ValueError("Expected at least 6 digits")
 
     def _sniff6(self) -> str:
-        ds = self._column.texts
-        hours, minutes, seconds = zip(
-            *[[int(d[i:i + 2]) for i in range(0, len(d), 2)
-               ] for d in ds])
-        if (0 <= min(hours) and max(hours) < 24 and
-                0 <= min(minutes) and max(minutes) < 60 and
-                0 <= min(seconds) and max(seconds) < 60):
+        bounds = _slot_bounds(self._column.texts)
+        if len(bounds) != 3:
+            raise ValueError("Expected hours, minutes and seconds")
+        if _in_ranges(HMS_RANGES, bounds):
             return "HHmmss"
         else:
             raise ValueError("Bad minutes")
+
+
+def _slot_bounds(texts: Collection[str]) -> List[Tuple[int, int]]:
+    """
+    :param texts: the distinct texts of a block of digits
+    :return: the (min, max) of every slot of two digits
+    """
+    bounds = digit_slot_bounds(texts)
+    if bounds is None:  # no NumPy, non ASCII digits or different widths
+        slots = zip(*[[d[i:i + 2] for i in range(0, len(d), 2)]
+                      for d in texts])
+        bounds = []
+        for values in slots:
+            ints = [int(v) for v in set(values)]
+            bounds.append((min(ints), max(ints)))
+    return bounds
+
+
+def _in_ranges(ranges: Sequence[range],
+               bounds: Sequence[Tuple[int, int]]) -> bool:
+    return all(r.start <= low and high < r.stop
+               for r, (low, high) in zip(ranges, bounds))
@@ -0,0 +1,96 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import codecs
+import collections
+import re
+
+from chardet import UniversalDetector
+
+# the UTF-32 BOMs first: the UTF-32-LE BOM starts with the UTF-16-LE BOM
+BOMS = [(codecs.BOM_UTF32_LE, "UTF-32"), (codecs.BOM_UTF32_BE, "UTF-32"),
+        (codecs.BOM_UTF8, "UTF-8-SIG"), (codecs.BOM_UTF16_LE, "UTF-16"),
+        (codecs.BOM_UTF16_BE, "UTF-16")]
+
+NON_ASCII = re.compile(b"[\x80-\xff]")
+
+FALLBACK_ENCODING = "latin-1"
+
+
+class DetectedEncoding(collections.namedtuple(
+        "DetectedEncoding", ["encoding", "tier"])):
+    """
+    An encoding and the tier that decided: "bom", "ascii", "utf-8" or
+    "chardet".
+    """
+
+
+def detect_encoding(data: bytes, sample_size: int = 64 * 1024,
+                    block_size: int = 4096) -> DetectedEncoding:
+    """
+    Detect the encoding of the first chunk of a file, cheapest tier first:
+    a BOM, pure ASCII, strict UTF-8 and then chardet. The chardet detector is
+    fed by blocks and stops as soon as it is confident, after at most
+    `sample_size` bytes. Since ASCII bytes carry no information, the sample
+    starts at the line of the first non ASCII byte.
+
+    :param data: the first chunk, that may end in the middle of a character
+    :param sample_size: the maximum number of bytes fed to chardet
+    :param block_size: the size of the blocks fed to chardet
+    :return: the encoding and the tier. The names found by chardet are
+    normalized (see `codecs.lookup`).
+    """
+    for bom, encoding in BOMS:
+        if data.startswith(bom):
+            return DetectedEncoding(encoding, "bom")
+
+    match = NON_ASCII.search(data)
+    if match is None:
+        # the rest of the file may not be ASCII: UTF-8 is a superset
+        return DetectedEncoding("utf-8", "ascii")
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(data, final=False)
+    except UnicodeDecodeError:
+        pass
+    else:
+        return DetectedEncoding("utf-8", "utf-8")
+
+    start = data.rfind(b"\n", 0, match.start()) + 1
+    detector = UniversalDetector()
+    for i in range(start, min(len(data), start + sample_size), block_size):
+        detector.feed(data[i:min(i + block_size, start + sample_size)])
+        if detector.done:
+            break
+    encoding = detector.close()["encoding"]
+    if encoding is None:
+        encoding = FALLBACK_ENCODING
+    return DetectedEncoding(_normalize(encoding), "chardet")
+
+
+def _normalize(encoding: str) -> str:
+    """
+    :param encoding: an encoding name, e.g. "Windows-1251"
+    :return: the Python name of the encoding (e.g. "cp1251"): does not
+    depend on the capitalization of the chardet versions.
+    """
+    try:
+        return codecs.lookup(encoding).name
+    except LookupError:
+        return encoding
@@ -18,19 +18,22 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import collections
-from typing import List
+from typing import List, Optional, Tuple
 
 from columndet import OpCode
 from mcsv.meta_csv_data import (FieldDescription, FloatDescription,
                                 IntegerDescription)
+from columndet.cache import ShapeCache
 from columndet.i18n import NUMBER_SEPARATORS
 from columndet.util import (get_unique, get_some, TokenRow)
 
 
 class FloatParser:
     def __init__(self, token_rows: List[TokenRow], threshold: float,
-                 prefer_dot_as_decimal_separator: bool = True):
+                 prefer_dot_as_decimal_separator: bool = True,
+                 shape_cache: Optional[ShapeCache] = None):
         self._token_rows = token_rows
+        self._shape_cache = shape_cache
         self._threshold = threshold
         self._prefer_dot_as_decimal_separator = prefer_dot_as_decimal_separator
         self._errors = 0
@@ -38,13 +41,15 @@ class FloatParser:
         self._other_sep = collections.Counter()
 
     def sniff(self) -> FieldDescription:
+        total = 0
         for row in self._token_rows:
+            total += row.weight
             if len(row) <= 1:
                 continue
             self._sniff_row(row)
-        if 1 - self._errors / len(self._token_rows) < self._threshold:
+        if 1 - self._errors / total < self._threshold:
             raise ValueError(
-                f"Errors: {self._errors} out of {len(self._token_rows)}")
+                f"Errors: {self._errors} out of {total}")
 
         try:
             thousands_sep = get_unique(self._other_sep, self._threshold)
@@ -68,38 +73,59 @@ class FloatParser:
         return FloatDescription(thousands_sep, dec_sep)
 
     def _sniff_row(self, row: TokenRow):
+        if self._shape_cache is None:
+            last_sep, other_seps, errors = self._analyze_row(row)
+        else:
+            last_sep, other_seps, errors = self._shape_cache.get_or_compute(
+                ("float", row.shape()), lambda: self._analyze_row(row))
+
+        if last_sep is not None:
+            self._last_sep[last_sep] += row.weight  # store the value
+        for sep in other_seps:
+            self._other_sep[sep] += row.weight
+        self._errors += errors * row.weight
+
+    def _analyze_row(self, row: TokenRow
+                     ) -> Tuple[Optional[str], Tuple[str, ...], int]:
+        """
+        The result only depends on the shape of the row.
+
+        :param row: the row
+        :return: the last separator, the other separators and the number
+        of errors.
+        """
         if row.first_text == "-":
             row.shift()
-        row = self._store_last_sep(row)
-        self._store_other_sep(row)
+        last_sep, errors = self._find_last_sep(row)
+        other_seps, other_errors = self._find_other_seps(row)
+        return last_sep, other_seps, errors + other_errors
 
-    def _store_last_sep(self, row: TokenRow) -> TokenRow:
+    def _find_last_sep(self, row: TokenRow) -> Tuple[Optional[str], int]:
         # strip the last number
         assert len(row) >= 2
         if row.last_opcode == OpCode.NUMBER:
             row.pop()  # remove number
         assert row
         if row.last_text in NUMBER_SEPARATORS:
-            self._last_sep[row.last_text] += 1  # store the value
+            last_sep = row.last_text
             row.pop()  # remove value
+            return last_sep, 0
         else:
-            self._errors += 1
-
-        return row
+            return None, 1
 
-    def _store_other_sep(self, row: TokenRow):
+    def _find_other_seps(self, row: TokenRow) -> Tuple[Tuple[str, ...], int]:
+        other_seps = []
         while row:
             # check for the size of numbers (groups of 3)
             if row.last_opcode != OpCode.NUMBER:
-                self._errors += 1
-                return
+                return tuple(other_seps), 1
             elif len(row) > 1 and len(row.last_text) != 3:
-                self._errors += 1
-                return
+                return tuple(other_seps), 1
             elif len(row) <= 1:
-                return
+                return tuple(other_seps), 0
             row.pop()  # remove number
 
             if row.last_text in NUMBER_SEPARATORS:
-                self._other_sep[row.last_text] += 1
+                other_seps.append(row.last_text)
             row.pop()  # remove value
+        return tuple(other_seps), 0
@@ -0,0 +1,2277 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+The large locale tables, loaded by `columndet.i18n` on first access. Use
+the accessors of `columndet.i18n` rather than this module.
+"""
+# Data is retrieved from LibreOffice:
+# https://github.com/LibreOffice/core/tree/master/i18npool/source/localedata/data
+
+TRUE_FALSE_BY_LOCALE_NAME = {
+    'af_ZA': ('waar', 'vals'),
+    'ak_GH': ('yiw', 'daabi'),
+    'am_ET': ('አውነት', 'ሔሰት'),
+    'an_ES': ('verdadero', 'falso'),
+    'ar_EG': ('صح', 'خطأ'),
+    'ar_OM': ('صحيح', 'خاطئ'),
+    'ast_ES': ('braero', 'falso'),
+    'axk_CG': ('vrai', 'faux'),
+    'az_AZ': ('düz', 'yanlış'),
+    'be_BY': ('сапраўдна', 'несапраўдна'),
+    'beq_CG': ('vrai', 'faux'),
+    'bg_BG': ('вярно', 'невярно'),
+    'bkw_CG': ('vrai', 'faux'),
+    'bm_ML': ('tiɲɛ', 'nkalon'),
+    'bn_BD': ('সত্য', 'মিথ্যা'),
+    'bn_IN': ('সত্য', 'মিথ্যা'),
+    'bo_CN': ('ཨིན་', 'མེན་'),
+    'bo_IN': ('ཨིན་', 'མེན་'),
+    'br_FR': ('gwir', 'fals'),
+    'bs_BA': ('tacno', 'netacno'),
+    'bvx_CG': ('vrai', 'faux'),
+    'ca_ES': ('veritat', 'fals'),
+    'cs_CZ': ('pravda', 'nepravda'),
+    'cu_RU': ('вѣ́рнѡ', 'ло́жнѡ'),
+    'cv_RU': ('тĕрĕс', 'суя'),
+    'da_DK': ('sand', 'falsk'),
+    'dde_CG': ('vrai', 'faux'),
+    'de_DE': ('wahr', 'falsch'),
+    'dsb_DE': ('wěrno', 'njewěrno'),
+    'dz_BT': ('ཨིན་', 'མེན་'),
+    'ebo_CG': ('ngaŋwa', 'mpya'),
+    'ee_GH': ('ɛ', 'ao'),
+    'el_GR': ('σωστό', 'λάθοσ'),
+    'en_GH': ('true', 'false'),
+    'en_US': ('true', 'false'),
+    'eo': ('vera', 'falsa'),
+    'es_ES': ('verdadero', 'falso'),
+    'et_EE': ('tõene', 'väär'),
+    'eu_ES': ('egiazkoa', 'faltsua'),
+    'fa_IR': ('درست', 'نادرست'),
+    'fi_FI': ('tosi', 'epätosi'),
+    'fo_FO': ('sonn', 'ósonn'),
+    'fr_BF': ('vrai', 'faux'),
+    'fr_FR': ('vrai', 'faux'),
+    'fur_IT': ('vêr', 'fals'),
+    'fy_NL': ('wier', 'net wier'),
+    'ga_IE': ('fíor', 'falsa'),
+    'gd_GB': ('fìor', 'breug'),
+    'gl_ES': ('verdadeiro', 'falso'),
+    'gsc_FR': ('exacte', 'faus'),
+    'gu_IN': ('ખરું', 'ખોટું'),
+    'gug_PY': ("te'ete", "gua'u"),
+    'ha_Latn_GH': ('gaskiya', 'karya'),
+    'haw_US': ('ʻoiaʻiʻo', 'hewa'),
+    'he_IL': ('true', 'false'),
+    'hi_IN': ('सही', 'गलत'),
+    'hil_PH': ('tuod', 'palso'),
+    'hr_HR': ('točno', 'netočno'),
+    'hsb_DE': ('prawje', 'wopak'),
+    'ht_HT': ('vre', 'fo'),
+    'hu_HU': ('igaz', 'hamis'),
+    'hy_AM': ('ճշմարիտ', 'կեղծ'),
+    'ia': ('ver', 'false'),
+    'id_ID': ('benar', 'salah'),
+    'ilo_PH': ('pudno', 'ubbaw'),
+    'is_IS': ('rétt', 'rangt'),
+    'it_IT': ('vero', 'falso'),
+    'iyx_CG': ('vrai', 'faux'),
+    'ja_JP': ('true', 'false'),
+    'jbo': ('jetnu', 'jitfa'),
+    'ka_GE': ('ჭეშმარიტი', 'მცდარი'),
+    'kab_DZ': ('ih', 'ala'),
+    'kk_KZ': ('ақиқат', 'жалған'),
+    'kkw_CG': ('vrai', 'faux'),
+    'kl_GL': ('eqqortoq', 'eqqunngitsoq'),
+    'km_KH': ('ត្រូវ', 'ខុស'),
+    'kmr_Latn_TR': ('rast', 'şaş'),
+    'kn_IN': ('ಸಹೀ', 'ಗಲತ್'),
+    'kng_CG': ('vrai', 'faux'),
+    'ko_KR': ('참', '거짓'),
+    'ky_KG': ('чындык', 'жалган'),
+    'la_VA': ('verum', 'falsum'),
+    'lb_LU': ('wouer', 'falsch'),
+    'ldi_CG': ('vrai', 'faux'),
+    'lg_UG': ('kituufu', 'ssi kituufu'),
+    'lgr_SB': ('uthui', 'teigha'),
+    'lif_NP': ('ठीक', 'बेठीक'),
+    'lij_IT': ('veo', 'fäso'),
+    'lld_IT': ('veira', 'fauz'),
+    'ln_CD': ('mpenzá', 'mpenzá tɛ́'),
+    'lo_LA': ('ແມ່ນແລ້ວ', 'ບໍ່ແມ່ນ'),
+    'lt_LT': ('teisingai', 'neteisingai'),
+    'ltg_LV': ('patīss', 'oploms'),
+    'lv_LV': ('patiess', 'aplams'),
+    'mai_IN': ('सही', 'गलत'),
+    'mdw_CG': ('vrai', 'faux'),
+    'min_ID': ('bana', 'salah'),
+    'mk_MK': ('точно', 'неточно'),
+    'mkw_CG': ('vrai', 'faux'),
+    'ml_IN': ('അതെ', 'അല്ല'),
+    'mn_Cyrl_MN': ('үнэн', 'худал'),
+    'mos_BF': ('sɩda', 'zĩri'),
+    'ms_MY': ('true', 'false'),
+    'mt_MT': ('veru', 'falz'),
+    'my_MM': ('မှန်', 'မှား'),
+    'myv_RU': ('виде', 'авиде'),
+    'nds_DE': ('waor', 'falsk'),
+    'ne_NP': ('ठीक', 'बेठीक'),
+    'ngz_CG': ('vrai', 'faux'),
+    'njx_CG': ('vrai', 'faux'),
+    'njy_CG': ('vrai', 'faux'),
+    'nl_NL': ('waar', 'onwaar'),
+    'no_NO': ('sann', 'usann'),
+    'nr_ZA': ('qiniso', 'mamala'),
+    'ny_MW': ('choona', 'chabodza'),
+    'oc_FR': ('verai', 'fals'),
+    'om_ET': ('dhugaa', 'soba'),
+    'or_IN': ('ସତ', 'ମିଛ'),
+    'pa_IN': ('ਸਹੀ', 'ਗਲਤ'),
+    'pap_CW': ('berdat', 'no berdat'),
+    'pjt_AU': ('tjukaṟuru', 'ngunti'),
+    'pl_PL': ('prawda', 'fałsz'),
+    'plt_MG': ('marina', 'diso'),
+    'pt_AO': ('verdadeiro', 'falso'),
+    'pt_PT': ('verdadeiro', 'falso'),
+    'pui_CO': ('ȓ', 'üi'),
+    'puu_CG': ('vrai', 'faux'),
+    'ro_RO': ('adevărat', 'fals'),
+    'ru_RU': ('истина', 'ложь'),
+    'rue_SK': ('правда', 'неправда'),
+    'rw_RW': ('nibyo', 'sibyo'),
+    'sc_IT': ('beru', 'farsu'),
+    'sdj_CG': ('vrai', 'faux'),
+    'sg_CF': ('taâ-tënë', 'wätäkä'),
+    'shs_CA': ('true', 'false'),
+    'sid_ET': ('halale', 'xara'),
+    'sk_SK': ('pravda', 'nepravda'),
+    'sl_SI': ('true', 'false'),
+    'so_SO': ('run', 'been'),
+    'sr_Latn_RS': ('tačno', 'netačno'),
+    'sr_RS': ('тачно', 'нетачно'),
+    'sv_SE': ('sant', 'falskt'),
+    'sw_TZ': ('kweli', 'sikweli'),
+    'szl_PL': ('prowda', 'fałsz'),
+    'ta_IN': ('ஸரி', 'தப்ப'),
+    'te_IN': ('నిజము', 'అపాదము'),
+    'tek_CG': ('vrai', 'faux'),
+    'tg_TJ': ('ҳаққонӣ', 'қалбакӣ'),
+    'th_TH': ('จริง', 'เท็จ'),
+    'ti_ER': ('ሓቂ', 'ሓሶት'),
+    'ti_ET': ('ሓቂ', 'ሓሶት'),
+    'tk_TM': ('dogry', 'ýalňyş'),
+    'tpi_PG': ('tru', 'giaman'),
+    'tr_TR': ('doğru', 'yanlış'),
+    'ts_ZA': ('ntiyiso', 'vunwa'),
+    'tsa_CG': ('vrai', 'faux'),
+    'tt_RU': ('чын', 'ялган'),
+    'tyx_CG': ('vrai', 'faux'),
+    'ug_CN': ('راست', 'يالغان'),
+    'uk_UA': ('істина', 'брехня'),
+    'ur_PK': ('راست', 'غلط'),
+    'uz_UZ': ('haqiqiy', 'soxta'),
+    've_ZA': ('ngoho', 'a si ngoho'),
+    'vec_IT': ('vero', 'falso'),
+    'vi_VN': ('đúng', 'sai'),
+    'vif_CG': ('vrai', 'faux'),
+    'wa_BE': ('vraiy', 'fås'),
+    'xh_ZA': ('yinyaniso', 'asiyonyaniso'),
+    'xku_CG': ('vrai', 'faux'),
+    'yi_US': ('אמת', 'פֿאַלש'),
+    'yom_CG': ('vrai', 'faux'),
+    'zh_CN': ('true', 'false'),
+    'zh_TW': ('真', '假'),
+}
+
+NAMES_BY_DATECODE_BY_LOCALE = {
+    'sr_Latn_CS': {
+    },
+    'ro_RO': {
+        'day': {'joi', 'miercuri', 'duminică', 'sâmbătă', 'marţi', 'luni',
+                'vineri'},
+        'dy': {'mi', 's', 'l', 'j', 'v', 'ma', 'd'},
+        'month': {'ianuarie', 'februarie', 'martie', 'aprilie', 'mai', 'iunie',
+                  'iulie', 'august', 'septembrie', 'octombrie', 'noiembrie',
+                  'decembrie'},
+        'mon': {'ian', 'febr', 'mar', 'apr', 'mai', 'iun', 'iul', 'aug', 'sept',
+                'oct', 'nov', 'dec'},
+    },
+    'fr_MC': {
+    },
+    'fa_IR': {
+        'day': {'دوشنبه', 'چهارشنبه', 'جمعه', 'شنبه', 'پنجشنبه', 'یکشنبه',
+                'سه\u200cشنبه'},
+        'dy': {'دوشنبه', 'چهارشنبه', 'جمعه', 'شنبه', 'پنجشنبه', 'یکشنبه',
+               'سه\u200cشنبه'},
+        'month': {'فروردین', 'اردیبهشت', 'خرداد', 'تیر', 'مرداد', 'شهریور',
+                  'مهر', 'آبان', 'آذر', 'دی', 'بهمن', 'اسفند', 'ژانویه',
+                  'فوریه', 'مارس', 'آوریل', 'مه', 'ژوئن', 'ژوئیه', 'اوت',
+                  'سپتامبر', 'اکتبر', 'نوامبر', 'دسامبر', 'محرم', 'صفر',
+                  'ربیع الاول', 'ربیع الثانی', 'جمادی الاول', 'جمادی الثانی',
+                  'رجب', 'شعبان', 'رمضان', 'شوال', 'ذیقعده', 'ذیحجه'},
+        'mon': {'فروردین', 'اردیبهشت', 'خرداد', 'تیر', 'مرداد', 'شهریور', 'مهر',
+                'آبان', 'آذر', 'دی', 'بهمن', 'اسفند', 'ژانویه', 'فوریه', 'مارس',
+                'آوریل', 'مه', 'ژوئن', 'ژوئیه', 'اوت', 'سپتامبر', 'اکتبر',
+                'نوامبر', 'دسامبر', 'محرم', 'صفر', 'ربیع الاول', 'ربیع الثانی',
+                'جمادی الاول', 'جمادی الثانی', 'رجب', 'شعبان', 'رمضان', 'شوال',
+                'ذیقعده', 'ذیحجه'},
+    },
+    'es_DO': {
+    },
+    'en_US': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday', 'shabbat'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december', 'nissan', 'iyar', 'sivan', 'tammuz', 'av', 'elul',
+                  'tishri', 'heshvan', 'kislev', 'tevet', 'shevat', 'adar',
+                  'adar b'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec', 'nissan', 'iyar', 'sivan', 'tammuz', 'av',
+                'elul', 'tishri', 'heshvan', 'kislev', 'tevet', 'shevat',
+                'adar', 'adar b'},
+    },
+    'so_SO': {
+        'day': {'isniin', 'talaado', 'sabti', 'axad', 'khamiis', 'arboco',
+                'jimco'},
+        'dy': {'isn', 'jim', 'kha', 'tal', 'axa', 'sab', 'arb'},
+        'month': {'janaayo', 'febraayo', 'marso', 'abriil', 'majo', 'junyo',
+                  'julaayo', 'agoosto', 'sebtembar ', 'oktoobar', 'nofeembar',
+                  'disembar'},
+        'mon': {'jan', 'feb', 'mar', 'abr', 'maj', 'jun', 'jul', 'ago', 'seb',
+                'okt', 'nof', 'dis'},
+    },
+    'es_PR': {
+    },
+    'en_GH': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'hil_PH': {
+        'day': {'biernes', 'lunes', 'martes', 'domingo', 'mierkules', 'huebes',
+                'sabado'},
+        'dy': {'mie', 'hue', 'bie', 'lun', 'dom', 'sab', 'mar'},
+        'month': {'enero', 'pebrero', 'marso', 'abril', 'mayo', 'hunyo',
+                  'hulyo', 'agosto', 'septiembre', 'oktobre', 'nobiembre',
+                  'deciembre'},
+        'mon': {'ene', 'peb', 'mar', 'abr', 'may', 'hun', 'hul', 'ago', 'sep',
+                'okt', 'nob', 'dec'},
+    },
+    'en_GM': {
+    },
+    'bg_BG': {
+        'day': {'неделя', 'вторник', 'петък', 'четвъртък', 'сряда',
+                'понеделник', 'събота'},
+        'dy': {'вт', 'сб', 'пн', 'нд', 'пт', 'чт', 'ср'},
+        'month': {'януари', 'февруари', 'март', 'април', 'май', 'юни', 'юли',
+                  'август', 'септември', 'октомври', 'ноември', 'декември'},
+        'mon': {'яну', 'фев', 'мар', 'апр', 'май', 'юни', 'юли', 'авг', 'сеп',
+                'окт', 'ное', 'дек'},
+    },
+    'ngz_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'tk_TM': {
+        'day': {'sogap gün', 'baş gün', 'hoş gün', 'dynç gün', 'anna',
+                'ruh gün', 'ýaş gün'},
+        'dy': {'sogap gün', 'baş gün', 'hoş gün', 'dynç gün', 'anna', 'ruh gün',
+               'ýaş gün'},
+        'month': {'türkmenbaşy', 'baýdak', 'nowruz', 'gurbansoltan',
+                  'magtymguly', 'oguz', 'gorkut', 'alp arslan', 'ruhnama',
+                  'garaşsyzlyk', 'sanjar', 'bitaraplyk'},
+        'mon': {'türkmenbaşy', 'baýdak', 'nowruz', 'gurbansoltan', 'magtymguly',
+                'oguz', 'gorkut', 'alp arslan', 'ruhnama', 'garaşsyzlyk',
+                'sanjar', 'bitaraplyk'},
+    },
+    'de_AT': {
+        'day': {'dienstag', 'freitag', 'mittwoch', 'montag', 'samstag',
+                'sonntag', 'donnerstag'},
+        'dy': {'mo', 'mi', 'so', 'di', 'fr', 'do', 'sa'},
+        'month': {'jänner', 'februar', 'märz', 'april', 'mai', 'juni', 'juli',
+                  'august', 'september', 'oktober', 'november', 'dezember'},
+        'mon': {'jän', 'feb', 'mär', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dez'},
+    },
+    'iyx_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'ln_CD': {
+        'day': {'mokɔlɔ ya mínei', 'eyenga', 'mokɔlɔ ya mísáto',
+                'mokɔlɔ ya míbalé', 'mokɔlɔ ya mítáno', 'mpɔ́sɔ',
+                'mokɔlɔ ya libosó'},
+        'dy': {'m2', 'eye', 'm1', 'm3', 'mps', 'm4', 'm5'},
+        'month': {'sánzá ya yambo', 'sánzá ya míbalé', 'sánzá ya mísáto',
+                  'sánzá ya mínéi', 'sánzá ya mítáno', 'sánzá ya motóbá',
+                  'sánzá ya nsambo', 'sánzá ya mwambe', 'sánzá ya libwa',
+                  'sánzá ya zómi', 'sánzá ya zómi na mɔ̌kɔ́',
+                  'sánzá ya zómi na míbalé'},
+        'mon': {'s1', 's2', 's3', 's4', 's5', 's6', 's7', 's8', 's9', 's10',
+                's11', 's12'},
+    },
+    'ar_YE': {
+    },
+    'sc_IT': {
+        'day': {'lunis', 'chenàbura', 'giòvia', 'domìniga', 'mèrcuris',
+                'martis', 'sàbadu'},
+        'dy': {'che', 'gio', 'lun', 'dom', 'mer', 'sab', 'mar'},
+        'month': {'ghennàrgiu', 'freàrgiu', 'martzu', 'abrile', 'maju',
+                  'làmpadas', 'trìulas', 'austu', 'cabudanni', 'santugaine',
+                  'santandria', 'nadale'},
+        'mon': {'ghe', 'fre', 'mar', 'abr', 'maj', 'làm', 'trì', 'aus', 'cab',
+                'sga', 'san', 'nad'},
+    },
+    'de_CH': {
+    },
+    'en_NZ': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'en_ZA': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'ta_IN': {
+        'day': {'வியாழன்', 'சனி', 'ெசவ்வாய்', 'ஞாயி\\0bb1உ', 'திங்கள்',
+                'ெவள்ளி', 'புதன்'},
+        'dy': {'வியாழன்', 'சனி', 'ெசவ்வாய்', 'ஞாயி\\0bb1உ', 'திங்கள்', 'புதன்',
+               'ெவள்ளி.'},
+        'month': {'ஜநவரி', 'பெவரி', 'மாரஸீ', 'ஏப்ரல்', 'மଇ', 'ஜூந்', 'ஜுல்ೈ',
+                  'ஆகஸ்ட', 'ஸெப்டஂபர்', 'அக்டபர்', 'நவெஂபர்', 'டிஸெஂबºaர்'},
+        'mon': {'ஜநவரி.', 'பெவரி.', 'மாரஸீ.', 'ஏப்ரல்.', 'மଇ.', 'ஜூந்.',
+                'ஜுல்ೈ.', 'ஆகஸ்ட.', 'ஸெப்டஂபர்.', 'அக்டபர்.', 'நவெஂபர்.',
+                'டிஸெஂबºaர்.'},
+    },
+    'nl_BE': {
+    },
+    'sr_CS': {
+    },
+    'hsb_DE': {
+        'day': {'srjeda', 'njedźela', 'póndźela', 'wutora', 'pjatk', 'štwórtk',
+                'sobota'},
+        'dy': {'pón', 'sob', 'nje', 'srj', 'wut', 'štw', 'pja'},
+        'month': {'januar', 'februar', 'měrc', 'apryl', 'meja', 'junij',
+                  'julij', 'awgust', 'september', 'oktober', 'nowember',
+                  'december'},
+        'mon': {'jan', 'feb', 'měr', 'apr', 'mej', 'jun', 'jul', 'awg', 'sep',
+                'okt', 'now', 'dec'},
+    },
+    'rw_RW': {
+        'day': {'kuwa kabiri', 'kuwa gatatu', 'kuwa gatanu', 'kuwa mbere',
+                'kuwa gatandatu', 'ku cyumweru', 'kuwa kane'},
+        'dy': {'gnu.', 'kan.', 'cyu.', 'mbe.', 'gtu.', 'gnd.', 'kab.'},
+        'month': {'mutarama', 'gashyantare', 'werurwe', 'mata', 'gicuransi',
+                  'kamena', 'nyakanga', 'kanama', 'nzeli', 'ukwakira',
+                  'ugushyingo', 'ukuboza'},
+        'mon': {'mut.', 'gas.', 'wer.', 'mat.', 'gic.', 'kam.', 'nya.', 'kan.',
+                'nze.', 'ukw.', 'ugu.', 'uku.'},
+    },
+    'tyx_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'gug_PY': {
+        'day': {'arapoteĩ', 'araapy', 'arakõi', 'arapo', 'ararundy', 'arapokõi',
+                'arateĩ'},
+        'dy': {'arapoteĩ', 'araapy', 'arakõi', 'arapo', 'ararundy', 'arapokõi',
+               'arateĩ'},
+        'month': {'jasyteĩ', 'jasykõi', 'jasyapy', 'jasyrundy', 'jasypo',
+                  'jasypoteĩ', 'jasypokõi', 'jasypoapy', 'jasyporundy',
+                  'jasypa', 'jasypateĩ', 'jasypakõi'},
+        'mon': {'jasyteĩ', 'jasykõi', 'jasyapy', 'jasyrundy', 'jasypo',
+                'jasypoteĩ', 'jasypokõi', 'jasypoapy', 'jasyporundy', 'jasypa',
+                'jasypateĩ', 'jasypakõi'},
+    },
+    'zh_HK': {
+    },
+    'tsa_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'pap_BQ': {
+    },
+    'ha_Latn_NG': {
+        'day': {'lahadi', 'talata', 'litinin', 'asabar', 'alhamis', "jumma'a",
+                'laraba'},
+        'dy': {'asa', 'jum', 'tal', 'alh', 'lit', 'lah', 'lar'},
+        'month': {'janairu', 'faburairu', 'maris', 'afirilu', 'mayu', 'yuni',
+                  'yuli', 'agusta', 'satumba', 'oktoba', 'nuwamba', 'disamba'},
+        'mon': {'jan', 'fab', 'mar', 'afi', 'may', 'yun', 'yul', 'agu', 'sat',
+                'okt', 'nuw', 'dis'},
+    },
+    'fr_CH': {
+    },
+    'ilo_PH': {
+        'day': {'mierkoles', 'biernes', 'lunes', 'martes', 'dominggo', 'huebes',
+                'sabado'},
+        'dy': {'hue', 'mier', 'lun', 'dom', 'bier', 'sab', 'mar'},
+        'month': {'enero', 'pebrero', 'marso', 'abril', 'mayo', 'hunio',
+                  'hulio', 'agosto', 'septiembre', 'oktubre', 'nobiembre',
+                  'disiembre'},
+        'mon': {'ene', 'peb', 'mar', 'abr', 'may', 'hun', 'hul', 'ago', 'sept',
+                'okt', 'nob', 'dis'},
+    },
+    'ar_QA': {
+    },
+    'gd_GB': {
+        'day': {'didòmhnaich', 'diciadain', 'dihaoine', 'dimàirt', 'diluain',
+                'disathairne', 'diardaoin'},
+        'dy': {'dil', 'dic', 'dim', 'dis', 'dia', 'dih', 'did'},
+        'month': {'faoilleach', 'gearran', 'màrt', 'giblean', 'cèitean',
+                  'ògmhios', 'iuchar', 'lùnastal', 'sultain', 'dàmhair',
+                  'samhain', 'dùbhlachd'},
+        'mon': {'faoi', 'gearr', 'màrt', 'gibl', 'cèit', 'ògmh', 'iuch', 'lùna',
+                'sult', 'dàmh', 'samh', 'dùbh'},
+    },
+    'mkw_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'sr_Latn_RS': {
+        'day': {'petak', 'četvrtak', 'ponedeljak', 'nedelja', 'subota', 'sreda',
+                'utorak'},
+        'dy': {'uto', 'pet', 'čet', 'sub', 'sre', 'ned', 'pon'},
+        'month': {'januar', 'februar', 'mart', 'april', 'maj', 'jun', 'jul',
+                  'avgust', 'septembar', 'oktobar', 'novembar', 'decembar'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'avg', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'ltg_LV': {
+        'day': {'catūrtdīne', 'pīktdīne', 'trešdīne', 'sastdīne', 'ūtardīne',
+                'svātdīne', 'pyrmūdīne'},
+        'dy': {'t', 'pk', 's', 'ū', 'sv', 'p', 'c'},
+        'month': {'janvars', 'pebraļs', 'marts', 'apreļs', 'majs', 'juņs',
+                  'juļs', 'augusts', 'seņtebris', 'oktebris', 'nojabris',
+                  'dekabris'},
+        'mon': {'jan', 'peb', 'mar', 'apr', 'maj', 'juņ', 'juļ', 'aug', 'seņ',
+                'okt', 'noj', 'dek'},
+    },
+    'tpi_PG': {
+        'day': {'sarere', 'mande', 'fonde', 'tunde', 'sande', 'fraide',
+                'trinde'},
+        'dy': {'fon', 'tri', 'frai', 'sar', 'san', 'tun', 'man'},
+        'month': {'janueri', 'februeri', 'mas', 'epril', 'me', 'jun', 'julai',
+                  'ogas', 'septemba', 'oktoba', 'novemba', 'desemba'},
+        'mon': {'jan', 'feb', 'mas', 'epr', 'me', 'jun', 'jul', 'og', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'jbo': {
+        'day': {'mumdei', 'pavdei', 'reldei', 'xavdei', 'vondei', 'nondei',
+                'cibdei'},
+        'dy': {'mumdei', 'pavdei', 'reldei', 'xavdei', 'vondei', 'nondei',
+               'cibdei'},
+        'month': {'pavmasti', 'relmasti', 'cibmasti', 'vonmasti', 'mumymasti',
+                  'xavmasti', 'zelmasti', 'bivmasti', 'sozmasti', 'daurmasti',
+                  'feirmasti', 'gairmasti'},
+        'mon': {"pavma'i", "relma'i", "cibma'i", "vonma'i", "mumyma'i",
+                "xavma'i", "zelma'i", "bivma'i", "sozma'i", "daurma'i",
+                "feirma'i", "gairma'i"},
+    },
+    'ar_SA': {
+        'day': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الاثنين', 'السبت',
+                'الخميس'},
+        'dy': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الاثنين', 'السبت',
+               'الخميس'},
+        'month': {'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو',
+                  'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر', 'محرم',
+                  'صفر', 'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى',
+                  'جمادى الآخرة', 'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة',
+                  'ذو الحجة'},
+        'mon': {'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو',
+                'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر', 'محرم', 'صفر',
+                'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى', 'جمادى الآخرة',
+                'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة', 'ذو الحجة'},
+    },
+    'is_IS': {
+        'day': {'miðvikudagur', 'fimmtudagur', 'föstudagur', 'mánudagur',
+                'sunnudagur', 'laugardagur', 'þriðjudagur'},
+        'dy': {'þri', 'mið', 'fim', 'sun', 'lau', 'mán', 'fös'},
+        'month': {'janúar', 'febrúar', 'mars', 'apríl', 'maí', 'júní', 'júlí',
+                  'ágúst', 'september', 'október', 'nóvember', 'desember'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maí', 'jún', 'júl', 'ágú', 'sep',
+                'okt', 'nóv', 'des'},
+    },
+    'zh_SG': {
+    },
+    'ldi_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'pa_IN': {
+        'day': {'ਬੁਧਵਾਰ', 'ਸ਼ੁੱਕਰਵਾਰ', 'ਵੀਰਵਾਰ', 'ਸ਼ਨਿਵਾਰ', 'ਐਤਵਾਰ', 'ਸੋਮਵਾਰ',
+                'ਮੰਗਲਵਾਰ'},
+        'dy': {'ਮੰਗਲ.', 'ਬੁਧ.', 'ਸ਼ਨਿ.', 'ਸੋਮ.', 'ਐਤ.', 'ਵੀਰ.', 'ਸ਼ੁਕਰ.'},
+        'month': {'ਜਨਵਰੀ', 'ਫ਼ਰਵਰੀ', 'ਮਾਰਚ', 'ਅਪ੍ਰੈਲ', 'ਮਈ', 'ਜੂਨ', 'ਜੁਲਾਈ',
+                  'ਅਗਸਤ', 'ਸਤੰਬਰ', 'ਅਕਤੂਬਰ', 'ਨਵੰਬਰ', 'ਦਸੰਬਰ'},
+        'mon': {'ਜਨਵਰੀ', 'ਫ਼ਰਵਰੀ', 'ਮਾਰਚ', 'ਅਪ੍ਰੈਲ', 'ਮਈ', 'ਜੂਨ', 'ਜੁਲਾਈ',
+                'ਅਗਸਤ', 'ਸਤੰਬਰ', 'ਅਕਤੂਬਰ', 'ਨਵੰਬਰ', 'ਦਸੰਬਰ'},
+    },
+    'be_BY': {
+        'day': {'пятніца', 'чацвер', 'нядзеля', 'аўторак', 'серада', 'субота',
+                'панядзелак'},
+        'dy': {'сб', 'пн', 'нд', 'пт', 'чц', 'ср', 'ат'},
+        'month': {'студзень', 'люты', 'сакавік', 'красавік', 'травень',
+                  'чэрвень', 'ліпень', 'жнівень', 'верасень', 'кастрычнік',
+                  'лістапад', 'снежань'},
+        'mon': {'сту', 'лют', 'сак', 'кра', 'тра', 'чэр', 'ліп', 'жні', 'вер',
+                'кас', 'ліс', 'сне'},
+    },
+    'nn_NO': {
+        'day': {'laurdag', 'onsdag', 'tysdag', 'torsdag', 'fredag', 'sundag',
+                'måndag'},
+        'dy': {'su.', 'må.', 'ty.', 'on.', 'la.', 'fr.', 'to.'},
+    },
+    'lg_UG': {
+        'day': {'lwakutaano', 'lwakubiri', 'balaza', 'sabiiti', 'lwamukaaga',
+                'lwakusatu', 'lwakuna'},
+        'dy': {'bal', 'lw5', 'lw4', 'lw6', 'lw3', 'sab', 'lw2'},
+        'month': {'janwaliyo', 'febwaliyo', 'marisi', 'apuli', 'maayi', 'juuni',
+                  'julaayi', 'agusito', 'sebuttemba', 'okitobba', 'novemba',
+                  'desemba'},
+        'mon': {'jan', 'feb', 'mar', 'apu', 'maa', 'juu', 'jul', 'agu', 'seb',
+                'oki', 'nov', 'des'},
+    },
+    'sk_SK': {
+        'day': {'nedeľa', 'piatok', 'štvrtok', 'pondelok', 'streda', 'utorok',
+                'sobota'},
+        'dy': {'so', 'ut', 'po', 'št', 'st', 'ne', 'pi'},
+        'month': {'január', 'február', 'marec', 'apríl', 'máj', 'jún', 'júl',
+                  'august', 'september', 'október', 'november', 'december'},
+        'mon': {'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+                'xi', 'xii'},
+    },
+    'es_PA': {
+    },
+    'ha_Latn_GH': {
+        'day': {'lahadi', 'littinin', 'talata', 'asabar', 'alhamis', "jumma'a",
+                'laraba'},
+        'dy': {'asa', 'jum', 'tal', 'alh', 'lit', 'lah', 'lar'},
+        'month': {'janairu', 'fabrairu', 'maris', 'afrilu', 'mayu', 'yuni',
+                  'yuli', 'agusta', 'satumba', 'oktoba', 'nuwamba', 'disamba'},
+        'mon': {'jan', 'fab', 'mar', 'afr', 'may', 'yun', 'yul', 'agu', 'sat',
+                'okt', 'nuw', 'dis'},
+    },
+    'km_KH': {
+        'day': {'ថ្ងៃអង្គារ', 'ថ្ងៃព្រហស្បត៍', 'ថ្ងៃសុក្រ', 'ថ្ងៃអាទិត្យ',
+                'ថ្ងៃច័ន្ទ', 'ថ្ងៃសៅរ៍', 'ថ្ងៃពុធ'},
+        'dy': {'ច', 'ស', 'សុ', 'អា', 'ព្រ', 'អ', 'ពុ'},
+        'month': {'មករា', 'កុម្ភៈ', 'មិនា', 'មេសា', 'ឧសភា', 'មិថុនា', 'កក្កដា',
+                  'សីហា', 'កញ្ញា', 'តុលា', 'វិច្ឆិកា', 'ធ្នូ'},
+        'mon': {'១', '២', '៣', '៤', '៥', '៦', '៧', '៨', '៩', '១០', '១១', '១២'},
+    },
+    'sdj_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'sid_ET': {
+        'day': {'roobe', 'sambata', 'arbe', 'qidaame', 'maakisanyno', 'hamuse',
+                'sanyo'},
+        'dy': {'sany', 'ham', 'qid', 'rob', 'mak', 'sam', 'arb'},
+        'month': {'arfaasa', 'ammajje', 'badheessa', 'dottessa', 'onkoleessa',
+                  'ella', 'maaja', 'woxawaajje', 'wocawaaro', 'birra',
+                  'bocaasa', 'sadaasa'},
+        'mon': {'arf', 'ama', 'badh', 'dot', 'onk', 'ell', 'maa', 'wox', 'woc',
+                'bir', 'boc', 'sad'},
+    },
+    'ja_JP': {
+        'day': {'水曜日', '日曜日', '月曜日', '火曜日', '土曜日', '木曜日', '金曜日'},
+        'dy': {'木', '金', '土', '日', '水', '火', '月'},
+        'month': {'一月', '二月', '三月', '四月', '五月', '六月', '七月', '八月', '九月', '十月',
+                  '十一月', '十二月', '一月', '二月', '三月', '四月', '五月', '六月', '七月', '八月',
+                  '九月', '十月', '十一月', '十二月'},
+        'mon': {'1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月', '9月', '10月',
+                '11月', '12月', '1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月',
+                '9月', '10月', '11月', '12月'},
+    },
+    'es_UY': {
+    },
+    'kkw_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'es_ES': {
+        'day': {'miércoles', 'lunes', 'martes', 'sábado', 'domingo', 'viernes',
+                'jueves'},
+        'dy': {'vie', 'lun', 'dom', 'mié', 'sáb', 'jue', 'mar'},
+        'month': {'enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
+                  'julio', 'agosto', 'septiembre', 'octubre', 'noviembre',
+                  'diciembre'},
+        'mon': {'ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago', 'sep',
+                'oct', 'nov', 'dic'},
+    },
+    'pui_CO': {
+        'day': {'domingo-dou', 'matte-dou', 'vietne-dou', 'mietcode-dou',
+                'sabado-dou', 'lune-dou', 'jueve-dou'},
+        'dy': {'vie', 'mie', 'lun', 'sab', 'jue', 'mat', 'dom'},
+        'month': {'enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
+                  'julio', 'agosto', 'septiembre', 'octubre', 'noviembre',
+                  'diciembre'},
+        'mon': {'ene', 'feb', 'mar', 'abr', 'may', 'jun', 'jul', 'ago', 'sep',
+                'oct', 'nov', 'dic'},
+    },
+    'fr_BE': {
+    },
+    'sr_RS': {
+        'day': {'недеља', 'среда', 'петак', 'субота', 'понедељак', 'уторак',
+                'четвртак'},
+        'dy': {'пон', 'уто', 'пет', 'нед', 'суб', 'чет', 'сре'},
+        'month': {'јануар', 'фебруар', 'март', 'април', 'мај', 'јун', 'јул',
+                  'август', 'септембар', 'октобар', 'новембар', 'децембар'},
+        'mon': {'јан', 'феб', 'мар', 'апр', 'мај', 'јун', 'јул', 'авг', 'сеп',
+                'окт', 'нов', 'дец'},
+    },
+    'es_EC': {
+    },
+    'eu_ES': {
+        'day': {'larunbata', 'asteartea', 'asteazkena', 'ostirala', 'igandea',
+                'osteguna', 'astelehena'},
+        'dy': {'lr.', 'or.', 'og.', 'ar.', 'ig.', 'az.', 'al.'},
+        'month': {'urtarrila', 'otsaila', 'martxoa', 'apirila', 'maiatza',
+                  'ekaina', 'uztaila', 'abuztua', 'iraila', 'urria', 'azaroa',
+                  'abendua'},
+        'mon': {'urt', 'ots', 'mar', 'api', 'mai', 'eka', 'uzt', 'abu', 'ira',
+                'urr', 'aza', 'abe'},
+    },
+    'xh_ZA': {
+        'day': {'mvulo', 'lwesibini', 'lwesihlanu', 'lwesithathu', 'mgqibelo',
+                'cawe', 'lwesine'},
+        'dy': {'tha', 'bin', 'caw', 'sin', 'hla', 'mvu', 'mgq'},
+        'month': {'janyuwari', 'februwari', 'matshi', 'epreli', 'meyi', 'juni',
+                  'julayi', 'agasti', 'septemba', 'okthoba', 'novemba',
+                  'disemba'},
+        'mon': {'jan', 'feb', 'mat', 'epr', 'mey', 'jun', 'jul', 'aga', 'sep',
+                'okt', 'nov', 'dis'},
+    },
+    'fr_FR': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'es_PE': {
+    },
+    'ht_HT': {
+        'day': {'mèkredi', 'jedi', 'samdi', 'lendi', 'vandredi', 'madi',
+                'dimanch'},
+        'dy': {'mèk', 'van', 'len', 'dim', 'mad', 'sam', 'jed'},
+        'month': {'janvye', 'fevriye', 'mas', 'avril', 'me', 'jen', 'jiyè',
+                  'daout', 'septanm', 'oktòb', 'novanm', 'desanm'},
+        'mon': {'jan', 'fev', 'mas', 'avr', 'me', 'jen', 'jiy', 'dao', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'ar_EG': {
+        'day': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الاثنين', 'السبت',
+                'الخميس'},
+        'dy': {'ث', 'خ', 'ج', 'ح', 'ن', 'س', 'ر'},
+        'month': {'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو',
+                  'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر', 'محرم',
+                  'صفر', 'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى',
+                  'جمادى الآخرة', 'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة',
+                  'ذو الحجة'},
+        'mon': {'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو',
+                'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر', 'محرم', 'صفر',
+                'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى', 'جمادى الآخرة',
+                'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة', 'ذو الحجة'},
+    },
+    'fr_SN': {
+    },
+    'cy_GB': {
+        'day': {'dydd gwener', 'dydd iau', 'dydd sul', 'dydd mercher',
+                'dydd mawrth', 'dydd llun', 'dydd sadwrn'},
+        'dy': {'gwen', 'maw', 'sul', 'iau', 'mer', 'sad', 'llun'},
+        'month': {'ionawr', 'chwefror', 'mawrth', 'ebrill', 'mai', 'mehefin',
+                  'gorffenaf', 'awst', 'medi', 'hydref', 'tachwedd', 'rhagfyr'},
+        'mon': {'ion', 'chwef', 'mawrth', 'ebrill', 'mai', 'meh', 'gorff',
+                'awst', 'medi', 'hyd', 'tach', 'rhag'},
+    },
+    'hy_AM': {
+        'day': {'չորեքշաբթի', 'շաբաթ', 'երեքշաբթի', 'կիրակի', 'երկուշաբթի',
+                'հինգշաբթի', 'ուրբաթ'},
+        'dy': {'չրք', 'շբթ', 'ուրբ', 'երք', 'կիր', 'հնգ', 'երկ'},
+        'month': {'հունվար', 'փետրվար', 'մարտ', 'ապրիլ', 'մայիս', 'հունիս',
+                  'հուլիս', 'օգոստոս', 'սեպտեմբեր', 'հոկտեմբեր', 'նոյեմբեր',
+                  'դեկտեմբեր'},
+        'mon': {'հնվ', 'փտր', 'մրտ', 'ապր', 'մյս', 'հնս', 'հլս', 'օգս', 'սպտ',
+                'հկտ', 'նյմ', 'դկտ'},
+    },
+    'yom_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'ngondi yi nteti', 'ngondi yi mwadi', 'ngondi yi tatu',
+                  'ngondi yi na', 'ngondi yi tanu', 'ngondi yi samunu',
+                  'ngondi yi sabwaadi', 'ngondi yi nana', 'ngondi yi vwa',
+                  'ngondi yi kumi', 'ngondi yi kumi na mweka',
+                  'ngondi yi kumi na wadi'},
+        'mon': {'ng01', 'ng02', 'ng03', 'ng04', 'ng05', 'ng06', 'ng07', 'ng08',
+                'ng09', 'ng10', 'ng11', 'ng12'},
+    },
+    'zh_CN': {
+        'day': {'星期一', '星期二', '星期五', '星期四', '星期日', '星期六', '星期三'},
+        'dy': {'一', '四', '日', '五', '六', '二', '三'},
+        'month': {'一月', '二月', '三月', '四月', '五月', '六月', '七月', '八月', '九月', '十月',
+                  '十一月', '十二月'},
+        'mon': {'1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月', '9月', '10月',
+                '11月', '12月'},
+    },
+    'lo_LA': {
+        'day': {'ວັນເສົາ', 'ວັນອັງຄານ', 'ວັນພຸດ', 'ວັນຈັນ', 'ວັນສຸກ',
+                'ວັນອາທິດ', 'ວັນພະຫັດ'},
+        'dy': {'ອ.', 'ພ.', 'ສກ.', 'ອາ.', 'ສ.', 'ພຫ.', 'ຈ.'},
+        'month': {'ມັງກອນ', 'ກຸມພາ', 'ມີນາ', 'ເມສາ', 'ພຶດສະພາ', 'ມິຖຸນາ',
+                  'ກໍລະກົດ', 'ສິງຫາ', 'ກັນຍາ', 'ຕຸລາ', 'ພະຈິກ', 'ທັນວາ',
+                  'ມັງກອນ', 'ກຸມພາ', 'ມີນາ', 'ເມສາ', 'ພຶດສະພາ', 'ມິຖຸນາ',
+                  'ກໍລະກົດ', 'ສິງຫາ', 'ກັນຍາ', 'ຕຸລາ', 'ພະຈິກ', 'ທັນວາ'},
+        'mon': {'ມ.ກ.', 'ກ.ພ.', 'ມີ.ນ.', 'ມ.ສ..', 'ພ.ພ.', 'ມິ.ຖ.', 'ກ.ລ.',
+                'ສ.ຫ.', 'ກ.ຍ.', 'ຕ.ລ.', 'ພ.ຈ.', 'ທ.ວ.', 'ມ.ກ.', 'ກ.ພ.', 'ມີ.ນ.',
+                'ມ.ສ..', 'ພ.ພ.', 'ມິ.ຖ.', 'ກ.ລ.', 'ສ.ຫ.', 'ກ.ຍ.', 'ຕ.ລ.',
+                'ພ.ຈ.', 'ທ.ວ.'},
+    },
+    'ti_ET': {
+        'day': {' ሰሉስ', 'ሰኑይ', 'ቀዳም', 'ሓሙስ ', 'ዓርቢ', 'ሮቡዕ', 'ሰንበት'},
+        'dy': {'ሮቡ', 'ሰኑ', 'ሰን', 'ሓሙ', 'ዓር', ' ሰሉ', 'ቀዳ'},
+        'month': {'ጥሪ', 'የካቲት', 'መጋቢት', 'ሚያዝያ', ' ግንቦት', ' ሰነ', 'ሓምለ', 'ነሓሰ',
+                  'መስከረም', 'ጥቅምቲ ', 'ሕዳር', 'ታሕሳስ'},
+        'mon': {'ጥሪ', 'የካ', 'መጋ', 'ሚያ', ' ግን', ' ሰነ', 'ሓም', 'ነሓ', 'መስ', 'ጥቅ',
+                'ሕዳ', 'ታሕ'},
+    },
+    'en_IE': {
+    },
+    'eo': {
+        'day': {'ĵaŭdo', 'merkredo', 'vendredo', 'lundo', 'mardo', 'dimanĉo',
+                'sabato'},
+        'dy': {'ĵa', 'me', 've', 'di', 'ma', 'lu', 'sa'},
+        'month': {'januaro', 'februaro', 'marto', 'aprilo', 'majo', 'junio',
+                  'julio', 'aŭgusto', 'septembro', 'oktobro', 'novembro',
+                  'decembro'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'aŭg', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'ky_KG': {
+        'day': {'ишемби', 'дүйшөмбү', 'бейшемби', 'жекшемби', 'жума',
+                'шейшемби', 'шаршемби'},
+        'dy': {'ше', 'иш', 'ша', 'же', 'дү', 'жу', 'бе'},
+        'month': {'январь', 'февраль', 'март', 'апрель', 'май', 'июнь', 'июль',
+                  'август', 'сентябрь', 'октябрь', 'ноябрь', 'декабрь'},
+        'mon': {'янв', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен',
+                'окт', 'ноя', 'дек'},
+    },
+    'no_NO': {
+        'day': {'mandag', 'søndag', 'tirsdag', 'onsdag', 'torsdag', 'fredag',
+                'lørdag'},
+        'dy': {'ti.', 'sø.', 'lø.', 'on.', 'ma.', 'fr.', 'to.'},
+        'month': {'januar', 'februar', 'mars', 'april', 'mai', 'juni', 'juli',
+                  'august', 'september', 'oktober', 'november', 'desember'},
+        'mon': {'jan.', 'feb.', 'mars', 'april', 'mai', 'juni', 'juli', 'aug.',
+                'sep.', 'okt.', 'nov.', 'des.'},
+    },
+    'szl_PL': {
+        'day': {'wtorek', 'pyńdziałek', 'sztwortek', 'niydziela', 'sobota',
+                'piōntek', 'strzoda'},
+        'dy': {'sob.', 'strz.', 'wt.', 'sztw.', 'pt.', 'niydz.', 'pyń.'},
+        'month': {'styczyń', 'luty', 'marzec', 'kwieciyń', 'moj', 'czyrwiec',
+                  'lipiec', 'sierpiyń', 'wrzesiyń', 'październik', 'listopad',
+                  'grudziyń'},
+        'mon': {'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+                'xi', 'xii'},
+    },
+    'sl_SI': {
+        'day': {'ponedeljek', 'četrtek', 'petek', 'nedelja', 'sreda', 'torek',
+                'sobota'},
+        'dy': {'tor', 'pet', 'čet', 'sob', 'sre', 'ned', 'pon'},
+        'month': {'januar', 'februar', 'marec', 'april', 'maj', 'junij',
+                  'julij', 'avgust', 'september', 'oktober', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'avg', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'ak_GH': {
+        'day': {'yawda', 'fida', 'dwowda', 'wukuda', 'kwesida', 'benada',
+                'memeneda'},
+        'dy': {'ben', 'fid', 'mem', 'wuk', 'kwe', 'yaw', 'dwo'},
+        'month': {'sanda-ɔpɛpɔn', 'kwakwar-ɔgyefuo', 'ebɔw-ɔbenem',
+                  'ebɔbira-oforisuo', 'esusow aketseaba-kɔtɔnimba',
+                  'obirade-ayɛwohomumu', 'ayɛwoho-kitawonsa', 'difuu-ɔsandaa',
+                  'fankwa-ɛbɔ', 'ɔbɛsɛ-ahinime', 'ɔberɛfɛw-obubuo',
+                  'mumu-ɔpɛnimba'},
+        'mon': {'s-ɔ', 'k-ɔ', 'e-ɔ', 'e-o', 'e-k', 'o-a', 'a-k', 'd-ɔ', 'f-ɛ',
+                'ɔ-a', 'ɔ-o', 'm-ɔ'},
+    },
+    'zh_MO': {
+    },
+    'fi_FI': {
+        'day': {'keskiviikko', 'maanantai', 'torstai', 'perjantai', 'lauantai',
+                'tiistai', 'sunnuntai'},
+        'dy': {'ke', 'to', 'la', 'ti', 'pe', 'su', 'ma'},
+        'month': {'tammikuu', 'helmikuu', 'maaliskuu', 'huhtikuu', 'toukokuu',
+                  'kesäkuu', 'heinäkuu', 'elokuu', 'syyskuu', 'lokakuu',
+                  'marraskuu', 'joulukuu'},
+        'mon': {'tammi', 'helmi', 'maalis', 'huhti', 'touko', 'kesä', 'heinä',
+                'elo', 'syys', 'loka', 'marras', 'joulu'},
+    },
+    'ebo_CG': {
+        'day': {'usala 3', 'usala 1', 'usala 5', 'usala 4', 'usala 6',
+                'usala 7', 'usala 2'},
+        'dy': {'us4', 'us3', 'us5', 'us6', 'us2', 'us7', 'us1'},
+        'month': {'ntswii 01̃', 'ntswii 02', 'ntswii 03', 'ntswii 04',
+                  'ntswii 05', 'ntswii 06', 'ntswii 07', 'ntswii 08',
+                  'ntswii 09', 'ntswii 10', 'ntswii 11', 'ntswii 12'},
+        'mon': {'nts01', 'nts02', 'nts03', 'nts04', 'nts05', 'nts06', 'nts07',
+                'nts08', 'nts09', 'nts10', 'nts11', 'nts12'},
+    },
+    'ca_ES_valencia': {
+    },
+    'it_CH': {
+    },
+    'ms_MY': {
+        'day': {'sabtu', 'isnin', 'rabu', 'khamis', 'jumaat', 'ahad', 'selasa'},
+        'dy': {'jum', 'ahd', 'isn', 'kha', 'sab', 'rab', 'sel'},
+        'month': {'januari', 'februari', 'mac', 'april', 'mei', 'jun', 'julai',
+                  'ogos', 'september', 'oktober', 'november', 'disember'},
+        'mon': {'jan', 'feb', 'mac', 'apr', 'mei', 'jun', 'jul', 'ogos', 'sep',
+                'okt', 'nov', 'dis'},
+    },
+    'tr_TR': {
+        'day': {'çarşamba', 'perşembe', 'cumartesi', 'cuma', 'pazartesi',
+                'pazar', 'salı'},
+        'dy': {'per', 'cum', 'pzt', 'cmt', 'sal', 'paz', 'çar'},
+        'month': {'ocak', 'şubat', 'mart', 'nisan', 'mayıs', 'haziran',
+                  'temmuz', 'ağustos', 'eylül', 'ekim', 'kasım', 'aralık'},
+        'mon': {'oca', 'şub', 'mar', 'nis', 'may', 'haz', 'tem', 'ağu', 'eyl',
+                'eki', 'kas', 'ara'},
+    },
+    'es_CL': {
+    },
+    'mt_MT': {
+        'day': {'il-ħamis', 'l-erbgħa', 'is-sibt', 'il-ġimgħa', 'it-tlieta',
+                'it-tnejn', 'il-ħadd'},
+        'dy': {'erb', 'ħam', 'ħad', 'tne', 'sib', 'tli', 'ġim'},
+        'month': {'jannar', 'frar', 'marzu', 'april', 'mejju', 'ġunju', 'lulju',
+                  'awwissu', 'settembru', 'ottubru', 'novembru', 'diċembru'},
+        'mon': {'jan', 'fra', 'mar', 'apr', 'mej', 'ġun', 'lul', 'aww', 'set',
+                'ott', 'nov', 'diċ'},
+    },
+    'mr_IN': {
+    },
+    'mai_IN': {
+        'day': {'गुरुवार', 'शनिवार', 'बुधवार', 'रविवार', 'मंगलवार', 'सोमवार',
+                'शुक्रवार'},
+        'dy': {'शनि', 'मंगल', 'बुध', 'गुरु', 'शुक्र', 'रवि', 'सोम'},
+        'month': {'जनवरी', 'फरवरी', 'मार्च', 'अप्रैल', 'मई', 'जून', 'जुलाई',
+                  'अगस्त', 'सितम्बर', 'अक्टूबर', 'नवम्बर', 'दिसम्बर'},
+        'mon': {'जन', 'फर', 'मार्च', 'अप्रै', 'मई', 'जून', 'जुला', 'अग', 'सित',
+                'अक्टू', 'नव', 'दिस'},
+    },
+    'lgr_SB': {
+        'day': {'tuesday', 'friday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'gl_ES': {
+        'day': {'martes', 'sábado', 'luns', 'domingo', 'venres', 'xoves',
+                'mércores'},
+        'dy': {'ven', 'xov', 'mér', 'lun', 'dom', 'sáb', 'mar'},
+        'month': {'xaneiro', 'febreiro', 'marzo', 'abril', 'maio', 'xuño',
+                  'xullo', 'agosto', 'setembro', 'outubro', 'novembro',
+                  'decembro'},
+        'mon': {'xan', 'feb', 'mar', 'abr', 'mai', 'xuñ', 'xul', 'ago', 'set',
+                'out', 'nov', 'dec'},
+    },
+    'pl_PL': {
+        'day': {'niedziela', 'piątek', 'wtorek', 'czwartek', 'środa',
+                'poniedziałek', 'sobota'},
+        'dy': {'pon.', 'śr.', 'sob.', 'czw.', 'wt.', 'pt.', 'niedz.'},
+        'month': {'styczeń', 'luty', 'marzec', 'kwiecień', 'maj', 'czerwiec',
+                  'lipiec', 'sierpień', 'wrzesień', 'październik', 'listopad',
+                  'grudzień'},
+        'mon': {'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+                'xi', 'xii'},
+    },
+    'fr_CA': {
+    },
+    'sw_TZ': {
+        'day': {'ijumaa', 'jumatatu', 'jumapili', 'alhamisi', 'jumanne',
+                'jumamosi', 'jumatano'},
+        'dy': {'jnn', 'jms', 'jtn', 'jpl', 'alh', 'ijm', 'jtt'},
+        'month': {'januari', 'februari', 'machi', 'aprili', 'mei', 'juni',
+                  'julai', 'agosti', 'septemba', 'oktoba', 'novemba',
+                  'desemba'},
+        'mon': {'jan', 'feb', 'mac', 'apr', 'mei', 'jun', 'jul', 'ago', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'br_FR': {
+        'day': {"dimerc'her", 'digwener', 'dilun', 'disul', 'dimeurzh',
+                'diriaou', 'disadorn'},
+        'dy': {'lun.', 'yao.', 'gwe.', 'meu.', 'sad.', 'sul.', 'mer.'},
+        'month': {'genver', "c'hwevrer", 'meurzh', 'ebrel', 'mae', 'mezheven',
+                  'gouere', 'eost', 'gwengolo', 'here', 'du', 'kerzu'},
+        'mon': {'genv.', "c'hw.", 'meur.', 'ebr.', 'mae', 'even', 'goue.',
+                'eost', 'gwen.', 'here', 'du', 'kerz.'},
+    },
+    'wa_BE': {
+        'day': {'djudi', 'londi', 'vénrdi', 'mårdi', 'mierkidi', 'dimegne',
+                'semdi'},
+        'dy': {'dju', 'mie', 'vén', 'sem', 'dim', 'lon', 'mår'},
+        'month': {'djanvî', 'fevrî', 'måss', 'avri', 'may', 'djun', 'djulete',
+                  'awousse', 'setimbe', 'octôbe', 'nôvimbe', 'decimbe'},
+        'mon': {'dja', 'fev', 'mås', 'avr', 'may', 'djn', 'djl', 'awo', 'set',
+                'oct', 'nôv', 'dec'},
+    },
+    'nr_ZA': {
+        'day': {'lesithathu', 'ulesine', 'ulesibili', 'umvulo', 'umgqibelo',
+                'usonto', 'ngolesihlanu'},
+        'dy': {'tha', 'hla', 'bil', 'mvu', 'gqi', 'son', 'ne'},
+        'month': {'janabari', 'ufeberbari', 'umatjhi', 'u-apreli', 'meyi',
+                  'juni', 'julayi', 'arhostosi', 'septemba', 'oktoba',
+                  'usinyikhaba', 'disemba'},
+        'mon': {'jan', 'feb', 'mat', 'apr', 'mey', 'jun', 'jul', 'arh', 'sep',
+                'okt', 'usi', 'dis'},
+    },
+    'ar_MA': {
+    },
+    'en_ZM': {
+    },
+    'bvx_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    've_ZA': {
+        'day': {'ḽavhuvhili', 'ḽavhuṋa', 'musumbuluwo', 'ḽavhuṱanu',
+                'ḽavhuraru', 'swondaha', 'mugivhela'},
+        'dy': {'mus', 'vhi', 'mug', 'rar', 'ṱan', 'ṋa', 'swo'},
+        'month': {'phando', 'luhuhi', 'ṱhafamuhwe', 'lambamai', 'shundunthule',
+                  'fulwi', 'fulwana', 'ṱhangule', 'khubvumedzi', 'tshimedzi',
+                  'ḽara', 'nyendavhusiku'},
+        'mon': {'pha', 'luh', 'ṱha', 'lam', 'shu', 'lwi', 'lwa', 'ṱha', 'khu',
+                'tsh', 'ḽar', 'nye'},
+    },
+    'ts_ZA': {
+        'day': {'ravumbirhi', 'sonto', 'mugqivela', 'ravunharhu', 'ravumune',
+                'ravuntlhanu', 'musumbhunuku'},
+        'dy': {'mus', 'mug', 'tlh', 'ne', 'bir', 'son', 'har'},
+        'month': {'sunguti', 'nyenyenyani', 'nyenyankulu', 'dzivamisoko',
+                  'mudyaxihi', 'khotavuxika', 'mawuwani', 'mhawuri', 'ndzhati',
+                  'nhlangula', 'hukuri', "n'wendzamhala"},
+        'mon': {'sun', 'yan', 'kul', 'dzi', 'mud', 'kho', 'maw', 'mha', 'ndz',
+                'nhl', 'huk', "n'w"},
+    },
+    'pt_AO': {
+        'day': {'segunda-feira', 'sábado', 'domingo', 'terça-feira',
+                'sexta-feira', 'quarta-feira', 'quinta-feira'},
+        'dy': {'qui', 'seg', 'sex', 'qua', 'sáb', 'ter', 'dom'},
+        'month': {'janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
+                  'julho', 'agosto', 'setembro', 'outubro', 'novembro',
+                  'dezembro'},
+        'mon': {'jan', 'fev', 'mar', 'abr', 'mai', 'jun', 'jul', 'ago', 'set',
+                'out', 'nov', 'dez'},
+    },
+    'tn_ZA': {
+        'day': {'labotlhano', 'labone', 'mosopulogo', 'labobedi', 'laboraro',
+                'matlhatso', 'tshipi'},
+        'dy': {'tla', 'rar', 'bed', 'mos', 'ne', 'tsh', 'mat'},
+        'month': {'ferikgong', 'tlhakole', 'mopitlo', 'moranang',
+                  'motsheganang', 'seetebosigo', 'phukwi', 'phatwe', 'lwetse',
+                  'diphalane', 'ngwanatsele', 'sedimonthole'},
+        'mon': {'fer', 'tlh', 'mop', 'mor', 'mot', 'see', 'phu', 'pha', 'lwe',
+                'dip', 'ngw', 'sed'},
+    },
+    'ar_KW': {
+    },
+    'dsb_DE': {
+        'day': {'pónjeźela', 'wałtora', 'srjoda', 'njeźela', 'stwórtk', 'pětk',
+                'sobota'},
+        'dy': {'sob.', 'srj.', 'nje.', 'wał.', 'stw.', 'pět.', 'pón.'},
+        'month': {'januar', 'februar', 'měrc', 'apryl', 'maj', 'junij', 'julij',
+                  'awgust', 'september', 'oktober', 'nowember', 'december'},
+        'mon': {'jan.', 'feb.', 'měr.', 'apr.', 'maj', 'jun.', 'jul.', 'awg.',
+                'sep.', 'okt.', 'now.', 'dec.'},
+    },
+    'ar_JO': {
+    },
+    'am_ET': {
+        'day': {'እሑድ', 'ሰኞ', 'ቅዳሜ', 'ሐሙስ', 'ረቡዕ', 'ማክሰኞ', 'ዓርብ'},
+        'dy': {'እሑድ', 'ሰኞ', 'ቅዳሜ', 'ሐሙስ', 'ረቡዕ', 'ማክሰኞ', 'ዓርብ'},
+        'month': {'ጃንዩወሪ', 'ፌብሩወሪ', 'ማርች', 'ኤፕረል', 'ሜይ', 'ጁን', 'ጁላይ', 'ኦገስት',
+                  'ሴፕቴምበር', 'ኦክተውበር', 'ኖቬምበር', 'ዲሴምበር'},
+        'mon': {'ጃንዩ', 'ፌብሩ', 'ማርች', 'ኤፕረ', 'ሜይ', 'ጁን', 'ጁላይ', 'ኦገስ', 'ሴፕቴ',
+                'ኦክተ', 'ኖቬም', 'ዲሴም'},
+    },
+    'an_ES': {
+        'day': {'mierques', 'martz', 'chueus', 'luns', 'domingo', 'viernes',
+                'sabado'},
+        'dy': {'vie', 'mie', 'lun', 'dom', 'sab', 'chu', 'mar'},
+        'month': {'chinero', 'febrero', 'marzo', 'abril', 'mayo', 'chunio',
+                  'chulio', 'agosto', 'setiembre', 'octobre', 'noviembre',
+                  'aviento'},
+        'mon': {'chi', 'feb', 'mar', 'abr', 'may', 'chn', 'chl', 'ago', 'set',
+                'oct', 'nov', 'avi'},
+    },
+    'lv_LV': {
+        'day': {'ceturtdiena', 'svētdiena', 'otrdiena', 'piektdiena',
+                'trešdiena', 'pirmdiena', 'sestdiena'},
+        'dy': {'t', 'pk', 's', 'o', 'sv', 'p', 'c'},
+        'month': {'janvāris', 'februāris', 'marts', 'aprīlis', 'maijs',
+                  'jūnijs', 'jūlijs', 'augusts', 'septembris', 'oktobris',
+                  'novembris', 'decembris'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'mai', 'jūn', 'jūl', 'aug', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'ee_GH': {
+        'day': {'fiɖa', 'kuɖa', 'braɖa', 'yawoɖa', 'kɔsiɖa', 'memleɖa',
+                'dzoɖa'},
+        'dy': {'bra', 'kɔs', 'dzo', 'kuɖ', 'mem', 'fiɖ', 'yaw'},
+        'month': {'dzove', 'dzodze', 'tedoxe', 'afɔfiɛ', 'dama', 'masa',
+                  'siamlɔm', 'deasiamime', 'anyɔnyɔ', 'kele', 'adeɛmekpɔxe',
+                  'dzome'},
+        'mon': {'dzv', 'dzd', 'ted', 'afɔ', 'dam', 'mas', 'sia', 'dea', 'any',
+                'kel', 'ade', 'dzm'},
+    },
+    'es_AR': {
+    },
+    'kmr_Latn_TR': {
+        'day': {'sêşem', 'ş', 'în', 'pêncşem', 'çarşem', 'yekşem', 'duşem'},
+        'dy': {'şemî', 'pş', 'sş', 'dş', 'în', 'yş', 'çş'},
+        'month': {'çile', 'sibat', 'adar', 'nîsan', 'gulan', 'hezîran',
+                  'tîrmeh', 'tebax', 'îlon', 'cotmeh', 'mijdar', 'kanûn'},
+        'mon': {'çil', 'sib', 'adr', 'nîs', 'gul', 'hez', 'tîr', 'teb', 'îlo',
+                'cot', 'mij', 'kan'},
+    },
+    'kn_IN': {
+        'day': {'ಬುಧವಾರ', 'ರವಿರಾರ', 'ಶನಿವಾರ', 'ಮಂಗಳವಾರ', 'ಸೋಮವಾರ', 'ಶುಕ್ರವಾರ',
+                'ಗುರುವಾರ'},
+        'dy': {'ಸೋಮ.', 'ರವಿ.', 'ಶನಿ.', 'ಶುಕ್ರ.', 'ಬುಧ.', 'ಮಂಗಳ.', 'ಗುರು.'},
+        'month': {'ಜನವರಿ', 'ಪೆಬ್ರವರಿ', 'ಮಾಚಿ೯', 'ಏಪ್ರಿಲ್', 'ಮೇ', 'ಜೂನ್', 'ಜುಲೈ',
+                  'ಆಗಸ್ಟ', 'ಸೆಪ್ಟಂಬರ್', 'ಅಕೋಟೕಬರ್', 'ನವೆಂಬರ್', 'ಡಿಸೆಂಬರ್'},
+        'mon': {'ಜನವರಿ.', 'ಪೆಬ್ರವರಿ.', 'ಮಾಚಿ೯.', 'ಏಪ್ರಿಲ್.', 'ಮೇ.', 'ಜೂನ್.',
+                'ಜುಲೈ.', 'ಆಗಸ್ಟ.', 'ಸೆಪ್ಟಂಬರ್.', 'ಅಕೋಟೕಬರ್.', 'ನವೆಂಬರ್.',
+                'ಡಿಸೆಂಬರ್.'},
+    },
+    'bs_BA': {
+        'day': {'petak', 'četvrtak', 'nedjelja', 'subota', 'utorak', 'srijeda',
+                'ponedjeljak'},
+        'dy': {'uto', 'sri', 'pet', 'čet', 'sub', 'ned', 'pon'},
+        'month': {'januar', 'februar', 'mart', 'april', 'maj', 'juni', 'juli',
+                  'avgust', 'septembar', 'oktobar', 'novembar', 'decembar'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'avg', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'bo_IN': {
+        'day': {'གཟའ་ཉི་མ་', 'གཟའ་པ་སངས་', 'གཟའ་སྤེན་པ་', 'གཟའ་ཟླ་བ་',
+                'གཟའ་ཕུར་བུ་', 'གཟའ་ལྷག་པ་', 'གཟའ་མིག་དམར་'},
+        'dy': {'ཕུར་', 'ཟླ་', 'ཉི་', 'སྤེན་', 'མིར་', 'སངས་', 'ལྷག་'},
+        'month': {'སྤྱི་ཟླཝ་དངཔ་', 'སྤྱི་ཟླཝ་གཉིས་པ་', 'སྤྱི་ཟླཝ་གསུམ་པ་',
+                  'སྤྱི་ཟླཝ་བཞི་པ་', 'སྤྱི་ཟླཝ་ལྔ་པ་', 'སྤྱི་ཟླཝ་དྲུག་པ་',
+                  'སྤྱི་ཟླཝ་བདུན་པ་', 'སྤྱི་ཟླཝ་བརྒྱད་པ་', 'སྤྱི་ཟླཝ་དགུ་པ་',
+                  'སྤྱི་ཟླཝ་བཅུ་པ་', 'སྤྱི་ཟླཝ་བཅུ་གཅིག་པ་',
+                  'སྤྱི་ཟླཝ་བཅུ་གཉིས་པ་'},
+        'mon': {'ཟླ་ ༡', 'ཟླ་ ༢', 'ཟླ་ ༣', 'ཟླ་ ༤', 'ཟླ་ ༥', 'ཟླ་ ༦', 'ཟླ་ ༧',
+                'ཟླ་ ༨', 'ཟླ་ ༩', 'ཟླ་ ༡༠', 'ཟླ་ ༡༡', 'ཟླ་ ༡༢'},
+    },
+    'st_ZA': {
+        'day': {'mmantaha', 'labohlane', 'labone', 'moqebelo', 'laboraru',
+                'sontaha', 'labobedi'},
+        'dy': {'moq', 'mma', 'rar', 'hla', 'bed', 'son', 'ne'},
+        'month': {'phesekgong', 'hlakola', 'hlakubele', 'mmese', 'motsheanong',
+                  'phupjane', 'phupu', 'phata', 'leotshe', 'mphalane',
+                  'pundungwane', 'tshitwe'},
+        'mon': {'phe', 'kol', 'ube', 'mme', 'mot', 'jan', 'upu', 'pha', 'leo',
+                'mph', 'pun', 'tsh'},
+    },
+    'it_IT': {
+        'day': {'venerdì', 'martedì', 'mercoledì', 'giovedì', 'domenica',
+                'lunedì', 'sabato'},
+        'dy': {'ven', 'gio', 'lun', 'dom', 'mer', 'sab', 'mar'},
+        'month': {'gennaio', 'febbraio', 'marzo', 'aprile', 'maggio', 'giugno',
+                  'luglio', 'agosto', 'settembre', 'ottobre', 'novembre',
+                  'dicembre'},
+        'mon': {'gen', 'feb', 'mar', 'apr', 'mag', 'giu', 'lug', 'ago', 'set',
+                'ott', 'nov', 'dic'},
+    },
+    'ka_GE': {
+        'day': {'კვირა', 'ოთხშაბათი', 'პარასკევი', 'შაბათი', 'სამშაბათი',
+                'ხუთშაბათი', 'ორშაბათი'},
+        'dy': {'ორშ', 'პარ', 'სამ', 'კვი', 'შაბ', 'ოთხ', 'ხუთ'},
+        'month': {'იანვარი', 'თებერვალი', 'მარტი', 'აპრილი', 'მაისი', 'ივნისი',
+                  'ივლისი', 'აგვისტო', 'სექტემბერი', 'ოქტომბერი', 'ნოემბერი',
+                  'დეკემბერი'},
+        'mon': {'იან', 'თებ', 'მარ', 'აპრ', 'მაი', 'ივნ', 'ივლ', 'აგვ', 'სექ',
+                'ოქტ', 'ნოე', 'დეკ'},
+    },
+    'vif_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'ne_NP': {
+        'day': {'मङ्गलबार', 'बुधबार', 'शुक्रबार', 'आइतबार', 'सोमबार', 'बिहीबार',
+                'शनिबार'},
+        'dy': {'शनि', 'मङ्गल', 'बिही', 'बुध', 'शुक्र', 'आइत', 'सोम'},
+        'month': {'जनवरी', 'फेब्रुअरी', 'मार्च', 'अप्रिल', 'मे', 'जुन', 'जुलाई',
+                  'अगस्त', 'सेप्टेम्बर', 'अक्टोबर', 'नोभेम्बर', 'डिसेम्बर'},
+        'mon': {'जन', 'फेब', 'मार्च', 'अप्रि', 'मे', 'जुन', 'जुला', 'अग',
+                'सेप्ट', 'अक्टो', 'नोभे', 'डिसे'},
+    },
+    'el_GR': {
+        'day': {'δευτέρα', 'σάββατο', 'τρίτη', 'παρασκευή', 'τετάρτη',
+                'κυριακή', 'πέμπτη'},
+        'dy': {'δευ', 'κυρ', 'πεμ', 'τρι', 'τετ', 'παρ', 'σαβ'},
+        'month': {'ιανουαρίου', 'φεβρουαρίου', 'μαρτίου', 'απριλίου', 'μαΐου',
+                  'ιουνίου', 'ιουλίου', 'αυγούστου', 'σεπτεμβρίου', 'οκτωβρίου',
+                  'νοεμβρίου', 'δεκεμβρίου'},
+        'mon': {'ιαν', 'φεβ', 'μαρ', 'απρ', 'μαϊ', 'ιουν', 'ιουλ', 'αυγ', 'σεπ',
+                'οκτ', 'νοε', 'δεκ'},
+    },
+    'fo_FO': {
+        'day': {'týsdagur', 'leygardagur', 'mikudagur', 'hósdagur',
+                'sunnudagur', 'mánadagur', 'fríggjadagur'},
+        'dy': {'ley', 'hós', 'mik', 'mán', 'sun', 'frí', 'týs'},
+        'month': {'januar', 'februar', 'mars', 'apríl', 'mai', 'juni', 'juli',
+                  'august', 'september', 'oktober', 'november', 'desember'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'fr_TG': {
+    },
+    'es_CR': {
+    },
+    'tt_RU': {
+        'day': {'якшәмбе', 'сишәмбе', 'чәршәмбе', 'пәнҗешәмбе', 'җомга',
+                'шимбә', 'дүшәмбе'},
+        'dy': {'җм', 'чр', 'сш', 'пн', 'як', 'шм', 'дү'},
+        'month': {'гыйнвар', 'февраль', 'март', 'апрель', 'май', 'июнь', 'июль',
+                  'август', 'сентябрь', 'октябрь', 'ноябрь', 'декабрь'},
+        'mon': {'гыйн', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен',
+                'окт', 'ноя', 'дек'},
+    },
+    'en_JM': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'ar_BH': {
+    },
+    'plt_MG': {
+        'day': {'alatsinainy', 'talata', 'zoma', 'asabotsy', 'alarobia',
+                'alahady', 'alakamisy'},
+        'dy': {'zom', 'alar', 'alat', 'alah', 'tal', 'asab', 'alak'},
+        'month': {'janoary', 'febroary', 'marsa', 'aprily', 'may', 'jona',
+                  'jolay', 'aogosta', 'septambra', 'oktobra', 'novambra',
+                  'desambra'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jon', 'jol', 'aog', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'mn_Cyrl_MN': {
+        'day': {'лхагва', 'даваа', 'пүрэв', 'мягмар', 'ням', 'баасан', 'бямба'},
+        'dy': {'мя', 'лх', 'пү', 'да', 'бя', 'ба', 'ня'},
+        'month': {'хулгана', 'үхэр', 'бар', 'туулай', 'луу', 'могой', 'морь',
+                  'хонь', 'бич', 'тахиа', 'нохой', 'гахай'},
+        'mon': {'хул', 'үхэ', 'бар', 'туу', 'луу', 'мог', 'мор', 'хон', 'бич',
+                'тах', 'нох', 'гах'},
+    },
+    'kng_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'gsc_FR': {
+        'day': {'dimars', 'dijaus', 'dissabte', 'diluns', 'dimècres', 'divés',
+                'dimenge'},
+        'dy': {'dim.', 'dis.', 'dime.', 'dij.', 'dima.', 'div.', 'dil.'},
+        'month': {'genèr', 'heurèr', 'març', 'abriu', 'mai', 'junh', 'julhet',
+                  'aost', 'seteme', 'octobre', 'noveme', 'deceme'},
+        'mon': {'gen.', 'heur.', 'març', 'abr.', 'mai', 'junh', 'julh.', 'aost',
+                'set.', 'oct.', 'nov.', 'dec.'},
+    },
+    'ga_IE': {
+        'day': {'dé haoine', 'dé máirt', 'dé céadaoin', 'déardaoin',
+                'dé domhnaigh', 'dé sathairn', 'dé luain'},
+        'dy': {'sath', 'céad', 'domh', 'luan', 'déar', 'máirt', 'aoine'},
+        'month': {'eanáir', 'feabhra', 'márta', 'aibreán', 'bealtaine',
+                  'meitheamh', 'iúil', 'lúnasa', 'meán fómhair',
+                  'deireadh fómhair', 'samhain', 'nollaig'},
+        'mon': {'ean', 'feabh', 'márta', 'aib', 'beal', 'meith', 'iúil', 'lún',
+                'mfómh', 'dfómh', 'samh', 'noll'},
+    },
+    'sv_FI': {
+        'day': {'söndag', 'lördag', 'onsdag', 'torsdag', 'fredag', 'måndag',
+                'tisdag'},
+        'dy': {'sö', 'to', 'må', 'ti', 'fr', 'on', 'lö'},
+        'month': {'januari', 'februari', 'mars', 'april', 'maj', 'juni', 'juli',
+                  'augusti', 'september', 'oktober', 'november', 'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'mos_BF': {
+        'day': {'tẽne', 'arzũma', 'sibri', 'lamusa', 'talaato', 'arba', 'hato'},
+        'dy': {'hat', 'tal', 'tẽn', 'arb', 'sib', 'lam', 'arz'},
+        'month': {'yʋʋm-vẽkr-kiuug', 'wao-fugdg-kiuug', 'tʋʋlg-kiuug',
+                  'tʋʋl-nif-kiuug', 'sig-noy-kiuug', 'sigr-kiuug',
+                  'sẽoog-kiuug', 'sa-sik-kiuug', 'bõn-biʋʋng-kiuug',
+                  'zĩ-likr-kiuug', 'sɩpaolg-kiuug', 'yʋʋm-sar-kiuug'},
+        'mon': {'yvk', 'wfk', 'tʋk', 'tnk', 'snk', 'sik', 'sẽk', 'ssk', 'bbk',
+                'zlk', 'sɩk', 'ysk'},
+    },
+    'pjt_AU': {
+    },
+    'sg_CF': {
+        'day': {'bïkua-ûse', 'bïkua-otâ', 'bïkua-okü', 'lâpôsö', 'lâyenga',
+                'bïkua-usyö', 'bïkua-ôko'},
+        'dy': {'bk4', 'ly', 'lp', 'bk5', 'bk3', 'bk2', 'bk1'},
+        'month': {'nyenye', 'fulundïgi', 'mbängü', 'ngubë', 'bêläwü', 'föndo',
+                  'lengua', 'kükürü', 'mvuka', 'ngberere', 'nabändüru',
+                  'kakawaka'},
+        'mon': {'nye', 'ful', 'mba', 'ngu', 'bel', 'fon', 'len', 'kuk', 'mvu',
+                'ngb', 'nab', 'kak'},
+    },
+    'njx_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'en_NG': {
+    },
+    'puu_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'es_SV': {
+    },
+    'or_IN': {
+        'day': {'ଗୁରୁବାର', 'କବିବାର', 'ବୁଧବାର', 'ମଂଗଳବାର', 'ସୋମବାର', 'ଶନିବାର',
+                'ଶୁକ୍ରବାର'},
+        'dy': {'ରବି', 'ଗୁରୁ', 'ମଂଗଳ', 'ବୁଧ', 'ଶୁକ୍ର', 'ସୋମ', 'ଶନି'},
+        'month': {'ଜାନୁଆରୀ', 'ଫେବୃୟାରୀ', 'ମାର୍ଚ୍ଚ', 'ଏପ୍ରିଲ', 'ମଇ', 'ଜୁନ',
+                  'ଜୁଲାଇ', 'ଅଗଷ୍ଟ', 'ସେପ୍ଟେମ୍ବର', 'ଅକ୍ଟୋବର', 'ନଭେମ୍ବର',
+                  'ଡିସେମ୍ବର'},
+        'mon': {'ଜାନ', 'ଫେବ', 'ମାର୍ଚ୍ଚ', 'ଏପ୍ରିଲ', 'ମଇ', 'ଜୁନ', 'ଜୁଲ', 'ଅଗ',
+                'ସେପ', 'ଅକ୍ଟ', 'ନଭ', 'ଡିସ'},
+    },
+    'lld_IT': {
+        'day': {'sada', 'merdi', 'juebia', 'lunesc', 'mierculdi', 'dumënia',
+                'vënderdi'},
+        'dy': {'mie', 'vën', 'lun', 'mer', 'dum', 'sad', 'jue'},
+        'month': {'jené', 'fauré', 'merz', 'auril', 'mei', 'juni', 'lugio',
+                  'agost', 'setëmber', 'utober', 'nuvëmber', 'dezëmber'},
+        'mon': {'jen', 'fau', 'mer', 'aur', 'mei', 'jun', 'lug', 'ago', 'set',
+                'uto', 'nuv', 'dez'},
+    },
+    'bn_BD': {
+        'day': {'মঙ্গলবার', 'শুক্রবার', 'বুধবার', 'বৃহস্পতিবার', 'শনিবার',
+                'সোমবার', 'রবিবার'},
+        'dy': {'বৃহঃ', 'সোম', 'রবি', 'বুধ', 'শুক্র', 'শনি', 'মঙ্গল'},
+        'month': {'জানুয়ারি', 'ফেব্রুয়ারি', 'মার্চ', 'এপ্রিল', 'মে', 'জুন',
+                  'জুলাই', 'আগস্ট', 'সেপ্টেম্বর', 'অক্টোবর', 'নভেম্বর',
+                  'ডিসেম্বর'},
+        'mon': {'জানু', 'ফেব্রু', 'মার্চ', 'এপ্রি', 'মে', 'জুন', 'জুল', 'আগ',
+                'সেপ্টে', 'অক্টো', 'নভে', 'ডিসে'},
+    },
+    'ca_ES': {
+        'day': {'divendres', 'dimarts', 'dissabte', 'dilluns', 'dijous',
+                'diumenge', 'dimecres'},
+        'dy': {'dl.', 'dv.', 'dj.', 'dc.', 'dg.', 'dt.', 'ds.'},
+        'month': {'gener', 'febrer', 'març', 'abril', 'maig', 'juny', 'juliol',
+                  'agost', 'setembre', 'octubre', 'novembre', 'desembre'},
+        'mon': {'gen.', 'febr.', 'març', 'abr.', 'maig', 'juny', 'jul.', 'ag.',
+                'set.', 'oct.', 'nov.', 'des.'},
+    },
+    'en_MW': {
+    },
+    'en_AU': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'es_MX': {
+    },
+    'dz_BT': {
+        'day': {'གཟའ་ཉི་མ་', 'གཟའ་པ་སངས་', 'གཟའ་སྤེན་པ་', 'གཟའ་ཟླ་བ་',
+                'གཟའ་ཕུར་བུ་', 'གཟའ་ལྷག་པ་', 'གཟའ་མིག་དམར་'},
+        'dy': {'ཕུར་', 'ཟླ་', 'ཉི་', 'སྤེན་', 'མིར་', 'སངས་', 'ལྷག་'},
+        'month': {'སྤྱི་ཟླཝ་དངཔ་', 'སྤྱི་ཟླཝ་གཉིས་པ་', 'སྤྱི་ཟླཝ་གསུམ་པ་',
+                  'སྤྱི་ཟླཝ་བཞི་པ་', 'སྤྱི་ཟླཝ་ལྔ་པ་', 'སྤྱི་ཟླཝ་དྲུག་པ་',
+                  'སྤྱི་ཟླཝ་བདུན་པ་', 'སྤྱི་ཟླཝ་བརྒྱད་པ་', 'སྤྱི་ཟླཝ་དགུ་པ་',
+                  'སྤྱི་ཟླཝ་བཅུ་པ་', 'སྤྱི་ཟླཝ་བཅུ་གཅིག་པ་',
+                  'སྤྱི་ཟླཝ་བཅུ་གཉིས་པ་'},
+        'mon': {'ཟླ་ ༡', 'ཟླ་ ༢', 'ཟླ་ ༣', 'ཟླ་ ༤', 'ཟླ་ ༥', 'ཟླ་ ༦', 'ཟླ་ ༧',
+                'ཟླ་ ༨', 'ཟླ་ ༩', 'ཟླ་ ༡༠', 'ཟླ་ ༡༡', 'ཟླ་ ༡༢'},
+    },
+    'ar_TN': {
+        'day': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الاثنين', 'السبت',
+                'الخميس'},
+        'dy': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الاثنين', 'السبت',
+               'الخميس'},
+        'month': {'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو',
+                  'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر', 'محرم',
+                  'صفر', 'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى',
+                  'جمادى الآخرة', 'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة',
+                  'ذو الحجة'},
+        'mon': {'يناير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو',
+                'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر', 'محرم', 'صفر',
+                'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى', 'جمادى الآخرة',
+                'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة', 'ذو الحجة'},
+    },
+    'de_LI': {
+    },
+    'sr_ME': {
+    },
+    'tek_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'uk_UA': {
+        'day': {'четвер', "п'ятниця", 'понеділок', 'неділя', 'середа', 'субота',
+                'вівторок'},
+        'dy': {'вт', 'сб', 'пн', 'нд', 'пт', 'чт', 'ср'},
+        'month': {'січень', 'лютий', 'березень', 'квітень', 'травень',
+                  'червень', 'липень', 'серпень', 'вересень', 'жовтень',
+                  'листопад', 'грудень'},
+        'mon': {'січ', 'лют', 'бер', 'квт', 'трв', 'чер', 'лип', 'сер', 'вер',
+                'жов', 'лис', 'гру'},
+    },
+    'lij_IT': {
+        'day': {'sabbo', 'mäcordì', 'lunesdì', 'domenega', 'mätesdì', 'zeuggia',
+                'venardì'},
+        'dy': {'zeu', 'ven', 'mäc', 'mät', 'lun', 'sab', 'dom'},
+        'month': {'zennâ', 'frevâ', 'marso', 'arvî', 'mazzo', 'zugno', 'luggio',
+                  'agosto', 'setembre', 'ötobre', 'novembre', 'dexembre'},
+        'mon': {'zen', 'fre', 'mar', 'arv', 'maz', 'zug', 'lug', 'ago', 'set',
+                'öto', 'nov', 'dex'},
+    },
+    'kk_KZ': {
+        'day': {'сенбі', 'бейсенбі', 'жума', 'сәрсенбі', 'жексенбі', 'дүйсенбі',
+                'сейсенбі'},
+        'dy': {'жм', 'сн', 'бс', 'дб', 'жк', 'сс', 'ср'},
+        'month': {'қантар', 'ақпан', 'наурыз', 'сәуір', 'мамыр', 'маусым',
+                  'шілде', 'тамыз', 'қырқүйек', 'қазан', 'қараша', 'желтоқсан'},
+        'mon': {'қан', 'ақп', 'нау', 'сәу', 'мам', 'мау', 'шіл', 'там', 'қыр',
+                'қаз', 'қар', 'жел'},
+    },
+    'pt_BR': {
+    },
+    'lif_NP': {
+        'day': {'ᤋᤧᤏᤧᤒᤠ', 'ᤑᤥᤖᤠᤒᤠ', 'ᤂᤧᤰᤛᤢᤒᤠ', 'ᤑᤛᤢ᤺ᤵᤐᤠ', 'ᤔᤡᤰᤜᤠᤱᤒᤠ',
+                'ᤁᤢᤖᤢ᤺ᤵᤐᤠ', 'ᤛᤧᤴᤇᤪᤧᤱᤒᤠ'},
+        'dy': {'ᤋᤧᤏᤧᤒᤠ', 'ᤑᤥᤖᤠᤒᤠ', 'ᤂᤧᤰᤛᤢᤒᤠ', 'ᤑᤛᤢ᤺ᤵᤐᤠ', 'ᤔᤡᤰᤜᤠᤱᤒᤠ', 'ᤁᤢᤖᤢ᤺ᤵᤐᤠ',
+               'ᤛᤧᤴᤇᤪᤧᤱᤒᤠ'},
+        'month': {'जनवरी', 'फेब्रुअरी', 'मार्च', 'अप्रिल', 'मे', 'जुन', 'जुलाई',
+                  'अगस्त', 'सेप्टेम्बर', 'अक्टोबर', 'नोभेम्बर', 'डिसेम्बर'},
+        'mon': {'जन', 'फेब', 'मार्च', 'अप्रि', 'मे', 'जुन', 'जुला', 'अग',
+                'सेप्ट', 'अक्टो', 'नोभे', 'डिसे'},
+    },
+    'de_DE': {
+        'day': {'dienstag', 'freitag', 'mittwoch', 'montag', 'samstag',
+                'sonntag', 'donnerstag'},
+        'dy': {'mo', 'mi', 'so', 'di', 'fr', 'do', 'sa'},
+        'month': {'januar', 'februar', 'märz', 'april', 'mai', 'juni', 'juli',
+                  'august', 'september', 'oktober', 'november', 'dezember'},
+        'mon': {'jan', 'feb', 'mrz', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dez'},
+    },
+    'en_BZ': {
+    },
+    'ar_IQ': {
+    },
+    'ml_IN': {
+        'day': {'ബുധനാഴ്ച്ച', 'ശനിയാഴ്ച്ച', 'വ്യാഴാഴ്ച്ച', 'വെള്ളിയാഴ്ച്ച',
+                'തിങ്കളാഴ്ച്ച', 'ഞായറാഴ്ച്ച', 'ചൊവ്വാഴ്ച്ച'},
+        'dy': {'വ്യാഴം', 'തിങ്കള്\u200d', 'വെള്ളി', 'ചൊവ്വ', 'ശനി',
+               'ഞായര്\u200d', 'ബുധന്\u200d'},
+        'month': {'ജനുവരി', 'ഫെബ്രുവരി', 'മാര്\u200dച്ച്', 'ഏപ്രില്\u200d',
+                  'മെയ്', 'ജൂണ്\u200d', 'ജൂലൈ', 'ആഗസ്റ്റ്', 'സെപ്റ്റംബര്\u200d',
+                  'ഒക്ടോബര്\u200d', 'നവംബര്\u200d', 'ഡിസംബര്\u200d'},
+        'mon': {'ജനു', 'ഫെബ്രു', 'മാര്\u200dച്ച്', 'ഏപ്രില്\u200d', 'മെയ്',
+                'ജൂണ്\u200d', 'ജൂലൈ', 'ആഗസ്റ്റ്', 'സെപ്റ്റം', 'ഒക്ടോ', 'നവം',
+                'ഡിസം'},
+    },
+    'ar_LB': {
+        'day': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الاثنين', 'السبت',
+                'الخميس'},
+        'dy': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الاثنين', 'السبت',
+               'الخميس'},
+        'month': {'كانون الثاني', 'شباط', 'آذار', 'نيسان', 'نوار', 'حزيران',
+                  'تموز', 'آب', 'أيلول', 'تشرين الأول', 'تشرين الثاني',
+                  'كانون الأول', 'محرم', 'صفر', 'ربيع الأول', 'ربيع الآخر',
+                  'جمادى الأولى', 'جمادى الآخرة', 'رجب', 'شعبان', 'رمضان',
+                  'شوال', 'ذو القعدة', 'ذو الحجة'},
+        'mon': {'كانون الثاني', 'شباط', 'آذار', 'نيسان', 'نوار', 'حزيران',
+                'تموز', 'آب', 'أيلول', 'تشرين الأول', 'تشرين الثاني',
+                'كانون الأول', 'محرم', 'صفر', 'ربيع الأول', 'ربيع الآخر',
+                'جمادى الأولى', 'جمادى الآخرة', 'رجب', 'شعبان', 'رمضان', 'شوال',
+                'ذو القعدة', 'ذو الحجة'},
+    },
+    'nds_DE': {
+        'day': {'dingsdag', 'maondag', 'dunnerdag', 'saoterdag', 'gunsdag',
+                'sundag', 'fridag'},
+        'dy': {'gun', 'mao', 'din', 'sun', 'dun', 'fri', 'sao'},
+        'month': {'harremaond', 'iesmaond', 'mäten', 'prillen', 'maimaond',
+                  'braokmaond', 'haimaond', 'aarntmaond', 'hiärfstmaond',
+                  'saotmaond', 'niëwelmaond', 'kristmaond'},
+        'mon': {'har', 'ies', 'mät', 'pri', 'mai', 'brk', 'hai', 'aar', 'hiä',
+                'stm', 'nië', 'kri'},
+    },
+    'da_DK': {
+        'day': {'mandag', 'søndag', 'tirsdag', 'onsdag', 'torsdag', 'fredag',
+                'lørdag'},
+        'dy': {'søn', 'tor', 'lør', 'ons', 'tir', 'man', 'fre'},
+        'month': {'januar', 'februar', 'marts', 'april', 'maj', 'juni', 'juli',
+                  'august', 'september', 'oktober', 'november', 'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'af_ZA': {
+        'day': {'saterdag', 'dinsdag', 'vrydag', 'sondag', 'maandag',
+                'donderdag', 'woensdag'},
+        'dy': {'vr', 'so', 'di', 'ma', 'do', 'wo', 'sa'},
+        'month': {'januarie', 'februarie', 'maart', 'april', 'mei', 'junie',
+                  'julie', 'augustus', 'september', 'oktober', 'november',
+                  'desember'},
+        'mon': {'jan', 'feb', 'mrt', 'apr', 'mei', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'vec_IT': {
+        'day': {'mèrcore', 'sabo', 'doménega', 'marti', 'vènare', 'luni',
+                'zoba'},
+        'dy': {'lun', 'dom', 'sab', 'zob', 'mèr', 'vèn', 'mar'},
+        'month': {'zenaro', 'febraro', 'marso', 'apriłe', 'majo', 'zunjo',
+                  'lujo', 'agosto', 'setenbre', 'otobre', 'novenbre',
+                  'desenbre'},
+        'mon': {'zen', 'feb', 'mar', 'apr', 'maj', 'zun', 'luj', 'ago', 'set',
+                'oto', 'nov', 'des'},
+    },
+    'mk_MK': {
+        'day': {'среда', 'вторник', 'петок', 'четврток', 'сабота', 'недела',
+                'понеделник'},
+        'dy': {'пон', 'саб', 'пет', 'нед', 'вто', 'чет', 'сре'},
+        'month': {'јануари', 'февруари', 'март', 'април', 'мај', 'јуни', 'јули',
+                  'август', 'септември', 'октомври', 'ноември', 'декември'},
+        'mon': {'јан', 'фев', 'мар', 'апр', 'мај', 'јун', 'јул', 'авг', 'сеп',
+                'окт', 'ное', 'дек'},
+    },
+    'en_GB': {
+    },
+    'fr_ML': {
+    },
+    'zu_ZA': {
+        'day': {'lwesibili', 'sonto', 'lwesihlanu', 'msombuluko', 'lwesithathu',
+                'mgqibelo', 'lwesine'},
+        'dy': {'tha', 'sin', 'hla', 'bil', 'mso', 'mgq', 'son'},
+        'month': {'januwari', 'februwari', 'mashi', 'apreli', 'meyi', 'juni',
+                  'julayi', 'agasti', 'septemba', 'okthoba', 'novemba',
+                  'disemba'},
+        'mon': {'jan', 'feb', 'mas', 'apr', 'mey', 'jun', 'jul', 'aga', 'sep',
+                'okt', 'nov', 'dis'},
+    },
+    'ti_ER': {
+        'day': {'ሓሙስ', 'ቀዳም', 'ሮቡዕ', 'ዓርቢ', 'ሰሉስ', 'ሶኒ', 'ሰንበት'},
+        'dy': {'ሓሙስ', 'ቀዳም', 'ሮቡዕ', 'ዓርቢ', 'ሰሉስ', 'ሶኒ', 'ሰንበት'},
+        'month': {'ጥሪ', 'ለካቲት', 'መጋቢት', 'ሚያዚያ', 'ግንቦት', 'ሰነ', 'ሓምለ', 'ነሓሰ',
+                  'መስከረም', 'ጥቅምቲ', 'ሕዳር', 'ታሕሳስ'},
+        'mon': {'ጥሪ', 'ለካቲት', 'መጋቢት', 'ሚያዚያ', 'ግንቦት', 'ሰነ', 'ሓምለ', 'ነሓሰ',
+                'መስከረም', 'ጥቅምቲ', 'ሕዳር', 'ታሕሳስ'},
+    },
+    'beq_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'kab_DZ': {
+        'day': {'kuẓass', 'sḍisass', 'yanass', 'sanass', 'kraḍass', 'samass',
+                'sayass'},
+        'dy': {'san', 'yan', 'kuẓ', 'kraḍ', 'say', 'sḍis', 'sam'},
+        'month': {'yennayer', 'fuṛar', 'meɣres', 'yebrir', 'mayyu', 'yunyu',
+                  'yulyu', 'ɣuct', 'ctembeṛ', 'tubeṛ', 'nunembeṛ', 'duǧembeṛ'},
+        'mon': {'yen', 'fur', 'meɣ', 'yeb', 'may', 'yun', 'yul', 'ɣuc', 'cte',
+                'tub', 'nun', 'duǧ'},
+    },
+    'ar_AE': {
+    },
+    'oc_FR': {
+        'day': {'dimars', 'divendres', 'diluns', 'dimècres', 'dijòus',
+                'disabte', 'dimenge'},
+        'dy': {'dimars', 'divendres', 'diluns', 'dimècres', 'dijòus', 'disabte',
+               'dimenge'},
+        'month': {'genièr', 'febrièr', 'març', 'abril', 'mai', 'junh', 'julhet',
+                  'agost', 'setembre', 'octòbre', 'novembre', 'decembre'},
+        'mon': {'genièr', 'febrièr', 'març', 'abril', 'mai', 'junh', 'julhet',
+                'agost', 'setembre', 'octòbre', 'novembre', 'decembre'},
+    },
+    'en_NA': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'haw_US': {
+        'day': {'poʻakolu', 'poʻahā', 'poʻalua', 'poʻalima', 'poʻaono',
+                'lāpule', 'poʻakahi'},
+        'dy': {'p4', 'p2', 'p3', 'lp', 'p6', 'p5', 'p1'},
+        'month': {'ianuali', 'pepeluali', 'malaki', 'ʻapelila', 'mei', 'iune',
+                  'iulai', 'ʻaukake', 'kepakemapa', 'ʻokakopa', 'nowemapa',
+                  'kekemapa'},
+        'mon': {'ian.', 'pep.', 'mal.', 'ʻap.', 'mei', 'iun.', 'iul.', 'ʻauk.',
+                'kep.', 'ʻok.', 'now.', 'kek.'},
+    },
+    'tg_TJ': {
+        'day': {'якшанбе', 'ҷумъа', 'шанбе', 'душанбе', 'чоршанбе', 'панҷшанбе',
+                'сешанбе'},
+        'dy': {'якш', 'пан', 'ҷум', 'сеш', 'шан', 'чор', 'душ'},
+        'month': {'январ', 'феврал', 'март', 'апрел', 'май', 'июн', 'июл',
+                  'август', 'сентябр', 'октябр', 'ноябр', 'декабр'},
+        'mon': {'янв', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен',
+                'окт', 'ноя', 'дек'},
+    },
+    'hi_IN': {
+        'day': {'गुरुवार', 'शनिवार', 'बुधवार', 'सॊमवार्', 'रविवार', 'मंगलवार',
+                'शुक्रवार'},
+        'dy': {'शनि.', 'सॊम.', 'रवि.', 'मंगल.', 'बुध.', 'गुरु.', 'शुक्र.'},
+        'month': {'जनवरी', 'फरवरी', 'मार्च', 'अप्रॆल', 'मई', 'जून', 'जुलाइ',
+                  'अगस्त', 'सितंबर', 'अक्तॊबर', 'नवंबर', 'दिसंबर'},
+        'mon': {'जनवरी.', 'फरवरी.', 'मार्च.', 'अप्रॆल.', 'मई.', 'जून.',
+                'जुलाइ.', 'अगस्त.', 'सितंबर.', 'अक्तॊबर.', 'नवंबर.',
+                'दिसेंबर.'},
+    },
+    'et_EE': {
+        'day': {'pühapäev', 'kolmapäev', 'neljapäev', 'teisipäev', 'reede',
+                'esmaspäev', 'laupäev'},
+        'dy': {'t', 'k', 'e', 'r', 'n', 'l', 'p'},
+        'month': {'jaanuar', 'veebruar', 'märts', 'aprill', 'mai', 'juuni',
+                  'juuli', 'august', 'september', 'oktoober', 'november',
+                  'detsember'},
+        'mon': {'jaan', 'veebr', 'märts', 'apr', 'mai', 'juuni', 'juuli', 'aug',
+                'sept', 'okt', 'nov', 'dets'},
+    },
+    'gu_IN': {
+        'day': {'બુધવાર', 'રવિવાર', 'મંગળવાર', 'સોમવાર', 'શુક્રવાર', 'શનિવાર',
+                'ગુરુવાર'},
+        'dy': {'બુધ', 'રવિ', 'શનિ', 'મંગળ', 'સોમવાર', 'ગુરુ', 'શુક્ર'},
+        'month': {'જાન્યુઆરી', 'ફેબ્રુઆરી', 'માર્ચ', 'એપ્રિલ', 'મે', 'જૂન',
+                  'જુલાઇ', 'ઑગસ્ટ', 'સપ્ટેમ્બર', 'ઑક્ટોબર', 'નવેમ્બર',
+                  'ડિસેમ્બર'},
+        'mon': {'જાન', 'ફેબ', 'માર્ચ', 'એપ્રિલ', 'મે', 'જૂન', 'જુલ', 'ઑગ',
+                'સપ્ટ', 'ઑક્ટ', 'નવ', 'ડિસ'},
+    },
+    'cv_RU': {
+        'day': {'эрнекун', 'кĕçнерникун', 'тунтикун', 'юнкун', 'ытларикун',
+                'вырсарникун', 'шăматкун'},
+        'dy': {'юн', 'вр', 'эр', 'тн', 'шм', 'ыт', 'кç'},
+        'month': {'кăрлач', 'нарăс', 'пуш', 'ака', 'çу', 'çĕртме', 'утă',
+                  'çурла', 'авăн', 'юпа', 'чӳк', 'раштав'},
+        'mon': {'кăр', 'нар', 'пуш', 'ака', 'çу', 'çĕр', 'утă', 'çур', 'авн',
+                'юпа', 'чӳк', 'раш'},
+    },
+    'la_VA': {
+        'day': {'mercurii dies', 'martis dies', 'sabbatum', 'iovis dies',
+                'dominicus dies', 'veneris dies', 'lunae dies'},
+        'dy': {'iov', 'ven', 'lun', 'dom', 'mer', 'sab', 'mar'},
+        'month': {'ianuarius', 'februarius', 'martius', 'aprilis', 'maius',
+                  'iunius', 'iulius', 'augustus', 'september', 'october',
+                  'november', 'december'},
+        'mon': {'ian', 'feb', 'mar', 'apr', 'mai', 'iun', 'iul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'es_GT': {
+    },
+    'af_NA': {
+    },
+    'shs_CA': {
+        'day': {"spetkesq't", "stselkstesq't", "smesesq't", "skellesq't",
+                "sxetspesq't", "selesq't", "stqmekstesq't"},
+        'dy': {'ske', 'spe', 'sxe', 'sme', 'sel', 'sts', 'stq'},
+        'month': {"pellkwet'min", "pelctsipwen'ten", "pellsqe'pts",
+                  "peslle'wten", "pell7ell7e'7llqten", "pelltspe'ntsk",
+                  "pelltqwelq'we'l't", "pellct'e'xel'cten", "pesqelqle'lten",
+                  "pesllwe'lsten", "pellc7ell7u'7llcwten'", "pelltete'tq'em"},
+        'mon': {'kwe ', 'tsi', 'sqe', "e'w", 'ell', 'tsp', 'tqw', "ct'", 'qel',
+                'wel', 'u7l', 'tet'},
+    },
+    'en_PH': {
+    },
+    'yi_US': {
+        'day': {'מיטװאָך', 'שבת', 'פֿרײַטיק', 'דאָנערשטיק', 'מאָנטיק',
+                'דינסטיק', 'זונטיק'},
+        'dy': {"פֿרײַ'", "מיט'", "מאָנ'", "דאָנ'", "זונ'", 'שבת', "דינ'"},
+        'month': {'יאַנואַר', 'פֿעברואַר', 'מאַרץ', 'אַפּריל', 'מײַ', 'יוני',
+                  'יולי', 'אױגוסט', 'סעפּטעמבער', 'אָקטאָבער', 'נאָװעמבער',
+                  'דעצעמבער'},
+        'mon': {'יאַנ', 'פֿעב', 'מאַר', 'אַפּר', 'מײַ', 'יונ', 'יול', 'אױג',
+                'סעפּ', 'אָקט', 'נאָװ', 'דעצ'},
+    },
+    'fr_BF': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'ven', 'jeu', 'lun', 'dim', 'mer', 'sam', 'mar'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'jan', 'fév', 'mar', 'avr', 'mai', 'jun', 'jul', 'aoû', 'sep',
+                'oct', 'nov', 'déc'},
+    },
+    'ny_MW': {
+        'day': {'lachinayi', 'lamulungu', 'lachisanu', 'lachitatu', 'loweruka',
+                'lolemba', 'lachiwiri'},
+        'dy': {'san', 'nai', 'wir', 'lem', 'tat', 'mul', 'wer'},
+        'month': {'januwale', 'febuluwale', 'malichi', 'epulo', 'mei', 'juni',
+                  'julai', 'ogasiti', 'seputemba', 'okutoba', 'novemba',
+                  'disemba'},
+        'mon': {'jan', 'feb', 'mal', 'epu', 'mei', 'jun', 'jul', 'oga', 'sep',
+                'oku', 'nov', 'dis'},
+    },
+    'ast_ES': {
+        'day': {'llunes', 'miércoles', 'vienres', 'martes', 'domingu', 'xueves',
+                'sábadu'},
+        'dy': {'vie', 'llu', 'dom', 'mié', 'sáb', 'xue', 'mar'},
+        'month': {'xineru', 'febreru', 'marzu', 'abril', 'mayu', 'xunu',
+                  'xunetu', 'agostu', 'setiembre', 'ochobre', 'payares',
+                  'avientu'},
+        'mon': {'xin', 'feb', 'mar', 'abr', 'may', 'xun', 'xnt', 'ago', 'set',
+                'och', 'pay', 'avi'},
+    },
+    'fr_LU': {
+    },
+    'nso_ZA': {
+        'day': {'sontaga', 'mosupalogo', 'labone', 'mokibelo', 'labobedi',
+                'laboraro', 'labohlano'},
+        'dy': {'rar', 'hla', 'mos', 'mok', 'bed', 'son', 'ne'},
+        'month': {'janaware', 'feberware', 'matšhe', 'aporele', 'mei', 'june',
+                  'julae', 'agostose', 'setemere', 'oktobore', 'nofemere',
+                  'disemere'},
+        'mon': {'jan', 'feb', 'mat', 'apo', 'mei', 'jun', 'jul', 'ago', 'set',
+                'okt', 'nof', 'dis'},
+    },
+    'en_CA': {
+    },
+    'min_ID': {
+        'day': {'satu', 'sinayan', 'jumaik', 'salasa', 'rabaa', 'akaik',
+                'kamih'},
+        'dy': {'kam', 'jum', 'sat', 'sal', 'sin', 'aka', 'rab'},
+        'month': {'yunari', 'pebruari', 'maret', 'april', 'mai', 'juni', 'juli',
+                  'agustus', 'september', 'oktober', 'november', 'desember'},
+        'mon': {'yun', 'peb', 'mar', 'apr', 'mai', 'jun', 'jul', 'agu', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'ug_CN': {
+        'day': {'چارشەنبە', 'سەيشەنبە', 'دۈشەنبە', 'يەكشەنبە', 'جۈمە', 'شەنبە',
+                'پەيشەنبە'},
+        'dy': {'ش', 'چ', 'پ', 'ج', 'ي', 'د', 'س'},
+        'month': {'قەھرىتان', 'ھۇت', 'نەۋرۇز', 'ئۇمۇت', 'باھار', 'سەپەر',
+                  'چىللە', 'تومۇز', 'مىزان', 'ئوغۇز', 'ئوغلاق', 'كۆنەك'},
+        'mon': {'قەھرىتان', 'ھۇت', 'نەۋرۇز', 'ئۇمۇت', 'باھار', 'سەپەر', 'چىللە',
+                'تومۇز', 'مىزان', 'ئوغۇز', 'ئوغلاق', 'كۆنەك'},
+    },
+    'es_VE': {
+    },
+    'bo_CN': {
+        'day': {'གཟའ་ཉི་མ་', 'གཟའ་པ་སངས་', 'གཟའ་སྤེན་པ་', 'གཟའ་ཟླ་བ་',
+                'གཟའ་ཕུར་བུ་', 'གཟའ་ལྷག་པ་', 'གཟའ་མིག་དམར་'},
+        'dy': {'ཕུར་', 'ཟླ་', 'ཉི་', 'སྤེན་', 'མིར་', 'སངས་', 'ལྷག་'},
+        'month': {'སྤྱི་ཟླཝ་དངཔ་', 'སྤྱི་ཟླཝ་གཉིས་པ་', 'སྤྱི་ཟླཝ་གསུམ་པ་',
+                  'སྤྱི་ཟླཝ་བཞི་པ་', 'སྤྱི་ཟླཝ་ལྔ་པ་', 'སྤྱི་ཟླཝ་དྲུག་པ་',
+                  'སྤྱི་ཟླཝ་བདུན་པ་', 'སྤྱི་ཟླཝ་བརྒྱད་པ་', 'སྤྱི་ཟླཝ་དགུ་པ་',
+                  'སྤྱི་ཟླཝ་བཅུ་པ་', 'སྤྱི་ཟླཝ་བཅུ་གཅིག་པ་',
+                  'སྤྱི་ཟླཝ་བཅུ་གཉིས་པ་'},
+        'mon': {'ཟླ་ ༡', 'ཟླ་ ༢', 'ཟླ་ ༣', 'ཟླ་ ༤', 'ཟླ་ ༥', 'ཟླ་ ༦', 'ཟླ་ ༧',
+                'ཟླ་ ༨', 'ཟླ་ ༩', 'ཟླ་ ༡༠', 'ཟླ་ ༡༡', 'ཟླ་ ༡༢'},
+    },
+    'kl_GL': {
+        'day': {'marlunngorneq', 'arfininngorneq', 'ataasinngorneq', 'sabaat',
+                'pingasunngorneq', 'sisamanngorneq', 'tallimanngorneq'},
+        'dy': {'ata', 'pin', 'tal', 'arf', 'sab', 'mar', 'sis'},
+        'month': {'januari', 'februari', 'martsi', 'aprili', 'maji', 'juni',
+                  'juli', 'augustusi', 'septemberi', 'oktoberi', 'novemberi',
+                  'decamberi'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'he_IL': {
+        'day': {'שני', 'חמישי', 'שלישי', 'שבת', 'ראשון', 'שישי', 'רביעי'},
+        'dy': {'ד', 'ג', 'א', 'ב', 'ו', 'ה', 'ש'},
+        'month': {'ינואר', 'פברואר', 'מרץ', 'אפריל', 'מאי', 'יוני', 'יולי',
+                  'אוגוסט', 'ספטמבר', 'אוקטובר', 'נובמבר', 'דצמבר', 'ניסן',
+                  'אייר', 'סיון', 'תמוז', 'אב', 'אלול', 'תשרי', 'חשון', 'כסלו',
+                  'טבת', 'שבט', 'אדר', 'אדר-ב'},
+        'mon': {'ינו', 'פבר', 'מרץ', 'אפר', 'מאי', 'יוני', 'יולי', 'אוג', 'ספט',
+                'אוק', 'נוב', 'דצמ', 'ניסן', 'אייר', 'סיון', 'תמוז', 'אב',
+                'אלול', 'תשרי', 'חשון', 'כסלו', 'טבת', 'שבט', 'אדר', 'אדר-ב'},
+    },
+    'om_ET': {
+        'day': {'roobii', 'jimaata', 'sanbat-xiqqaa', 'wiixata', 'dilbata',
+                'kibxata', 'kamisa'},
+        'dy': {'dil', 'kam', 'san', 'kib', 'rob', 'jim', 'wix'},
+        'month': {'amajjii', 'gurraandhala', 'bitootessa', 'caamsaa', 'ebla',
+                  'waxabajjii', 'adoolessa', 'hagayya ', 'fulbaana',
+                  'onkoloolessa ', 'sadaasa', 'muddee'},
+        'mon': {'amj', 'gur', 'bit', 'cam', 'ebl', 'wax', 'ado', 'hag', 'ful',
+                'onk', 'sad', 'mud'},
+    },
+    'ur_PK': {
+        'day': {'منگل', 'جمعرات', 'جمعہ', 'اتوار', 'بده', 'ہفتہ', 'پير'},
+        'dy': {'م', 'پ', 'ہ', 'ب', 'ا', 'ج'},
+        'month': {'جنوری', 'فروری', 'مار چ', 'اپريل', 'مئ', 'جون', 'جولائ',
+                  'اگست', 'ستمبر', 'اکتوبر', 'نومبر', 'دسمبر'},
+        'mon': {'ج', 'ف', 'م', 'ا', 'م', 'ج', 'ج', 'ا', 'س', 'ا', 'ن', 'د'},
+    },
+    'de_LU': {
+        'day': {'dienstag', 'freitag', 'mittwoch', 'montag', 'samstag',
+                'sonntag', 'donnerstag'},
+        'dy': {'mo', 'mi', 'so', 'di', 'fr', 'do', 'sa'},
+        'month': {'januar', 'februar', 'märz', 'april', 'mai', 'juni', 'juli',
+                  'august', 'september', 'oktober', 'november', 'dezember'},
+        'mon': {'jan', 'feb', 'mrz', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dez'},
+    },
+    'lb_LU': {
+        'day': {'sonndeg', 'samschdeg', 'méindeg', 'freideg', 'dënschdeg',
+                'donneschdeg', 'mëttwoch'},
+        'dy': {'më', 'so', 'dë', 'fr', 'méi', 'do', 'sa'},
+        'month': {'januar', 'februar', 'mäerz', 'abrëll', 'mee', 'juni', 'juli',
+                  'august', 'september', 'oktober', 'november', 'dezember'},
+        'mon': {'jan', 'feb', 'mrz', 'abr', 'mee', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dez'},
+    },
+    'vi_VN': {
+        'day': {'thứ sáu', 'thứ ba', 'thứ tư', 'thứ hai', 'thứ bảy', 'chủ nhật',
+                'thứ năm'},
+        'dy': {'thứ sáu', 'thứ ba', 'thứ tư', 'thứ hai', 'thứ bảy', 'chủ nhật',
+               'thứ năm'},
+        'month': {'tháng 01', 'tháng 02', 'tháng 03', 'tháng 04', 'tháng 05',
+                  'tháng 06', 'tháng 07', 'tháng 08', 'tháng 09', 'tháng 10',
+                  'tháng 11', 'tháng 12'},
+        'mon': {'tháng 01', 'tháng 02', 'tháng 03', 'tháng 04', 'tháng 05',
+                'tháng 06', 'tháng 07', 'tháng 08', 'tháng 09', 'tháng 10',
+                'tháng 11', 'tháng 12'},
+    },
+    'mdw_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'ar_OM': {
+        'day': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الإثنين', 'السبت',
+                'الخميس'},
+        'dy': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الإثنين', 'السبت',
+               'الخميس'},
+        'month': {'يانير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو',
+                  'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر'},
+        'mon': {'يانير', 'فبراير', 'مارس', 'أبريل', 'مايو', 'يونيو', 'يوليو',
+                'أغسطس', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر'},
+    },
+    'cs_CZ': {
+        'day': {'úterý', 'neděle', 'čtvrtek', 'pátek', 'pondělí', 'středa',
+                'sobota'},
+        'dy': {'so', 'pá', 'po', 'út', 'st', 'ne', 'čt'},
+        'month': {'leden', 'únor', 'březen', 'duben', 'květen', 'červen',
+                  'červenec', 'srpen', 'září', 'říjen', 'listopad', 'prosinec'},
+        'mon': {'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+                'xi', 'xii'},
+    },
+    'es_HN': {
+    },
+    'rue_SK': {
+        'day': {'понедїлёк', 'пятніця', 'віторок', 'четверь', 'середа',
+                'недїля', 'субота'},
+        'dy': {'сер', 'пон', 'віт', 'нед', 'суб', 'чет', 'пят'},
+        'month': {'януар', 'фебруар', 'марец', 'апріль', 'май', 'юн', 'юл',
+                  'авґуст', 'септембер', 'октобер', 'новембер', 'децембер'},
+        'mon': {'ян', 'феб', 'мар', 'апр', 'май', 'юн', 'юл', 'авґ', 'сеп',
+                'окт', 'нов', 'дец'},
+    },
+    'az_AZ': {
+        'day': {'bazar ertəsi', 'cümə axşamı', 'çərşənbə axşam', 'şənbə',
+                'bazar', 'çərşənbə'},
+        'dy': {'c.', 'c.a.', 'b.', 'ş.', 'b.e.', 'ç.', 'ç.a.'},
+        'month': {'yanvar', 'fevral', 'mart', 'aprel', 'may', 'i̇yun', 'i̇yul',
+                  'avqust', 'sentyabr', 'oktyabr', 'noyabr', 'dekabr'},
+        'mon': {'yan', 'fev', 'mar', 'apr', 'may', 'iyn', 'iyl', 'avq', 'sen',
+                'okt', 'noy', 'dek'},
+    },
+    'nl_NL': {
+        'day': {'zondag', 'dinsdag', 'zaterdag', 'maandag', 'donderdag',
+                'woensdag', 'vrijdag'},
+        'dy': {'vr', 'za', 'di', 'ma', 'do', 'wo', 'zo'},
+        'month': {'januari', 'februari', 'maart', 'april', 'mei', 'juni',
+                  'juli', 'augustus', 'september', 'oktober', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mrt', 'apr', 'mei', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'ar_SY': {
+    },
+    'te_IN': {
+        'day': {'శుక్రవార', 'సొమవార', 'గురువార', 'మంగళవార', 'రవివార', 'శనివార',
+                'బుధవార'},
+        'dy': {'శని.', 'శుక్ర.', 'బుధ.', 'రవి.', 'మంగళ.', 'గురు.', 'సొమ.'},
+        'month': {'జనవరి', 'ఫెబ్రಿ', 'మార్చ', 'ఏప్రెల్', 'మౕ', 'జూన్', 'జులాఇ',
+                  'అగస్ట', 'సెప్టంబర్', 'అక్టొబర్', 'నవెబర్', 'దిసేంబర్'},
+        'mon': {'జనవరి.', 'ఫెబ్రಿ.', 'మార్చ.', 'ఏప్రెల్.', 'మౕ.', 'జూన్.',
+                'జులాఇ.', 'అగస్ట.', 'సెప్టంబర్.', 'అక్టొబర్.', 'నవెబర్.',
+                'దిసేంబర్.'},
+    },
+    'hr_HR': {
+        'day': {'petak', 'četvrtak', 'nedjelja', 'subota', 'utorak', 'srijeda',
+                'ponedjeljak'},
+        'dy': {'uto', 'sri', 'pet', 'čet', 'sub', 'ned', 'pon'},
+        'month': {'siječanj', 'veljača', 'ožujak', 'travanj', 'svibanj',
+                  'lipanj', 'srpanj', 'kolovoz', 'rujan', 'listopad', 'studeni',
+                  'prosinac'},
+        'mon': {'sij', 'velj', 'ožu', 'tra', 'svi', 'lip', 'srp', 'kol', 'ruj',
+                'lis', 'stu', 'pro'},
+    },
+    'en_MY': {
+    },
+    'es_CO': {
+    },
+    'bkw_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'sv_SE': {
+        'day': {'söndag', 'lördag', 'onsdag', 'torsdag', 'fredag', 'måndag',
+                'tisdag'},
+        'dy': {'sö', 'to', 'må', 'ti', 'fr', 'on', 'lö'},
+        'month': {'januari', 'februari', 'mars', 'april', 'maj', 'juni', 'juli',
+                  'augusti', 'september', 'oktober', 'november', 'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'maj', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'en_ZW': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'myv_RU': {
+        'day': {'вастаньчи', 'атяньчи', 'сюконьчи', 'шлямоньчи', 'калчи',
+                'таргочи', 'куншкачи'},
+        'dy': {'шля', 'кал', 'кун', 'сюк', 'вас', 'атя', 'тар'},
+        'month': {'якшамков', 'даволков', 'эйзюрков', 'чадыков', 'панжиков',
+                  'аштемков', 'медьков', 'умарьков', 'таштамков', 'ожоков',
+                  'сундерьков', 'ацамков'},
+        'mon': {'якш', 'дав', 'эйз', 'чад', 'пан', 'ашт', 'мед', 'ума', 'таш',
+                'ожо', 'сун', 'аца'},
+    },
+    'en_TT': {
+        'day': {'tuesday', 'friday', 'saturday', 'thursday', 'sunday', 'monday',
+                'wednesday'},
+        'dy': {'thu', 'tue', 'mon', 'sat', 'wed', 'sun', 'fri'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'es_BO': {
+    },
+    'fur_IT': {
+        'day': {'lunis', 'martars', 'domenie', 'sabide', 'miercus', 'vinars',
+                'joibe'},
+        'dy': {'joi', 'mie', 'lun', 'dom', 'vin', 'sab', 'mar'},
+        'month': {'zenâr', 'fevrâr', 'març', 'avrîl', 'mai', 'jugn', 'lui',
+                  'avost', 'setembar', 'otubar', 'novembar', 'dicembar'},
+        'mon': {'zen', 'fev', 'mar', 'avr', 'mai', 'jug', 'lui', 'avo', 'set',
+                'otu', 'nov', 'dic'},
+    },
+    'nb_NO': {
+    },
+    'es_NI': {
+    },
+    'fr_BJ': {
+    },
+    'uz_UZ': {
+        'day': {'payshanba', 'yakshanba', 'juma', 'chorshanba', 'shanba',
+                'seshanba', 'dushanba'},
+        'dy': {'jum', 'shan', 'pay', 'sesh', 'yaksh', 'dush', 'chor'},
+        'month': {'yanvar', 'fevral', 'mart', 'aprel', 'may', 'iyun', 'iyul',
+                  'avgust', 'sentabr', 'oktabr', 'noyabr', 'dekabr'},
+        'mon': {'yanv', 'fev', 'mart', 'apr', 'may', 'iyun', 'iyul', 'avg',
+                'sen', 'okt', 'noy', 'dek'},
+    },
+    'xku_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'nzawi', 'febiyo', 'masa', 'ave', 'mayi', 'nzwi', 'nzwiyet',
+                  'awu', 'septemba', 'oktoba', 'novamba', 'desamba'},
+        'mon': {'nza', 'feb', 'mas', 'ave', 'may', 'nzwi', 'nzt', 'awu', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'fr_NE': {
+    },
+    'id_ID': {
+        'day': {'selasa', 'sabtu', 'senin', 'rabu', 'jumat', 'minggu', 'kamis'},
+        'dy': {'kam', 'jum', 'sen', 'min', 'sab', 'rab', 'sel'},
+        'month': {'januari', 'februari', 'maret', 'april', 'mei', 'juni',
+                  'juli', 'agustus', 'september', 'oktober', 'november',
+                  'desember'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'mei', 'jun', 'jul', 'agu', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'fr_CI': {
+    },
+    'njy_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'sr_Latn_ME': {
+    },
+    'ia': {
+        'day': {'mercuridi', 'venerdi', 'martedi', 'lunedi', 'dominica',
+                'jovedi', 'sabbato'},
+        'dy': {'ven', 'jov', 'lun', 'dom', 'mer', 'sab', 'mar'},
+        'month': {'januario', 'februario', 'martio', 'april', 'maio', 'junio',
+                  'julio', 'augusto', 'septembre', 'octobre', 'novembre',
+                  'decembre'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec'},
+    },
+    'th_TH': {
+        'day': {'จันทร์', 'อังคาร', 'อาทิตย์', 'เสาร์', 'พฤหัสบดี', 'ศุกร์',
+                'พุธ'},
+        'dy': {'พ.', 'อ.', 'ส.', 'ศ.', 'พฤ.', 'อา.', 'จ.'},
+        'month': {'มกราคม', 'กุมภาพันธ์', 'มีนาคม', 'เมษายน', 'พฤษภาคม',
+                  'มิถุนายน', 'กรกฎาคม', 'สิงหาคม', 'กันยายน', 'ตุลาคม',
+                  'พฤศจิกายน', 'ธันวาคม'},
+        'mon': {'ม.ค.', 'ก.พ.', 'มี.ค.', 'เม.ย.', 'พ.ค.', 'มิ.ย.', 'ก.ค.',
+                'ส.ค.', 'ก.ย.', 'ต.ค.', 'พ.ย.', 'ธ.ค.'},
+    },
+    'my_MM': {
+        'day': {'သောကြာ', 'အင်္ဂါ', 'ကြာသပတေး', 'စနေ', 'ဗုဒ္ဓဟူး', 'တနင်္လာ',
+                'တနင်္ဂနွေ'},
+        'dy': {'ကြာ', 'တေး', 'ဟူး', 'ဂါ', 'နေ', 'လာ', 'နွေ'},
+        'month': {'ဇန်နဝါရီ', 'ဖေဖော်ဝါရီ', 'မတ်', 'ဧပြီ', 'မေ', 'ဇွန်',
+                  'ဇူလိုင်', 'ဩဂုတ်', 'စက်တင်ဘာ', 'အောက်တိုဘာ', 'နိုဝင်ဘာ',
+                  'ဒီဇင်ဘာ'},
+        'mon': {'ဇန်', 'ဖေ', 'မတ်', 'ဧပြီ', 'မေ', 'ဇွန်', 'ဇူ', 'ဩ', 'စက်',
+                'အောက်', 'နို', 'ဒီ'},
+    },
+    'zh_TW': {
+        'month': {'一月', '二月', '三月', '四月', '五月', '六月', '七月', '八月', '九月', '十月',
+                  '十一月', '十二月', '一月', '二月', '三月', '四月', '五月', '六月', '七月', '八月',
+                  '九月', '十月', '十一月', '十二月'},
+        'mon': {'1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月', '9月', '10月',
+                '11月', '12月', '1月', '2月', '3月', '4月', '5月', '6月', '7月', '8月',
+                '9月', '10月', '11月', '12月'},
+    },
+    'bn_IN': {
+        'day': {'মঙ্গলবার', 'শুক্রবার', 'বুধবার', 'বৃহস্পতিবার', 'শনিবার',
+                'সোমবার', 'রবিবার'},
+        'dy': {'সোম', 'রবি', 'বুধ', 'বৃহস্পতি', 'শুক্র', 'শনি', 'মঙ্গল'},
+        'month': {'জানুয়ারি', 'ফেব্রুয়ারি', 'মার্চ', 'এপ্রিল', 'মে', 'জুন',
+                  'জুলাই', 'আগস্ট', 'সেপ্টেম্বার', 'অক্টোবার', 'নভেম্বার',
+                  'ডিসেম্বার'},
+        'mon': {'জান', 'ফেব', 'মার্চ', 'এপ্র', 'মে', 'জুন', 'জুল', 'আগ', 'সেপ',
+                'অক্ট', 'নভেম', 'ডিস'},
+    },
+    'ru_RU': {
+        'day': {'воскресенье', 'среда', 'четверг', 'вторник', 'понедельник',
+                'пятница', 'суббота'},
+        'dy': {'вс', 'вт', 'сб', 'пн', 'пт', 'чт', 'ср'},
+        'month': {'январь', 'февраль', 'март', 'апрель', 'май', 'июнь', 'июль',
+                  'август', 'сентябрь', 'октябрь', 'ноябрь', 'декабрь'},
+        'mon': {'янв', 'фев', 'мар', 'апр', 'май', 'июн', 'июл', 'авг', 'сен',
+                'окт', 'ноя', 'дек'},
+    },
+    'ar_DZ': {
+        'day': {'الأحد', 'الثلاثاء', 'الأربعاء', 'الجمعة', 'الاثنين', 'السبت',
+                'الخميس'},
+        'dy': {'ث', 'خ', 'ج', 'ح', 'ن', 'س', 'ر'},
+        'month': {'جانفي', 'فيفري', 'مارس', 'أفريل', 'ماي', 'جوان', 'جويلية',
+                  'أوت', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر', 'محرم', 'صفر',
+                  'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى', 'جمادى الآخرة',
+                  'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة', 'ذو الحجة'},
+        'mon': {'جانفي', 'فيفري', 'مارس', 'أفريل', 'ماي', 'جوان', 'جويلية',
+                'أوت', 'سبتمبر', 'أكتوبر', 'نوفمبر', 'ديسمبر', 'محرم', 'صفر',
+                'ربيع الأول', 'ربيع الآخر', 'جمادى الأولى', 'جمادى الآخرة',
+                'رجب', 'شعبان', 'رمضان', 'شوال', 'ذو القعدة', 'ذو الحجة'},
+    },
+    'lt_LT': {
+        'day': {'antradienis', 'trečiadienis', 'pirmadienis', 'šeštadienis',
+                'penktadienis', 'sekmadienis', 'ketvirtadienis'},
+        'dy': {'sk', 'tr', 'kt', 'pn', 'pr', 'an', 'št'},
+        'month': {'sausis', 'vasaris', 'kovas', 'balandis', 'gegužė',
+                  'birželis', 'liepa', 'rugpjūtis', 'rugsėjis', 'spalis',
+                  'lapkritis', 'gruodis'},
+        'mon': {'sau', 'vas', 'kov', 'bal', 'geg', 'bir', 'lie', 'rgp', 'rgs',
+                'spl', 'lap', 'grd'},
+    },
+    'hu_HU': {
+        'day': {'szombat', 'hétfő', 'kedd', 'péntek', 'szerda', 'csütörtök',
+                'vasárnap'},
+        'dy': {'sze', 'k', 'h', 'p', 'szo', 'cs', 'v'},
+        'month': {'január', 'február', 'március', 'április', 'május', 'június',
+                  'július', 'augusztus', 'szeptember', 'október', 'november',
+                  'december'},
+        'mon': {'i.', 'ii.', 'iii.', 'iv.', 'v.', 'vi.', 'vii.', 'viii.', 'ix.',
+                'x.', 'xi.', 'xii.'},
+    },
+    'en_LK': {
+    },
+    'axk_CG': {
+        'day': {'dimanche', 'samedi', 'vendredi', 'lundi', 'mercredi', 'mardi',
+                'jeudi'},
+        'dy': {'dim.', 'ven.', 'lun.', 'jeu.', 'mar.', 'sam.', 'mer.'},
+        'month': {'janvier', 'février', 'mars', 'avril', 'mai', 'juin',
+                  'juillet', 'août', 'septembre', 'octobre', 'novembre',
+                  'décembre'},
+        'mon': {'janv.', 'févr.', 'mars', 'avr.', 'mai', 'juin', 'juil.',
+                'août', 'sept.', 'oct.', 'nov.', 'déc.'},
+    },
+    'ko_KR': {
+        'day': {'목요일', '수요일', '日曜日', '月曜日', '水曜日', '火曜日', '일요일', '금요일', '土曜日',
+                '木曜日', '金曜日', '토요일', '월요일', '화요일'},
+        'dy': {'토', '일', '月', '木', '목', '金', '土', '화', '日', '水', '火', '금', '수',
+               '월'},
+        'month': {'january', 'february', 'march', 'april', 'may', 'june',
+                  'july', 'august', 'september', 'october', 'november',
+                  'december', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10',
+                  '11', '12', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10',
+                  '11', '12'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep',
+                'oct', 'nov', 'dec', '1', '2', '3', '4', '5', '6', '7', '8',
+                '9', '10', '11', '12', '1', '2', '3', '4', '5', '6', '7', '8',
+                '9', '10', '11', '12'},
+    },
+    'ss_ZA': {
+        'day': {'umgcibelo', 'lisontfo', 'lesibili', 'lesihlanu', 'umsombuluko',
+                'lesine', 'lesitsatfu'},
+        'dy': {'tsa', 'hla', 'bil', 'mso', 'son', 'ne', 'mgc'},
+        'month': {'bhimbidvwane', 'indlovana', 'indlovu-lenkhulu', 'mabasa',
+                  'inkhwekhweti', 'inhlaba', 'kholwane', 'ingci', 'inyoni',
+                  'imphala', 'lweti', 'ingongoni'},
+        'mon': {'bhi', 'van', 'vol', 'mab', 'nkh', 'nhl', 'kho', 'ngc', 'nyo',
+                'mph', 'lwe', 'ngo'},
+    },
+    'bm_ML': {
+        'day': {'sibiri', 'ntɛnɛ', 'kari', 'alamisa', 'juma', 'araba',
+                'tarata'},
+        'dy': {'jum', 'ntɛ', 'ara', 'ala', 'kar', 'tar', 'sib'},
+        'month': {'zanwuye', 'feburuye', 'marisi', 'awirili', 'mɛ', 'zuwɛn',
+                  'zuluye', 'uti', 'sɛtanburu', 'ɔkutɔburu', 'nowanburu',
+                  'desanburu'},
+        'mon': {'zan', 'feb', 'mar', 'awi', 'mɛ', 'zuw', 'zul', 'uti', 'sɛt',
+                'ɔku', 'now', 'des'},
+    },
+    'fy_NL': {
+        'day': {'moandei', 'freed', 'woansdei', 'sneon', 'tongersdei', 'snein',
+                'tiisdei'},
+        'dy': {'ton', 'sno', 'woa', 'tii', 'sne', 'fre', 'moa'},
+        'month': {'jannewaris', 'febrewaris', 'maart', 'april', 'maaie', 'juny',
+                  'july', 'augustus', 'septimber', 'oktober', 'novimber',
+                  'desimber'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'mai', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'des'},
+    },
+    'es_PY': {
+    },
+    'ar_LY': {
+    },
+    'cu_RU': {
+        'day': {'пѧто́къ', 'четверто́къ', 'среда̀', 'сꙋббѡ́та', 'недѣ́лѧ',
+                'понедѣ́льникъ', 'вто́рникъ'},
+        'dy': {'вт', 'сб', 'пн', 'нд', 'пт', 'чт', 'ср'},
+        'month': {'і҆аннꙋа́рїй', 'феврꙋа́рїй', 'ма́ртъ', 'а҆прі́лїй',
+                  'ма́їй', 'і҆ꙋ́нїй', 'і҆ꙋ́лїй', 'а҆́ѵгꙋстъ', 'септе́мврїй',
+                  'ѻ҆ктѡ́врїй', 'ное́мврїй', 'деке́мврїй'},
+        'mon': {'і҆ан.', 'февр.', 'ма́ртъ', 'а҆пр.', 'ма́їй', 'і҆ꙋ́нїй',
+                'і҆ꙋ́лїй', 'а҆́ѵг.', 'септ.', 'ѻ҆кт.', 'ное́м.', 'дек.'},
+    },
+    'en_BW': {
+    },
+    'dde_CG': {
+        'day': {'kiminzole', 'kilendi', 'kimiya', 'kisabala', 'kimitanu',
+                'kilumingu', 'kibitatu'},
+        'dy': {'bit', 'min', 'lum', 'len', 'sab', 'mit', 'miy'},
+        'month': {'yanviya', 'febwaaliya', 'malasa', 'aapila', 'maayi', 'yuuni',
+                  'yuuli', 'aawutu', 'sepetemba', 'okotoba', 'novemba',
+                  'desemba'},
+        'mon': {'yan', 'feb', 'mal', 'aap', 'maay', 'yuun', 'yuul', 'aaw',
+                'sep', 'oko', 'nov', 'des'},
+    },
+    'pt_PT': {
+        'day': {'segunda-feira', 'sábado', 'domingo', 'terça-feira',
+                'sexta-feira', 'quarta-feira', 'quinta-feira'},
+        'dy': {'qui', 'seg', 'sex', 'qua', 'sáb', 'ter', 'dom'},
+        'month': {'janeiro', 'fevereiro', 'março', 'abril', 'maio', 'junho',
+                  'julho', 'agosto', 'setembro', 'outubro', 'novembro',
+                  'dezembro'},
+        'mon': {'jan', 'fev', 'mar', 'abr', 'mai', 'jun', 'jul', 'ago', 'set',
+                'out', 'nov', 'dez'},
+    },
+    'pap_CW': {
+        'day': {'djaweps', 'djamars', 'djarason', 'djabierne', 'djasabra',
+                'djaluna', 'djadumingu'},
+        'dy': {'wep', 'bie', 'ras', 'lun', 'dum', 'sab', 'mar'},
+        'month': {'janüari', 'febrüari', 'mart', 'aprel', 'mei', 'juni', 'juli',
+                  'augustus', 'september', 'oktober', 'november', 'december'},
+        'mon': {'jan', 'feb', 'mar', 'apr', 'mei', 'jun', 'jul', 'aug', 'sep',
+                'okt', 'nov', 'dec'},
+    },
+    'en_IN': {
+    },
+}
@@ -0,0 +1,265 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+A compiled, memory mapped version of the inverted indexes of the locale
+names (see `columndet.index.InvertedIndex`). The file is built by
+`parse_lo_i18n.py` or `python -m columndet.i18n_index` and is mapped
+read-only: there is no parsing at load time, and the processes of a host
+share the pages.
+
+Layout (native byte order, every array aligned on 4 bytes): a header (magic,
+version, byte order mark, number of sections), a table of sections (name,
+offset), then for every section a header and six arrays:
+
+* the offsets and the UTF-8 bytes of the words, sorted for bisect lookups;
+* the offsets and the sorted ranks of the postings of every word;
+* the offsets and the UTF-8 bytes of the strings of the values (every value
+  is a tuple of `width` strings).
+"""
+import functools
+import mmap
+import os
+import struct
+from array import array
+from typing import (BinaryIO, Collection, Iterable, List, Mapping, Optional,
+                    Sequence, Tuple)
+
+INDEX_PATH = os.path.join(os.path.dirname(__file__), "i18n_index.bin")
+_DATA_PATH = os.path.join(os.path.dirname(__file__), "i18n_data.py")
+
+MAGIC = b"CDIX"
+VERSION = 1
+_BYTE_ORDER_MARK = 0x01020304
+_HEADER = struct.Struct("=4sIII")
+_SECTION = struct.Struct("=16sI")
+_SECTION_HEADER = struct.Struct("=IIII")
+
+Entry = Tuple[Tuple[str, ...], Collection[str]]
+
+
+def names_entries(names_by_datecode_by_locale: Mapping[
+    str, Mapping[str, Collection[str]]]) -> Iterable[Entry]:
+    """
+    :return: the ((locale, code), names) entries, in order
+    """
+    return (((locale, code), names)
+            for locale, names_by_datecode in names_by_datecode_by_locale.items()
+            for code, names in names_by_datecode.items())
+
+
+def true_false_entries(true_false_by_locale_name: Mapping[
+    str, Tuple[str, str]]) -> Iterable[Entry]:
+    """
+    :return: the ((true, false), (true, false)) entries, in order
+    """
+    return ((locale_t_f, locale_t_f)
+            for locale_t_f in true_false_by_locale_name.values())
+
+
+class MmapIndex:
+    """
+    A section of the index file. Same interface as `InvertedIndex`.
+    """
+
+    def __init__(self, view: memoryview, offset: int):
+        n_words, n_values, width, n_postings = _SECTION_HEADER.unpack_from(
+            view, offset)
+        offset += _SECTION_HEADER.size
+        self._width = width
+        self._n_values = n_values
+        self._word_offsets, offset = _uints(view, offset, n_words + 1)
+        self._words, offset = _bytes(view, offset, self._word_offsets[-1])
+        self._posting_offsets, offset = _uints(view, offset, n_words + 1)
+        self._postings, offset = _uints(view, offset, n_postings)
+        self._value_offsets, offset = _uints(view, offset,
+                                             n_values * width + 1)
+        self._values, offset = _bytes(view, offset, self._value_offsets[-1])
+
+    def __len__(self):
+        return self._n_values
+
+    def find_first(self, words: Collection[str]
+                   ) -> Optional[Tuple[str, ...]]:
+        if not words:
+            return self._value(0) if self._n_values else None
+
+        postings = []
+        for word in words:
+            i = self._find_word(word.casefold().encode("utf-8"))
+            if i is None:
+                return None
+            postings.append(self._postings[self._posting_offsets[i]:
+                                           self._posting_offsets[i + 1]])
+        postings.sort(key=len)
+        ranks = set(postings[0])
+        for other_ranks in postings[1:]:
+            ranks.intersection_update(other_ranks)
+            if not ranks:
+                return None
+        return self._value(min(ranks))
+
+    def _find_word(self, word: bytes) -> Optional[int]:
+        offsets = self._word_offsets
+        low, high = 0, len(offsets) - 1
+        while low < high:
+            mid = (low + high) // 2
+            if bytes(self._words[offsets[mid]:offsets[mid + 1]]) < word:
+                low = mid + 1
+            else:
+                high = mid
+        if (low < len(offsets) - 1
+                and self._words[offsets[low]:offsets[low + 1]] == word):
+            return low
+        return None
+
+    def _value(self, rank: int) -> Tuple[str, ...]:
+        offsets = self._value_offsets
+        start = rank * self._width
+        return tuple(
+            bytes(self._values[offsets[i]:offsets[i + 1]]).decode("utf-8")
+            for i in range(start, start + self._width))
+
+
+def open_index(path: str = INDEX_PATH) -> Optional[Mapping[str, MmapIndex]]:
+    """
+    :param path: the path of the index file
+    :return: the sections of the index, or None if the file is missing,
+    older than the data module, or was written for another platform.
+    """
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(_DATA_PATH):
+            return None
+        with open(path, "rb") as source:
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    view = memoryview(mapped)
+    try:
+        magic, version, mark, n_sections = _HEADER.unpack_from(view, 0)
+        if (magic, version, mark) != (MAGIC, VERSION, _BYTE_ORDER_MARK):
+            return None
+        sections = {}
+        for i in range(n_sections):
+            name, offset = _SECTION.unpack_from(
+                view, _HEADER.size + i * _SECTION.size)
+            sections[name.rstrip(b"\0").decode("ascii")] = MmapIndex(view,
+                                                                    offset)
+        return sections
+    except (struct.error, ValueError, TypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_sections() -> Mapping[str, MmapIndex]:
+    """
+    :return: the sections of the default index file, mapped once per
+    process, or an empty mapping if there is no valid index file.
+    """
+    sections = open_index()
+    return {} if sections is None else sections
+
+
+def write_index(path: str, entries_by_name: Mapping[str, Iterable[Entry]]):
+    """
+    :param path: the path of the index file
+    :param entries_by_name: the entries of every section. The values of the
+                            entries of a section are tuples of strings of the
+                            same size.
+    """
+    names = list(entries_by_name)
+    with open(path, "wb") as dest:
+        offset = _HEADER.size + len(names) * _SECTION.size
+        dest.write(_HEADER.pack(MAGIC, VERSION, _BYTE_ORDER_MARK, len(names)))
+        sections = [_build_section(entries_by_name[name]) for name in names]
+        for name, section in zip(names, sections):
+            dest.write(_SECTION.pack(name.encode("ascii"), offset))
+            offset += len(section)
+        for section in sections:
+            dest.write(section)
+
+
+def _build_section(entries: Iterable[Entry]) -> bytes:
+    values = []
+    ranks_by_word = {}
+    for rank, (value, words) in enumerate(entries):
+        values.append(value)
+        for word in words:
+            ranks_by_word.setdefault(word.casefold(), []).append(rank)
+    width = len(values[0]) if values else 0
+    if any(len(value) != width for value in values):
+        raise ValueError("The values should have the same size")
+
+    words = sorted(ranks_by_word)
+    postings = array("I")
+    posting_offsets = array("I", [0])
+    for word in words:
+        postings.extend(sorted(set(ranks_by_word[word])))
+        posting_offsets.append(len(postings))
+
+    word_offsets, word_bytes = _string_table(words)
+    value_offsets, value_bytes = _string_table(
+        [text for value in values for text in value])
+    return b"".join([
+        _SECTION_HEADER.pack(len(words), len(values), width, len(postings)),
+        word_offsets.tobytes(), _pad(word_bytes),
+        posting_offsets.tobytes(), postings.tobytes(),
+        value_offsets.tobytes(), _pad(value_bytes)])
+
+
+def _string_table(texts: Sequence[str]) -> Tuple[array, bytes]:
+    offsets = array("I", [0])
+    encoded = []
+    for text in texts:
+        data = text.encode("utf-8")
+        encoded.append(data)
+        offsets.append(offsets[-1] + len(data))
+    return offsets, b"".join(encoded)
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _uints(view: memoryview, offset: int, count: int
+           ) -> Tuple[memoryview, int]:
+    end = offset + 4 * count
+    return view[offset:end].cast("I"), end
+
+
+def _bytes(view: memoryview, offset: int, size: int
+           ) -> Tuple[memoryview, int]:
+    return view[offset:offset + size], offset + size + (-size % 4)
+
+
+def build_index(path: str = INDEX_PATH):
+    """
+    Build the index of the tables of `columndet.i18n`.
+
+    :param path: the path of the index file
+    """
+    from columndet.i18n import (get_names_by_datecode_by_locale,
+                                get_true_false_by_locale_name)
+    write_index(path, {
+        "names": names_entries(get_names_by_datecode_by_locale()),
+        "true_false": true_false_entries(get_true_false_by_locale_name())})
+
+
+if __name__ == "__main__":
+    build_index()
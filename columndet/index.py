@@ -0,0 +1,81 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from typing import (Collection, Dict, FrozenSet, Generic, Iterable, List,
+                    Mapping, Optional, Tuple, TypeVar)
+
+T = TypeVar('T')
+
+
+class InvertedIndex(Generic[T]):
+    """
+    An inverted index from a casefolded word to the ranks of the entries
+    that contain this word. `find_first` returns the first entry, in the
+    order of creation, that contains all the words: it is the same result
+    as a linear scan of the entries, but only the postings of the words
+    are intersected.
+    """
+
+    @staticmethod
+    def create(entries: Iterable[Tuple[T, Collection[str]]]
+               ) -> "InvertedIndex[T]":
+        """
+        :param entries: the entries and their words, in order
+        :return: the index
+        """
+        values = []
+        ranks_by_word = {}  # type: Dict[str, List[int]]
+        for rank, (value, words) in enumerate(entries):
+            values.append(value)
+            for word in words:
+                ranks_by_word.setdefault(word.casefold(), []).append(rank)
+        return InvertedIndex(values, {word: frozenset(ranks)
+                                      for word, ranks in
+                                      ranks_by_word.items()})
+
+    def __init__(self, values: List[T],
+                 ranks_by_word: Mapping[str, FrozenSet[int]]):
+        self._values = values
+        self._ranks_by_word = ranks_by_word
+
+    def __len__(self):
+        return len(self._values)
+
+    def find_first(self, words: Collection[str]) -> Optional[T]:
+        """
+        :param words: the words
+        :return: the first entry that contains all the words, None if there
+        is no such entry
+        """
+        if not words:
+            return self._values[0] if self._values else None
+
+        postings = []
+        for word in words:
+            ranks = self._ranks_by_word.get(word.casefold())
+            if ranks is None:
+                return None
+            postings.append(ranks)
+        postings.sort(key=len)
+        ranks = postings[0]
+        for other_ranks in postings[1:]:
+            ranks = ranks & other_ranks
+            if not ranks:
+                return None
+        return self._values[min(ranks)]
@@ -17,10 +17,12 @@
 #
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import re
 import string
-from typing import Sequence
+from array import array
+from typing import Sequence, Callable, Iterable, Optional
 
-from columndet.util import (Token, OpCode)
+from columndet.util import (Token, OpCode, LexedColumn)
 
 
 class Lexer:
@@ -53,6 +55,35 @@ class Lexer:
             tokens.append(token)
         return tokens
 
+    def lex_many(self, texts: Iterable[str],
+                 weights: Optional[Sequence[int]] = None) -> LexedColumn:
+        """
+        Lex a whole column.
+
+        :param texts: the texts of the column
+        :param weights: the number of occurrences of every text, None if
+                        every text occurs once.
+        :return: the lexed column, in a columnar layout
+        """
+        row_texts = []
+        opcodes = array("b")
+        offsets = array("i")
+        lengths = array("i")
+        counts = array("i")
+        for text in texts:
+            text = text.strip()
+            tokens = self.lex(text)
+            offset = 0
+            for token in tokens:
+                opcodes.append(token.opcode.value)
+                offsets.append(offset)
+                lengths.append(len(token.text))
+                offset += len(token.text)
+            row_texts.append(text)
+            counts.append(len(tokens))
+        return LexedColumn(row_texts, opcodes, offsets, lengths, counts,
+                           weights)
+
     def _get_opcode(self, c: str) -> OpCode:
         if c.isdigit():
             opcode = OpCode.NUMBER
@@ -65,3 +96,88 @@ class Lexer:
         else:
             opcode = OpCode.TEXT
         return opcode
+
+
+# One class character per opcode. The dot gets its own class because a dot
+# that follows some text is part of the text (abbreviations like "sept.").
+_CLASS_BY_OPCODE = {
+    OpCode.NUMBER: "N",
+    OpCode.SPACE: "S",
+    OpCode.TEXT: "T",
+    OpCode.PUNCTUATION: "P",
+    OpCode.OPERATOR: "O",
+}
+_OPCODE_BY_CLASS = {c: opcode for opcode, c in _CLASS_BY_OPCODE.items()}
+_OPCODE_BY_CLASS["D"] = OpCode.PUNCTUATION
+_VALUE_BY_CLASS = {c: opcode.value for c, opcode in _OPCODE_BY_CLASS.items()}
+_RUN_REGEX = re.compile(r"T[TD]*|[PD]+|N+|S+|O+")
+
+
+class _ClassTable(dict):
+    """
+    A `str.translate` table: code point -> class character. Latin-1 is
+    precomputed, other code points are computed on first use.
+    """
+
+    def __init__(self, get_opcode: Callable[[str], OpCode]):
+        super().__init__()
+        self._get_opcode = get_opcode
+        for i in range(256):
+            self.__missing__(i)
+
+    def __missing__(self, key: int) -> str:
+        c = chr(key)
+        if c == ".":
+            value = "D"
+        else:
+            value = _CLASS_BY_OPCODE[self._get_opcode(c)]
+        self[key] = value
+        return value
+
+
+class TableLexer(Lexer):
+    """
+    A table driven lexer: the text is translated to a string of classes in
+    one pass, then the runs of classes are found by a precompiled regex.
+    Produces the same tokens as `Lexer`.
+    """
+
+    def __init__(self):
+        self._table = _ClassTable(self._get_opcode)
+
+    def lex(self, text: str) -> Sequence[Token]:
+        text = text.strip()
+        if not text:
+            return []
+
+        classes = text.translate(self._table)
+        tokens = []
+        for match in _RUN_REGEX.finditer(classes):
+            start, end = match.span()
+            tokens.append(Token(_OPCODE_BY_CLASS[classes[start]],
+                                text[start:end]))
+        return tokens
+
+    def lex_many(self, texts: Iterable[str],
+                 weights: Optional[Sequence[int]] = None) -> LexedColumn:
+        row_texts = []
+        opcodes = array("b")
+        offsets = array("i")
+        lengths = array("i")
+        counts = array("i")
+        table = self._table
+        for text in texts:
+            text = text.strip()
+            count = 0
+            if text:
+                classes = text.translate(table)
+                for match in _RUN_REGEX.finditer(classes):
+                    start, end = match.span()
+                    opcodes.append(_VALUE_BY_CLASS[classes[start]])
+                    offsets.append(start)
+                    lengths.append(end - start)
+                    count += 1
+            row_texts.append(text)
+            counts.append(count)
+        return LexedColumn(row_texts, opcodes, offsets, lengths, counts,
+                           weights)
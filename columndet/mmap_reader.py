@@ -0,0 +1,150 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import mmap
+import os
+from pathlib import Path
+from typing import List, Tuple, Union
+
+ByteRange = Tuple[int, int]
+
+
+class MmapReader:
+    """
+    A memory mapped file, read by ranges of complete lines at arbitrary byte
+    offsets: only the selected ranges are paged in and decoded.
+
+    The line boundaries are found by looking for b"\\n": the encoding must
+    be ASCII compatible (see `is_ascii_compatible`). A range that starts in
+    the middle of a quoted field with line breaks may split a row.
+    """
+
+    @staticmethod
+    def open(path: Union[str, Path]) -> "MmapReader":
+        """
+        :param path: the path of the file
+        :return: the reader, to be closed (or used as a context manager)
+        """
+        source = open(path, "rb")
+        try:
+            size = os.fstat(source.fileno()).st_size
+            if size:
+                data = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+            else:  # an empty file can't be mapped
+                data = b""
+        except BaseException:
+            source.close()
+            raise
+        return MmapReader(source, data, size)
+
+    def __init__(self, source, data: Union[mmap.mmap, bytes], size: int):
+        self._source = source
+        self._data = data
+        self.size = size
+
+    def __enter__(self) -> "MmapReader":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._source.close()
+
+    def line_range(self, offset: int, size: int) -> ByteRange:
+        """
+        :param offset: the offset
+        :param size: the maximum size of the range
+        :return: the range of the complete lines between `offset` and
+        `offset + size`. The line that contains `offset` is skipped, unless
+        `offset` is the start of a line. The last line of the file may lack
+        a line break.
+        """
+        if offset <= 0:
+            start = 0
+        else:
+            i = self._data.find(b"\n", offset - 1)
+            if i == -1:
+                return self.size, self.size
+            start = i + 1
+        end = start + size
+        if end >= self.size:
+            return start, self.size
+        j = self._data.rfind(b"\n", start, end)
+        if j == -1:
+            return start, start
+        return start, j + 1
+
+    def line_at(self, offset: int) -> ByteRange:
+        """
+        :param offset: the offset
+        :return: the range of the first line that starts at or after
+        `offset`, empty at the end of the file.
+        """
+        start, _ = self.line_range(offset, 0)
+        i = self._data.find(b"\n", start)
+        if i == -1:
+            return start, self.size
+        return start, i + 1
+
+    def spread_ranges(self, chunk_size: int) -> List[ByteRange]:
+        """
+        :param chunk_size: the size of a chunk, in bytes
+        :return: the ranges of complete lines of three chunks at the head,
+        the middle and the tail of the file. The ranges don't overlap and a
+        small file is a single range.
+        """
+        if self.size <= 3 * chunk_size:
+            return [(0, self.size)]
+        ranges = []
+        end = 0
+        for offset in (0, (self.size - chunk_size) // 2,
+                       self.size - chunk_size):
+            start, end = self.line_range(max(offset, end), chunk_size)
+            if start < end:
+                ranges.append((start, end))
+        return ranges
+
+    def decode(self, byte_range: ByteRange, encoding: str,
+               errors: str = "strict") -> str:
+        """
+        :param byte_range: the range
+        :param encoding: the encoding
+        :param errors: the error handler
+        :return: the decoded range. The bytes are not copied before decoding.
+        """
+        start, end = byte_range
+        if not isinstance(self._data, mmap.mmap):
+            return self._data[start:end].decode(encoding, errors)
+        with memoryview(self._data) as view, view[start:end] as part:
+            return str(part, encoding, errors)
+
+
+def is_ascii_compatible(encoding: str) -> bool:
+    """
+    :param encoding: the encoding
+    :return: True if the line breaks and the usual delimiters are encoded as
+    in ASCII.
+    """
+    try:
+        return b"\r\n,;\t|\"'".decode(encoding) == "\r\n,;\t|\"'"
+    except (LookupError, UnicodeDecodeError):
+        return False
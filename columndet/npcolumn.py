@@ -0,0 +1,176 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+An optional NumPy backend (`pip install columndet[numpy]`). The arrays of a
+`LexedColumn` are wrapped without copy and the whole column operations
+(sizes, first and last tokens, rows of a given size) are vectorized. The
+blocks of digits (e.g. "20201001") are converted once to a matrix of slots.
+
+NumPy is imported on first use, not with `columndet`: it would double the
+import time of the short-lived workers that do not need it.
+"""
+import collections
+import importlib.util
+from typing import Collection, Counter, List, Optional, Tuple
+
+from columndet.util import LexedColumn, OPCODE_BY_VALUE, Token, TokenRow
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+np = None  # see _import_numpy
+
+
+def _import_numpy() -> bool:
+    """
+    Import NumPy as the global `np`, once.
+
+    :return: True if NumPy is installed
+    """
+    global np
+    if np is None and HAS_NUMPY:
+        import numpy
+        np = numpy
+    return np is not None
+
+
+class NumpyLexedColumn(LexedColumn):
+    """
+    A `LexedColumn` backed by NumPy arrays: int8 opcodes, int32 offsets,
+    lengths and counts, and the int32 index of the first token of every
+    row.
+    """
+
+    @staticmethod
+    def from_column(column: LexedColumn) -> "NumpyLexedColumn":
+        """
+        :param column: a lexed column
+        :return: the same column, backed by NumPy arrays
+        :raise ImportError: if NumPy is not installed
+        """
+        if not _import_numpy():
+            raise ImportError("NumPy is required: pip install columndet[numpy]")
+        weights = column.weights
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.int64)
+        return NumpyLexedColumn(
+            column.texts, np.frombuffer(column.opcodes, dtype=np.int8),
+            np.frombuffer(column.offsets, dtype=np.int32),
+            np.frombuffer(column.lengths, dtype=np.int32),
+            np.frombuffer(column.counts, dtype=np.int32), weights)
+
+    @property
+    def starts(self) -> "np.ndarray":
+        if self._starts is None:
+            starts = np.zeros(len(self.counts), dtype=np.int32)
+            np.cumsum(self.counts[:-1], out=starts[1:])
+            self._starts = starts
+        return self._starts
+
+    def token_rows(self, size: Optional[int] = None) -> List[TokenRow]:
+        if size is None:
+            indices = np.flatnonzero(self.counts)
+        else:
+            indices = np.flatnonzero(self.counts == size)
+        return [TokenRow(self.tokens(i), self.weight(i))
+                for i in indices.tolist()]
+
+    def weight(self, i: int) -> int:
+        return 1 if self.weights is None else int(self.weights[i])
+
+    def token_columns(self, size: int
+                      ) -> Tuple[List[List[Token]], List[int]]:
+        indices = np.flatnonzero(self.counts == size)
+        if not len(indices):
+            return [], []
+        starts = self.starts[indices]
+        rows = indices.tolist()
+        texts = self.texts
+        columns = []
+        for k in range(size):
+            token_indices = starts + k
+            columns.append([
+                Token(OPCODE_BY_VALUE[opcode],
+                      texts[i][offset:offset + length])
+                for i, opcode, offset, length in zip(
+                    rows, self.opcodes[token_indices].tolist(),
+                    self.offsets[token_indices].tolist(),
+                    self.lengths[token_indices].tolist())])
+        if self.weights is None:
+            weights = [1] * len(rows)
+        else:
+            weights = self.weights[indices].tolist()
+        return columns, weights
+
+    def sizes(self) -> Counter[int]:
+        sizes = np.bincount(self.counts, weights=self.weights)
+        return collections.Counter(
+            {size: int(count) for size, count in enumerate(sizes.tolist())
+             if size and count})
+
+    def _count_tokens(self, delta: int) -> Counter[Token]:
+        indices = np.flatnonzero(self.counts)
+        counts = self.counts[indices]
+        token_indices = self.starts[indices] + delta % counts
+        if self.weights is None:
+            weights = np.ones(len(indices), dtype=np.int64)
+        else:
+            weights = self.weights[indices]
+
+        counter = collections.Counter()
+        texts = self.texts
+        for i, opcode, offset, length, weight in zip(
+                indices.tolist(), self.opcodes[token_indices].tolist(),
+                self.offsets[token_indices].tolist(),
+                self.lengths[token_indices].tolist(), weights.tolist()):
+            counter[opcode, texts[i][offset:offset + length]] += weight
+        return collections.Counter(
+            {Token(OPCODE_BY_VALUE[op], text): count for (op, text), count in
+             counter.items()})
+
+
+def digit_slot_bounds(texts: Collection[str], slot_width: int = 2
+                      ) -> Optional[List[Tuple[int, int]]]:
+    """
+    Split every text in slots of `slot_width` digits and return the min and
+    max value of every slot, e.g. ["201001", "191231"] gives
+    [(19, 20), (10, 12), (1, 31)].
+
+    :param texts: the texts
+    :param slot_width: the width of a slot
+    :return: the (min, max) of every slot, or None if NumPy is not installed
+    or if the texts are not ASCII digits of the same width.
+    """
+    if not texts or not _import_numpy():
+        return None
+    width = len(next(iter(texts)))
+    if width == 0 or width % slot_width or any(
+            len(text) != width for text in texts):
+        return None
+    try:
+        buffer = "".join(texts).encode("ascii")
+    except UnicodeEncodeError:
+        return None
+    digits = np.frombuffer(buffer, dtype=np.uint8) - ord("0")
+    if digits.max() > 9:  # uint8 wraps below "0"
+        return None
+    powers = 10 ** np.arange(slot_width - 1, -1, -1, dtype=np.int32)
+    slots = digits.reshape(len(texts), width // slot_width,
+                           slot_width) @ powers
+    return list(zip(slots.min(axis=0).tolist(), slots.max(axis=0).tolist()))
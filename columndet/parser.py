@@ -18,11 +18,16 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import collections
-from typing import (Optional, List, Collection, Counter, Callable)
+import itertools
+import math
+import random
+from typing import (Optional, List, Counter, Callable, Iterable, Mapping,
+                    Sequence, Sized, Iterator, Tuple, Collection)
 
 from columndet import (ColumnInfos, OpCode, YMDBlockSniffer, HMSBlockSniffer,
                        DateSniffer)
 from columndet.booldet import BooleanSniffer
+from columndet.cache import ShapeCache, ColumnCache, fingerprint
 from columndet.datedet import (YMDColumnTypeSniffer, HMSColumnTypeSniffer,
                                DateFieldDescriptionFactory)
 from mcsv.meta_csv_data import (FieldDescription, CurrencyDescription,
@@ -31,22 +36,35 @@ from mcsv.meta_csv_data import (FieldDescription, CurrencyDescription,
                                 DateDescription, DatetimeDescription)
 from columndet.floatdet import FloatParser
 from columndet.i18n import (DECIMAL_SEPARATORS, PERCENTAGE_SIGNS,
-                            CURRENCY_SYMBOLS, CURRENCY_CODES)
+                            CURRENCY_SYMBOLS, CURRENCY_CODES, LocaleSelection)
 from columndet.lexer import (Lexer)
-from columndet.util import (get_unique, TokenRow, Token)
+from columndet.npcolumn import HAS_NUMPY, NumpyLexedColumn
+from columndet.stats import ParserStats, ColumnStats, NULL_COLUMN_STATS
+from columndet.util import (get_unique, TokenRow, Token, LexedColumn)
 
 
 class RowsInfos:
     @staticmethod
     def create(non_empty_token_rows: List[TokenRow], threshold: float):
-        sizes = collections.Counter([len(row) for row in non_empty_token_rows])
-        return RowsInfos(non_empty_token_rows, sizes, threshold)
+        sizes = collections.Counter()
+        first_tokens = collections.Counter()
+        last_tokens = collections.Counter()
+        for row in non_empty_token_rows:
+            sizes[len(row)] += row.weight
+            first_tokens[row.first()] += row.weight
+            last_tokens[row.last()] += row.weight
+        return RowsInfos(sizes, first_tokens, last_tokens, threshold)
 
-    def __init__(self, non_empty_token_rows: List[TokenRow],
-                 sizes: Counter[int],
-                 threshold: float):
-        self._non_empty_token_rows = non_empty_token_rows
+    @staticmethod
+    def create_from_column(column: LexedColumn, threshold: float):
+        return RowsInfos(column.sizes(), column.first_tokens(),
+                         column.last_tokens(), threshold)
+
+    def __init__(self, sizes: Counter[int], first_tokens: Counter[Token],
+                 last_tokens: Counter[Token], threshold: float):
         self.sizes = sizes
+        self._first_tokens = first_tokens
+        self._last_tokens = last_tokens
         self._threshold = threshold
 
     def get_unique_size(self) -> int:
@@ -57,12 +75,78 @@ class RowsInfos:
         return get_unique(self.sizes, self._threshold)
 
     def first_matches(self, func: Callable[[Token], bool]) -> bool:
-        count = sum(1 for tr in self._non_empty_token_rows if func(tr.first()))
-        return count > self._threshold * len(self._non_empty_token_rows)
+        return self._matches(self._first_tokens, func)
 
     def last_matches(self, func: Callable[[Token], bool]) -> bool:
-        count = sum(1 for tr in self._non_empty_token_rows if func(tr.last()))
-        return count > self._threshold * len(self._non_empty_token_rows)
+        return self._matches(self._last_tokens, func)
+
+    def _matches(self, tokens: Counter[Token],
+                 func: Callable[[Token], bool]) -> bool:
+        count = sum(c for t, c in tokens.items() if func(t))
+        return count > self._threshold * sum(self.sizes.values())
+
+
+class ColumnAnalysis:
+    """
+    The intermediate results of the analysis of a column, computed once and
+    lazily, and shared by the sized and unsized paths: if the sized path
+    fails, the unsized path reuses the rows infos and the token rows.
+    """
+
+    def __init__(self, column: LexedColumn, threshold: float):
+        self.column = column
+        self._threshold = threshold
+        self._rows_infos = None
+        self._token_rows = None
+        self._token_rows_by_size = {}
+        self._column_infos_by_size = {}
+
+    @property
+    def rows_infos(self) -> RowsInfos:
+        if self._rows_infos is None:
+            self._rows_infos = RowsInfos.create_from_column(self.column,
+                                                            self._threshold)
+        return self._rows_infos
+
+    def token_rows(self, size: Optional[int] = None) -> List[TokenRow]:
+        """
+        The rows are copies: the caller may pop/shift them.
+
+        :param size: if not None, keep only the rows of this size
+        :return: the non empty token rows
+        """
+        return [row.copy() for row in self._get_token_rows(size)]
+
+    def _get_token_rows(self, size: Optional[int]) -> List[TokenRow]:
+        if size is None:
+            if self._token_rows is None:
+                self._token_rows = self.column.token_rows()
+            return self._token_rows
+
+        rows = self._token_rows_by_size.get(size)
+        if rows is None:
+            if self._token_rows is None:
+                # only build the rows of this size
+                rows = self.column.token_rows(size)
+            else:
+                rows = [row for row in self._token_rows if len(row) == size]
+            self._token_rows_by_size[size] = rows
+        return rows
+
+    def column_infos(self, size: int) -> List[ColumnInfos]:
+        """
+        :param size: the size of the rows
+        :return: the infos of every position of the rows of this size
+        """
+        column_infos = self._column_infos_by_size.get(size)
+        if column_infos is None:
+            # read from the arrays: no token row is built
+            columns, weights = self.column.token_columns(size)
+            column_infos = [ColumnInfos.create(tokens, None, self._threshold,
+                                               weights)
+                            for tokens in columns]
+            self._column_infos_by_size[size] = column_infos
+        return column_infos
 
 
 class Parser:
@@ -72,74 +156,303 @@ class Parser:
 
     @staticmethod
     def create(lexer: Optional[Lexer] = None, threshold: float = 0.95,
-               prefer_dot_as_decimal_separator: bool = True):
+               prefer_dot_as_decimal_separator: bool = True,
+               shape_cache: Optional[ShapeCache] = None,
+               confidence: Optional[float] = None,
+               batch_sizes: Sequence[int] = (64, 256, 1024),
+               stats: Optional[ParserStats] = None,
+               numpy_backend: bool = False,
+               locales: Optional[Collection[str]] = None,
+               preferred_locales: Optional[Sequence[str]] = None,
+               column_cache_size: int = 0,
+               column_cache_ttl: Optional[float] = None):
+        """
+        :param lexer: the lexer
+        :param threshold: the threshold
+        :param prefer_dot_as_decimal_separator: if True, "1.234" is a float
+        :param shape_cache: a cache of the decisions made per token shape,
+                            that may be shared between parsers
+        :param confidence: if not None, `parse` reads the texts by growing
+                           batches and stops when two consecutive batches
+                           give the same result and the decision on the size
+                           of the rows holds with this confidence (e.g.
+                           0.99). The other decisions (e.g. a rare shape
+                           that would make the column a text) are not
+                           bounded.
+        :param batch_sizes: the sizes of the first batches. The next batches
+                            are four times bigger than the previous one.
+        :param stats: if not None, collects the time spent in every stage
+                      and the branches taken for every column
+        :param numpy_backend: if True, the whole column operations are
+                              vectorized with NumPy (see
+                              `columndet.npcolumn`).
+        :param locales: the candidate locales of the day/month names and of
+                        the booleans (e.g. ["fr_FR", "en_US"]), None for every
+                        locale
+        :param preferred_locales: the locales to try first: if the names
+                                  match several locales, a preferred locale
+                                  wins.
+        :param column_cache_size: if greater than 0, `parse_counts` keeps the
+                                  descriptions of this number of columns, by
+                                  fingerprint of the distinct values, and a
+                                  repeated column is not parsed again
+        :param column_cache_ttl: the time to live of the cached descriptions,
+                                 in seconds, None for no expiration
+        :return: the parser
+        :raise ImportError: if numpy_backend is True and NumPy is not
+                            installed
+        :raise ValueError: if the confidence is not in ]0, 1[
+        """
+        if confidence is not None and not 0 < confidence < 1:
+            raise ValueError(f"Expected a confidence in ]0, 1[: {confidence}")
+        if numpy_backend and not HAS_NUMPY:
+            raise ImportError("NumPy is required: pip install columndet[numpy]")
         if lexer is None:
             lexer = Lexer()
-        ymd_col_type_sniffer = YMDColumnTypeSniffer.create(threshold)
+        locale_selection = LocaleSelection.create(locales, preferred_locales)
+        ymd_col_type_sniffer = YMDColumnTypeSniffer.create(threshold,
+                                                           shape_cache,
+                                                           locale_selection)
         hms_col_type_sniffer = HMSColumnTypeSniffer.create(threshold)
+        if column_cache_size > 0:
+            column_cache = ColumnCache(column_cache_size, column_cache_ttl)
+        else:
+            column_cache = None
         return Parser(lexer, threshold, ymd_col_type_sniffer,
-                      hms_col_type_sniffer, prefer_dot_as_decimal_separator)
+                      hms_col_type_sniffer, prefer_dot_as_decimal_separator,
+                      shape_cache, confidence, batch_sizes, stats,
+                      numpy_backend, locale_selection, column_cache)
 
     def __init__(self, lexer: Lexer, threshold: float,
                  ymd_col_type_sniffer: YMDColumnTypeSniffer,
                  hms_col_type_sniffer: HMSColumnTypeSniffer,
-                 prefer_dot_as_decimal_separator: bool = True):
+                 prefer_dot_as_decimal_separator: bool = True,
+                 shape_cache: Optional[ShapeCache] = None,
+                 confidence: Optional[float] = None,
+                 batch_sizes: Sequence[int] = (64, 256, 1024),
+                 stats: Optional[ParserStats] = None,
+                 numpy_backend: bool = False,
+                 locale_selection: Optional[LocaleSelection] = None,
+                 column_cache: Optional[ColumnCache] = None):
         self._lexer = lexer
         self._threshold = threshold
         self._ymd_col_type_sniffer = ymd_col_type_sniffer
         self._hms_col_type_sniffer = hms_col_type_sniffer
         self._prefer_dot_as_decimal_separator = prefer_dot_as_decimal_separator
+        self._shape_cache = shape_cache
+        self._confidence = confidence
+        self._batch_sizes = batch_sizes
+        self._stats = stats
+        self._numpy_backend = numpy_backend
+        self._locale_selection = locale_selection
+        self._column_cache = column_cache
+
+    @property
+    def lexer(self) -> Lexer:
+        return self._lexer
+
+    def parse(self, texts: Iterable[str], name: Optional[str] = None
+              ) -> FieldDescription:
+        """
+        :param texts: the texts of the column
+        :param name: the name of the column, for the stats
+        :return: the field description
+        """
+        if self._confidence is None:
+            return self.parse_counts(
+                collections.Counter(text.strip() for text in texts), name)
+        else:
+            return self._parse_by_batches(texts, name)
 
-    def parse(self, texts: List[str]) -> FieldDescription:
-        token_rows = [self._lexer.lex(text.strip()) for text in texts]
-        non_empty_token_rows = [TokenRow(r) for r in token_rows if r]
-        if not non_empty_token_rows:
-            return TextDescription.INSTANCE
+    def _parse_by_batches(self, texts: Iterable[str], name: Optional[str]
+                          ) -> FieldDescription:
+        """
+        Parse growing batches of texts. Stop when two consecutive results are
+        equal and the decision on the size of the rows is settled (see
+        `_is_size_settled`). Only the size decision is bounded: the equality
+        of two results is a heuristic.
+
+        If the texts are a sequence, the batches are drawn in a random order:
+        every batch is a uniform sample of the column, even if the texts are
+        sorted. Otherwise, the batches are read in order, and the early exit
+        assumes that the order of the texts does not depend on their values.
+        """
+        remaining = len(texts) if isinstance(texts, Sized) else None
+        if isinstance(texts, Sequence):
+            iterator = (texts[i] for i in
+                        random.Random(0).sample(range(len(texts)),
+                                                len(texts)))
+        else:
+            iterator = iter(texts)
+        counts = collections.Counter()
+        column_stats = self._create_column_stats(name)
+        previous = None
+        for n, batch_size in enumerate(self._get_batch_sizes(), 1):
+            batch = [text.strip() for text in
+                     itertools.islice(iterator, batch_size)]
+            if not batch and previous is not None:
+                break
+
+            counts.update(batch)
+            column_stats.branch(f"batch {n}")
+            description, rows_infos = self._parse_counts(counts, column_stats)
+            if remaining is not None:
+                remaining -= len(batch)
+            if len(batch) < batch_size or remaining == 0:
+                previous = description
+                break
+            if (previous is not None and str(previous) == str(description)
+                    and self._is_size_settled(rows_infos.sizes, remaining)):
+                break
+            previous = description
+
+        self._add_column_stats(column_stats, counts, previous)
+        return previous
+
+    def _get_batch_sizes(self) -> Iterator[int]:
+        batch_size = 1
+        for batch_size in self._batch_sizes:
+            yield batch_size
+        while True:
+            batch_size *= 4
+            yield batch_size
+
+    def _is_size_settled(self, sizes: Counter[int],
+                         remaining: Optional[int]) -> bool:
+        """
+        :param sizes: the sizes of the rows seen so far
+        :param remaining: the number of rows left, or None if unknown
+        :return: True if the decision on the unique size can't change
+        because of the remaining rows, or if the margin between the share of
+        the most common size and the threshold is greater than the Hoeffding
+        bound for the given confidence. This bounds the size decision only,
+        not the type of the column.
+        """
+        n = sum(sizes.values())
+        if n == 0:
+            return False
+        _, count = sizes.most_common(1)[0]
+        if remaining is not None:
+            total = n + remaining
+            if (count > self._threshold * total
+                    or count + remaining <= self._threshold * total):
+                return True
+        epsilon = math.sqrt(math.log(2 / (1 - self._confidence)) / (2 * n))
+        return abs(count / n - self._threshold) > epsilon
+
+    def parse_counts(self, counts: Mapping[str, int],
+                     name: Optional[str] = None) -> FieldDescription:
+        """
+        Every distinct text is lexed and sniffed once, but the thresholds
+        are still applied to the number of occurrences.
 
-        rows_infos = RowsInfos.create(non_empty_token_rows, self._threshold)
+        :param counts: the number of occurrences of every distinct text of
+                       the column
+        :param name: the name of the column, for the stats
+        :return: the field description
+        """
+        column_stats = self._create_column_stats(name)
+        if self._column_cache is None:
+            description, _ = self._parse_counts(counts, column_stats)
+        else:
+            key = fingerprint(counts)
+            description = self._column_cache.get(key)
+            if description is None:
+                description, _ = self._parse_counts(counts, column_stats)
+                self._column_cache.put(key, description)
+            else:
+                column_stats.branch("column cache")
+        self._add_column_stats(column_stats, counts, description)
+        return description
+
+    def _create_column_stats(self, name: Optional[str]) -> ColumnStats:
+        if self._stats is None:
+            return NULL_COLUMN_STATS
+        return ColumnStats(name, 0, 0)
+
+    def _add_column_stats(self, column_stats: ColumnStats,
+                          counts: Mapping[str, int],
+                          description: FieldDescription):
+        if self._stats is None:
+            return
+        column_stats.rows = sum(counts.values())
+        column_stats.distinct = len(counts)
+        column_stats.finish(description)
+        self._stats.add(column_stats)
+
+    def _parse_counts(self, counts: Mapping[str, int],
+                      column_stats: ColumnStats
+                      ) -> Tuple[FieldDescription, RowsInfos]:
+        with column_stats.stage("lex"):
+            column = self._lexer.lex_many(counts.keys(),
+                                          list(counts.values()))
+            if self._numpy_backend:
+                column = NumpyLexedColumn.from_column(column)
+        analysis = ColumnAnalysis(column, self._threshold)
+        with column_stats.stage("rows_infos"):
+            rows_infos = analysis.rows_infos
+        if rows_infos.sizes:
+            description = self._parse_column(analysis, column_stats)
+        else:
+            column_stats.branch("empty")
+            description = TextDescription.INSTANCE
+        return description, rows_infos
+
+    def _parse_column(self, analysis: ColumnAnalysis,
+                      column_stats: ColumnStats) -> FieldDescription:
         try:
-            unique_size = rows_infos.get_unique_size()
+            unique_size = analysis.rows_infos.get_unique_size()
         except ValueError:
-            try:
-                return self._parse_unsized(rows_infos, non_empty_token_rows)
-            except ValueError:
-                return TextDescription.INSTANCE
+            column_stats.branch("no unique size")
+            return self._try_unsized(analysis, column_stats)
         else:
+            column_stats.branch(f"size {unique_size}")
             try:
-                return self._parse_sized(unique_size, non_empty_token_rows)
+                with column_stats.stage("sized"):
+                    return self._parse_sized(unique_size, analysis,
+                                             column_stats)
             except ValueError:
-                try:
-                    return self._parse_unsized(rows_infos, non_empty_token_rows)
-                except ValueError:
-                    return TextDescription.INSTANCE
+                column_stats.branch("sized failed")
+                return self._try_unsized(analysis, column_stats)
 
-    def _parse_sized(self, row_size: int,
-                     non_empty_token_rows: Collection[TokenRow]
-                     ) -> FieldDescription:
+    def _try_unsized(self, analysis: ColumnAnalysis,
+                     column_stats: ColumnStats) -> FieldDescription:
+        column_stats.branch("unsized")
+        try:
+            with column_stats.stage("unsized"):
+                return self._parse_unsized(analysis)
+        except ValueError:
+            column_stats.branch("unsized failed")
+            return TextDescription.INSTANCE
+
+    def _parse_sized(self, row_size: int, analysis: ColumnAnalysis,
+                     column_stats: ColumnStats) -> FieldDescription:
         # col bet: bool, date, datetime *are* sized
         # (currency, integer, float, _text, percentage *may be* sized)
-        valid_token_rows = [r for r in non_empty_token_rows if
-                            len(r) == row_size]
-        if not valid_token_rows:
+        tokens_cols = analysis.column_infos(row_size)
+        if not tokens_cols:
             raise ValueError(f"Too few valid tokens")
 
         if row_size == 1:
+            column_stats.branch("OneColumnSniffer")
             return OneColumnSniffer(self._ymd_col_type_sniffer,
                                     self._hms_col_type_sniffer,
-                                    valid_token_rows,
-                                    self._threshold).sniff()
+                                    tokens_cols[0],
+                                    self._threshold,
+                                    self._shape_cache,
+                                    self._locale_selection).sniff()
         else:
+            column_stats.branch("DateSniffer")
             return DateSniffer(self._ymd_col_type_sniffer,
                                self._hms_col_type_sniffer,
-                               valid_token_rows,
-                               self._threshold).sniff()
+                               analysis.token_rows(row_size),
+                               self._threshold, tokens_cols).sniff()
 
-    def _parse_unsized(self, rows_infos: RowsInfos,
-                       non_empty_token_rows: List[TokenRow]
-                       ) -> FieldDescription:
-        return UnsizedColumnSniffer(rows_infos, non_empty_token_rows,
+    def _parse_unsized(self, analysis: ColumnAnalysis) -> FieldDescription:
+        return UnsizedColumnSniffer(analysis.rows_infos, analysis.token_rows(),
                                     self._threshold,
-                                    self._prefer_dot_as_decimal_separator).sniff()
+                                    self._prefer_dot_as_decimal_separator,
+                                    self._shape_cache).sniff()
 
 
 class OneColumnSniffer:
@@ -150,11 +463,15 @@ class OneColumnSniffer:
 
     def __init__(self, ymd_col_type_sniffer: YMDColumnTypeSniffer,
                  hms_col_type_sniffer: HMSColumnTypeSniffer,
-                 token_rows: List[TokenRow], threshold: float):
+                 tokens_col: ColumnInfos, threshold: float,
+                 shape_cache: Optional[ShapeCache] = None,
+                 locale_selection: Optional[LocaleSelection] = None):
         self._ymd_col_type_sniffer = ymd_col_type_sniffer
         self._hms_col_type_sniffer = hms_col_type_sniffer
-        self._token_rows = token_rows
+        self._tokens_col = tokens_col
+        self._locale_selection = locale_selection
         self._threshold = threshold
+        self._shape_cache = shape_cache
         self._date_field_factory = DateFieldDescriptionFactory()
 
     def sniff(self) -> FieldDescription:
@@ -164,8 +481,7 @@ class OneColumnSniffer:
 
         :return: the field description
         """
-        rows = [tr.only for tr in self._token_rows]
-        tokens_col = ColumnInfos.create(TokenRow(rows), None, self._threshold)
+        tokens_col = self._tokens_col
         opcode = tokens_col.unique_opcode
         if opcode == OpCode.NUMBER:
             try:
@@ -211,7 +527,8 @@ class OneColumnSniffer:
 
     def _sniff_bool_literal(self, col: ColumnInfos) -> FieldDescription:
         texts = col.texts
-        return BooleanSniffer(texts, self._threshold).sniff()
+        return BooleanSniffer(texts, self._threshold, self._shape_cache,
+                              self._locale_selection).sniff()
 
 
 class UnsizedColumnSniffer:
@@ -222,11 +539,13 @@ class UnsizedColumnSniffer:
 
     def __init__(self, rows_infos: RowsInfos,
                  token_rows: List[TokenRow], threshold: float,
-                 prefer_dot_as_decimal_separator: bool = True):
+                 prefer_dot_as_decimal_separator: bool = True,
+                 shape_cache: Optional[ShapeCache] = None):
         self._rows_infos = rows_infos
         self._token_rows = token_rows
         self._threshold = threshold
         self._prefer_dot_as_decimal_separator = prefer_dot_as_decimal_separator
+        self._shape_cache = shape_cache
 
     def sniff(self) -> FieldDescription:
         if self._rows_infos.last_matches(lambda t: (
@@ -254,7 +573,8 @@ class UnsizedColumnSniffer:
 
     def _try_float_or_integer(self) -> FieldDescription:
         return FloatParser(self._token_rows, self._threshold,
-                           self._prefer_dot_as_decimal_separator).sniff()
+                           self._prefer_dot_as_decimal_separator,
+                           self._shape_cache).sniff()
 
     def _try_pre_percentage(self):
         sign = self._get_pre()
@@ -262,7 +582,8 @@ class UnsizedColumnSniffer:
             lambda t: (t.opcode == OpCode.SPACE or t.text in PERCENTAGE_SIGNS))
             for row in self._token_rows]
         float_description = FloatParser(rows, self._threshold,
-                                        self._prefer_dot_as_decimal_separator).sniff()
+                                        self._prefer_dot_as_decimal_separator,
+                                        self._shape_cache).sniff()
         return PercentageDescription(True, sign, float_description)
 
     def _try_pre_currency(self):
@@ -271,13 +592,15 @@ class UnsizedColumnSniffer:
                 t.opcode == OpCode.SPACE or t.text in CURRENCY_SYMBOLS or t.text in CURRENCY_CODES))
                 for row in self._token_rows]
         float_description = FloatParser(rows, self._threshold,
-                                        self._prefer_dot_as_decimal_separator).sniff()
+                                        self._prefer_dot_as_decimal_separator,
+                                        self._shape_cache).sniff()
 
         return CurrencyDescription(True, currency, float_description)
 
     def _get_pre(self):
-        values = collections.Counter(
-            row.first_text for row in self._token_rows)
+        values = collections.Counter()
+        for row in self._token_rows:
+            values[row.first_text] += row.weight
         try:
             value = get_unique(values)
         except ValueError:
@@ -290,7 +613,8 @@ class UnsizedColumnSniffer:
             lambda t: (t.opcode == OpCode.SPACE or t.text in PERCENTAGE_SIGNS))
             for row in self._token_rows]
         float_description = FloatParser(rows, self._threshold,
-                                        self._prefer_dot_as_decimal_separator).sniff()
+                                        self._prefer_dot_as_decimal_separator,
+                                        self._shape_cache).sniff()
         return PercentageDescription(False, sign, float_description)
 
     def _try_post_currency(self):
@@ -299,13 +623,15 @@ class UnsizedColumnSniffer:
                 t.opcode == OpCode.SPACE or t.text in CURRENCY_SYMBOLS or t.text in CURRENCY_CODES))
                 for row in self._token_rows]
         float_description = FloatParser(rows, self._threshold,
-                                        self._prefer_dot_as_decimal_separator).sniff()
+                                        self._prefer_dot_as_decimal_separator,
+                                        self._shape_cache).sniff()
 
         return CurrencyDescription(False, currency, float_description)
 
     def _get_post(self):
-        values = collections.Counter(
-            row.last_text for row in self._token_rows)
+        values = collections.Counter()
+        for row in self._token_rows:
+            values[row.last_text] += row.weight
         try:
             value = get_unique(values)
         except ValueError:
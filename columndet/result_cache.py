@@ -0,0 +1,157 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Hashable, Optional, Union
+
+CACHE_VERSION = 1
+SUFFIX = ".pickle"
+
+
+class ResultCache:
+    """
+    An opt-in, on-disk cache of results (e.g. the results of `csv_det`),
+    shared by the processes that use the same directory.
+
+    The key of a file is made of its path, size, mtime, a hash of its first
+    `hash_bytes` bytes and the settings: a repeated detection costs a stat
+    call and a small read. Entries are evicted, least recently used first,
+    when the total size of the directory exceeds `max_bytes`.
+    """
+
+    def __init__(self, directory: Union[str, Path],
+                 max_bytes: int = 64 * 1024 * 1024,
+                 hash_bytes: int = 64 * 1024):
+        """
+        :param directory: the cache directory, created if needed
+        :param max_bytes: the maximum total size of the entries
+        :param hash_bytes: the number of bytes of the file that are hashed,
+                           0 to rely on the size and mtime only
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hash_bytes = hash_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, path: Union[str, Path], settings: Hashable) -> str:
+        """
+        :param path: the path of the file
+        :param settings: the settings of the computation. Should have a
+                         deterministic repr (no sets).
+        :return: the key of the entry
+        :raise OSError: if the file can't be read
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        fingerprint = hashlib.sha256()
+        fingerprint.update(repr((CACHE_VERSION, stat.st_size,
+                                 stat.st_mtime_ns, settings)).encode("utf-8"))
+        if self.hash_bytes > 0:
+            with path.open("rb") as source:
+                fingerprint.update(source.read(self.hash_bytes))
+        return _path_hash(path) + "-" + fingerprint.hexdigest()[:32]
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        :param key: the key
+        :return: the value, or None if the entry is missing or unreadable
+        """
+        entry = self.directory / (key + SUFFIX)
+        try:
+            with entry.open("rb") as source:
+                value = pickle.load(source)
+            os.utime(str(entry))  # for the LRU eviction
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+                ImportError, ValueError):
+            self.misses += 1
+            _remove(entry)
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        """
+        Store an entry, then evict the least recently used entries if the
+        cache is too big.
+
+        :param key: the key
+        :param value: the value, picklable
+        """
+        descriptor, temp_path = tempfile.mkstemp(dir=str(self.directory),
+                                                 suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as dest:
+                pickle.dump(value, dest, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, str(self.directory / (key + SUFFIX)))
+        except BaseException:
+            _remove(Path(temp_path))
+            raise
+        self._evict()
+
+    def invalidate(self, path: Union[str, Path]):
+        """
+        Remove the entries of a file, whatever the settings.
+
+        :param path: the path of the file
+        """
+        prefix = _path_hash(Path(path).resolve()) + "-"
+        for entry in self.directory.glob(prefix + "*" + SUFFIX):
+            _remove(entry)
+
+    def clear(self):
+        """
+        Remove every entry.
+        """
+        for entry in self.directory.glob("*" + SUFFIX):
+            _remove(entry)
+
+    def _evict(self):
+        entries = []
+        for entry in self.directory.glob("*" + SUFFIX):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            _remove(entry)
+            total -= size
+
+
+def _path_hash(path: Path) -> str:
+    return hashlib.sha256(str(path).encode("utf-8")).hexdigest()[:16]
+
+
+def _remove(entry: Path):
+    try:
+        entry.unlink()
+    except OSError:
+        pass
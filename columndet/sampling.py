@@ -0,0 +1,282 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import abc
+import csv
+import io
+import itertools
+import math
+import random
+from pathlib import Path
+from typing import (Hashable, Iterable, Iterator, List, Optional, Sequence,
+                    Type)
+
+from columndet.mmap_reader import ByteRange, MmapReader, is_ascii_compatible
+
+Row = Sequence[str]
+
+
+class Sampler(abc.ABC):
+    """
+    A strategy to select the rows of a CSV file that are sniffed. The
+    encoding, the dialect and the header are detected on the first chunk of
+    the file beforehand.
+
+    The row budget is the maximum number of rows of the sample, None for no
+    limit.
+    """
+
+    @abc.abstractmethod
+    def rows(self, path: Path, first_chunk: str, encoding: str,
+             dialect: Type[csv.Dialect], errors: str = "strict"
+             ) -> Iterable[Row]:
+        """
+        :param path: the path of the file
+        :param first_chunk: the complete lines of the first chunk, decoded
+        :param encoding: the encoding
+        :param dialect: the dialect
+        :param errors: the error handler of the bytes read past the first
+                       chunk. With "strict", a `UnicodeDecodeError` is raised
+                       while the rows are iterated.
+        :return: the sampled rows, without the header
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def key(self) -> Hashable:
+        """
+        :return: the sampler and its settings, e.g. for a `ResultCache` key
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        settings = ", ".join(f"{name}={value!r}"
+                             for name, value in sorted(vars(self).items()))
+        return f"{type(self).__name__}({settings})"
+
+
+class HeadSampler(Sampler):
+    """
+    The complete rows of the first chunk.
+    """
+
+    def __init__(self, row_budget: Optional[int] = None):
+        self.row_budget = row_budget
+
+    def key(self) -> Hashable:
+        return "HeadSampler", self.row_budget
+
+    def rows(self, path: Path, first_chunk: str, encoding: str,
+             dialect: Type[csv.Dialect], errors: str = "strict"
+             ) -> Iterable[Row]:
+        reader = csv.reader(io.StringIO(first_chunk), dialect)
+        next(reader, None)
+        return itertools.islice(reader, self.row_budget)
+
+
+class FullSampler(Sampler):
+    """
+    All the rows of the file, read incrementally.
+    """
+
+    def key(self) -> Hashable:
+        return "FullSampler",
+
+    def rows(self, path: Path, first_chunk: str, encoding: str,
+             dialect: Type[csv.Dialect], errors: str = "strict"
+             ) -> Iterator[Row]:
+        with path.open("r", encoding=encoding, errors=errors,
+                       newline='') as source:
+            reader = csv.reader(source, dialect)
+            next(reader, None)
+            yield from reader
+
+
+class ReservoirSampler(Sampler):
+    """
+    A uniform sample of the rows of the whole file. The file is read once,
+    the memory is O(row_budget).
+    """
+
+    def __init__(self, row_budget: int = 10000, seed: int = 0):
+        self.row_budget = row_budget
+        self.seed = seed
+
+    def key(self) -> Hashable:
+        return "ReservoirSampler", self.row_budget, self.seed
+
+    def rows(self, path: Path, first_chunk: str, encoding: str,
+             dialect: Type[csv.Dialect], errors: str = "strict"
+             ) -> Iterable[Row]:
+        return _reservoir_sample(
+            FullSampler().rows(path, first_chunk, encoding, dialect,
+                               errors),
+            self.row_budget, random.Random(self.seed))
+
+
+class _MmapSampler(Sampler):
+    """
+    A sampler that reads ranges of complete lines of a memory mapped file
+    (see `MmapReader`). The row budget is shared equally by the ranges. If
+    the encoding is not ASCII compatible, the first chunk is used.
+    """
+    row_budget: Optional[int]
+
+    def rows(self, path: Path, first_chunk: str, encoding: str,
+             dialect: Type[csv.Dialect], errors: str = "strict"
+             ) -> Iterable[Row]:
+        if not is_ascii_compatible(encoding):
+            return HeadSampler(self.row_budget).rows(path, first_chunk,
+                                                     encoding, dialect)
+        with MmapReader.open(path) as mmap_reader:
+            texts = [(start, mmap_reader.decode((start, end), encoding,
+                                                errors))
+                     for start, end in self._ranges(mmap_reader)]
+        if self.row_budget is None or not texts:
+            budget = None
+        else:
+            budget = math.ceil(self.row_budget / len(texts))
+        return itertools.chain.from_iterable(
+            _read_rows(text, dialect, start == 0, budget)
+            for start, text in texts)
+
+    @abc.abstractmethod
+    def _ranges(self, mmap_reader: MmapReader) -> List[ByteRange]:
+        """
+        :param mmap_reader: the reader
+        :return: the ranges of complete lines to read
+        """
+        raise NotImplementedError
+
+
+class SpreadSampler(_MmapSampler):
+    """
+    The complete rows of three chunks at the head, the middle and the tail
+    of the file.
+    """
+
+    def __init__(self, chunk_size: int = 1024 * 1024,
+                 row_budget: Optional[int] = None):
+        self.chunk_size = chunk_size
+        self.row_budget = row_budget
+
+    def key(self) -> Hashable:
+        return "SpreadSampler", self.chunk_size, self.row_budget
+
+    def _ranges(self, mmap_reader: MmapReader) -> List[ByteRange]:
+        return mmap_reader.spread_ranges(self.chunk_size)
+
+
+class UniformSampler(_MmapSampler):
+    """
+    The rows that follow random byte offsets, resynchronized on the line
+    boundaries. The reading stops when `byte_budget` bytes have been read.
+
+    A line that follows a long line is more likely to be selected.
+    """
+
+    def __init__(self, row_budget: int = 10000,
+                 byte_budget: int = 1024 * 1024, seed: int = 0):
+        self.row_budget = row_budget
+        self.byte_budget = byte_budget
+        self.seed = seed
+
+    def key(self) -> Hashable:
+        return ("UniformSampler", self.row_budget, self.byte_budget,
+                self.seed)
+
+    def _ranges(self, mmap_reader: MmapReader) -> List[ByteRange]:
+        if mmap_reader.size <= self.byte_budget:
+            return [(0, mmap_reader.size)]
+        rng = random.Random(self.seed)
+        offsets = sorted(rng.randrange(mmap_reader.size)
+                         for _ in range(self.row_budget))
+        ranges = []
+        read = 0
+        for offset in offsets:
+            start, end = mmap_reader.line_at(offset)
+            if start == end or ranges and ranges[-1][0] == start:
+                continue
+            read += end - start
+            if read > self.byte_budget:
+                break
+            ranges.append((start, end))
+        return ranges
+
+
+class StratifiedSampler(_MmapSampler):
+    """
+    The file is split in `strata` strata of the same size, and the complete
+    lines of a window of `byte_budget / strata` bytes at a random position
+    are read in every stratum.
+    """
+
+    def __init__(self, byte_budget: int = 1024 * 1024,
+                 row_budget: Optional[int] = None, strata: int = 8,
+                 seed: int = 0):
+        self.byte_budget = byte_budget
+        self.row_budget = row_budget
+        self.strata = strata
+        self.seed = seed
+
+    def key(self) -> Hashable:
+        return ("StratifiedSampler", self.byte_budget, self.row_budget,
+                self.strata, self.seed)
+
+    def _ranges(self, mmap_reader: MmapReader) -> List[ByteRange]:
+        if mmap_reader.size <= self.byte_budget:
+            return [(0, mmap_reader.size)]
+        rng = random.Random(self.seed)
+        stratum_size = mmap_reader.size // self.strata
+        window = self.byte_budget // self.strata
+        ranges = []
+        for i in range(self.strata):
+            offset = i * stratum_size + rng.randrange(
+                max(1, stratum_size - window))
+            start, end = mmap_reader.line_range(offset, window)
+            if start < end:
+                ranges.append((start, end))
+        return ranges
+
+
+def _read_rows(text: str, dialect: Type[csv.Dialect], skip_header: bool,
+               budget: Optional[int]) -> Iterable[Row]:
+    reader = csv.reader(io.StringIO(text), dialect)
+    if skip_header:
+        next(reader, None)
+    return itertools.islice(reader, budget)
+
+
+def _reservoir_sample(rows: Iterable[Row], size: int,
+                     rng: random.Random) -> List[Row]:
+    """
+    :param rows: the rows
+    :param size: the size of the sample
+    :param rng: the random generator
+    :return: a uniform sample of the rows
+    """
+    sample = []
+    for i, row in enumerate(rows):
+        if i < size:
+            sample.append(row)
+        else:
+            j = rng.randrange(i + 1)
+            if j < size:
+                sample[j] = row
+    return sample
@@ -0,0 +1,165 @@
+# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import collections
+import threading
+import time
+from typing import List, Mapping, Optional
+
+
+class ColumnStats:
+    """
+    The stats of the parsing of one column: the wall time of every stage,
+    the number of rows and the branches taken (including the exceptions
+    that triggered a fallback).
+    """
+
+    def __init__(self, name: Optional[str], rows: int, distinct: int):
+        self.name = name
+        self.rows = rows
+        self.distinct = distinct
+        self.seconds_by_stage = collections.OrderedDict()
+        self.branches = []
+        self.result = None
+        self.seconds = 0.0
+        self._start = time.perf_counter()
+
+    def stage(self, name: str) -> "_Stage":
+        """
+        :param name: the name of the stage
+        :return: a context manager that adds the time spent to the stage
+        """
+        return _Stage(self, name)
+
+    def branch(self, name: str):
+        self.branches.append(name)
+
+    def finish(self, result: object):
+        self.result = str(result)
+        self.seconds = time.perf_counter() - self._start
+
+    def __getstate__(self):
+        return {k: v for k, v in self.__dict__.items() if k != "_start"}
+
+    def __repr__(self):
+        return (f"ColumnStats({self.name!r}, rows={self.rows}, "
+                f"distinct={self.distinct}, seconds={self.seconds:.6f}, "
+                f"branches={self.branches}, result={self.result!r})")
+
+
+class _Stage:
+    def __init__(self, column_stats: ColumnStats, name: str):
+        self._column_stats = column_stats
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        seconds_by_stage = self._column_stats.seconds_by_stage
+        seconds_by_stage[self._name] = (seconds_by_stage.get(self._name, 0.0)
+                                        + time.perf_counter() - self._start)
+        return False
+
+
+class _NullColumnStats:
+    """
+    Used when the stats are disabled: does nothing.
+    """
+
+    def stage(self, _name: str) -> "_NullColumnStats":
+        return self
+
+    def branch(self, _name: str):
+        pass
+
+    def finish(self, _result: object):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+NULL_COLUMN_STATS = _NullColumnStats()
+
+
+class ParserStats:
+    """
+    A thread safe collector of `ColumnStats`. Pass it to `Parser.create` or
+    to `csv_det`.
+    """
+
+    def __init__(self):
+        self.columns = []
+        self.encoding = None
+        self._lock = threading.Lock()
+
+    def add(self, column_stats: ColumnStats):
+        with self._lock:
+            self.columns.append(column_stats)
+
+    def clear(self):
+        with self._lock:
+            self.columns = []
+
+    def summary(self) -> Mapping[str, object]:
+        """
+        :return: the aggregate stats: number of columns and rows, total time,
+        time per stage and number of columns per branch.
+        """
+        with self._lock:
+            columns = list(self.columns)
+        seconds_by_stage = collections.Counter()
+        count_by_branch = collections.Counter()
+        for column in columns:
+            seconds_by_stage.update(column.seconds_by_stage)
+            count_by_branch.update(column.branches)
+        return {"columns": len(columns),
+                "rows": sum(c.rows for c in columns),
+                "seconds": sum(c.seconds for c in columns),
+                "seconds_by_stage": dict(seconds_by_stage),
+                "count_by_branch": dict(count_by_branch)}
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """
+        :param limit: the maximum number of columns
+        :return: a text report, slowest columns first
+        """
+        with self._lock:
+            columns = sorted(self.columns, key=lambda c: -c.seconds)
+        lines = []
+        for column in columns[:limit]:
+            stages = ", ".join(f"{name}={seconds:.6f}" for name, seconds in
+                               column.seconds_by_stage.items())
+            lines.append(f"{column.name}: {column.seconds:.6f}s, "
+                         f"{column.rows} rows ({column.distinct} distinct), "
+                         f"{stages}; {' > '.join(column.branches)} "
+                         f"-> {column.result}")
+        if self.encoding is not None:
+            lines.append(f"Encoding: {self.encoding.encoding} "
+                         f"(tier {self.encoding.tier})")
+        summary = self.summary()
+        lines.append(f"Total: {summary['columns']} columns, "
+                     f"{summary['rows']} rows, {summary['seconds']:.6f}s")
+        return "\n".join(lines)
@@ -33,44 +33,302 @@
 #
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import codecs
 import io
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
 from pathlib import Path
-from typing import Union
+from typing import (Union, Iterable, List, Sequence, Mapping, Tuple,
+                    Optional, Collection, Type)
 
-import chardet
 import csv
 
-from mcsv.meta_csv_data import MetaCSVData
+from mcsv.meta_csv_data import MetaCSVData, FieldDescription
+from columndet.accumulator import ColumnAccumulator
+from columndet.encoding import detect_encoding
+from columndet.i18n import LocaleSelection
 from columndet.parser import Parser
+from columndet.result_cache import ResultCache
+from columndet.sampling import (Sampler, HeadSampler, ReservoirSampler,
+                                FullSampler, SpreadSampler, UniformSampler,
+                                StratifiedSampler)
+from columndet.stats import ParserStats
+
+DIALECT_ATTRIBUTES = ("delimiter", "quotechar", "escapechar", "doublequote",
+                      "skipinitialspace", "lineterminator", "quoting")
+
+
+class SamplingMode(Enum):
+    HEAD = 1  # the complete rows of the first chunk
+    RESERVOIR = 2  # a uniform sample of the rows of the whole file
+    FULL = 3  # all the rows of the file
+    SPREAD = 4  # the complete rows of chunks at the head, middle and tail
+    UNIFORM = 5  # the rows at random byte offsets of the whole file
+    STRATIFIED = 6  # the complete rows of a random chunk per stratum
 
 
 def csv_det(path: Union[str, Path], chunk_size=1024 * 1024,
             threshold: float = 0.95,
-            prefer_dot_as_decimal_separator: bool = True
+            prefer_dot_as_decimal_separator: bool = True,
+            sampling: Union[SamplingMode, Sampler] = SamplingMode.HEAD,
+            sample_size: int = 10000, seed: int = 0,
+            max_distinct: int = 100000, workers: Optional[int] = None,
+            stats: Optional[ParserStats] = None,
+            locales: Optional[Collection[str]] = None,
+            preferred_locales: Optional[Sequence[str]] = None,
+            cache: Optional[ResultCache] = None
             ) -> MetaCSVData:
     """
     Detect a csv format.
 
-    :param path:
-    :param chunk_size:
-    :param threshold:
-    :param prefer_dot_as_decimal_separator:
-    :return:
+    The encoding (see `detect_encoding`), the dialect and the header are
+    detected on the first chunk. Then the rows selected by the sampler (see
+    `columndet.sampling`) are fed to a `ColumnAccumulator` per column. The
+    rows are decoded strictly: if a byte past the first chunk is not in the
+    detected encoding, the encoding is detected again on the faulty bytes
+    and the rows are sampled again, undecodable bytes being replaced.
+    `SamplingMode.UNIFORM` and `SamplingMode.STRATIFIED` read about
+    `chunk_size` bytes of the whole file, at most `sample_size` rows: a
+    sorted file is not biased towards its first values.
+
+    :param path: the path
+    :param chunk_size: the size of the first chunk, in bytes
+    :param threshold: the threshold
+    :param prefer_dot_as_decimal_separator: if True, "1.234" is a float
+    :param sampling: the rows to sniff: a mode or a sampler
+    :param sample_size: the number of rows of a `SamplingMode.RESERVOIR`,
+                        `SamplingMode.UNIFORM` or `SamplingMode.STRATIFIED`
+                        sample
+    :param seed: the seed of the random samples
+    :param max_distinct: the maximum number of distinct values per column
+                         to keep in memory
+    :param workers: if greater than 1, the number of processes that parse
+                    the columns
+    :param stats: if not None, collects the detected encoding and the stats
+                  of every column (see `ParserStats.report`)
+    :param locales: the candidate locales of the names and booleans, None
+                    for every locale (see `Parser.create`)
+    :param preferred_locales: the locales to try first
+    :param cache: if not None, the results are stored in this cache and a
+                  repeated detection of an unchanged file with the same
+                  settings returns the stored result (the stats are not
+                  updated).
+    :return: the MetaCSV data
     """
     if isinstance(path, str):
         path = Path(path)
+    if isinstance(sampling, SamplingMode):
+        sampler = _create_sampler(sampling, chunk_size, sample_size, seed)
+    else:
+        sampler = sampling
+
+    if cache is not None:
+        key = cache.key(path, (
+            chunk_size, threshold, prefer_dot_as_decimal_separator,
+            sampler.key(), max_distinct,
+            None if locales is None else tuple(sorted(locales)),
+            None if preferred_locales is None else tuple(preferred_locales)))
+        cached = cache.get(key)
+        if cached is not None:
+            encoding, dialect_attributes, header, field_descriptions = cached
+            return MetaCSVData(path, encoding,
+                               _restore_dialect(dialect_attributes), header,
+                               field_descriptions)
 
     with path.open("rb") as source:
         data = source.read(chunk_size)
-        encoding = chardet.detect(data)["encoding"]
-        data_str = data.decode(encoding, errors='ignore')
-        dialect = csv.Sniffer().sniff(data_str)
+        is_truncated = len(data) == chunk_size and source.read(1) != b""
+    detected_encoding = detect_encoding(data)
+    parser = Parser.create(threshold=threshold,
+                           prefer_dot_as_decimal_separator=
+                           prefer_dot_as_decimal_separator,
+                           stats=stats, locales=locales,
+                           preferred_locales=preferred_locales)
+    try:
+        dialect, header, accumulators = _sample(
+            path, data, is_truncated, detected_encoding.encoding, "strict",
+            sampler, parser, max_distinct)
+    except UnicodeDecodeError as error:
+        # the bytes past the first chunk are not in the detected encoding:
+        # detect it again on the faulty bytes and do not drop characters.
+        detected_encoding = detect_encoding(bytes(error.object))
+        dialect, header, accumulators = _sample(
+            path, data, is_truncated, detected_encoding.encoding, "replace",
+            sampler, parser, max_distinct)
+    encoding = detected_encoding.encoding
+    if stats is not None:
+        stats.encoding = detected_encoding
+
+    if workers is not None and workers > 1:
+        field_descriptions = _parse_in_processes(
+            accumulators, header, workers, threshold,
+            prefer_dot_as_decimal_separator, stats,
+            LocaleSelection.create(locales, preferred_locales))
+    else:
+        field_descriptions = tuple(
+            a.result(name) for a, name in zip(accumulators, header))
+    if cache is not None:
+        # the sniffed dialect is a local class: store its attributes
+        cache.put(key, (encoding, {name: getattr(dialect, name)
+                                   for name in DIALECT_ATTRIBUTES},
+                        header, field_descriptions))
+    return MetaCSVData(path, encoding, dialect(), header, field_descriptions)
+
+
+def _create_sampler(sampling: SamplingMode, chunk_size: int,
+                    sample_size: int, seed: int) -> Sampler:
+    if sampling == SamplingMode.HEAD:
+        return HeadSampler()
+    elif sampling == SamplingMode.RESERVOIR:
+        return ReservoirSampler(sample_size, seed)
+    elif sampling == SamplingMode.FULL:
+        return FullSampler()
+    elif sampling == SamplingMode.SPREAD:
+        return SpreadSampler(chunk_size)
+    elif sampling == SamplingMode.UNIFORM:
+        return UniformSampler(sample_size, chunk_size, seed)
+    elif sampling == SamplingMode.STRATIFIED:
+        return StratifiedSampler(chunk_size, sample_size, seed=seed)
+    else:
+        raise ValueError(f"Unknown sampling mode {sampling}")
+
+
+def _restore_dialect(attributes: Mapping[str, object]) -> csv.Dialect:
+    return type("CachedDialect", (csv.Dialect,), dict(attributes))()
+
+
+def _sample(path: Path, data: bytes, is_truncated: bool, encoding: str,
+            errors: str, sampler: Sampler, parser: Parser, max_distinct: int
+            ) -> Tuple[Type[csv.Dialect], List[str], List[ColumnAccumulator]]:
+    """
+    :param path: the path
+    :param data: the first chunk
+    :param is_truncated: True if the file is longer than the first chunk
+    :param encoding: the encoding
+    :param errors: the error handler
+    :param sampler: the sampler
+    :param parser: the parser
+    :param max_distinct: the maximum number of distinct values per column
+    :return: the dialect, the header and the accumulators fed with the
+             sampled rows
+    """
+    # a truncated chunk may end in the middle of a character
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    data_str = decoder.decode(data, final=not is_truncated)
+    if is_truncated:
+        data_str = _drop_last_line(data_str)
+    dialect = csv.Sniffer().sniff(data_str)
+    header = next(csv.reader(io.StringIO(data_str), dialect))
+    rows = sampler.rows(path, data_str, encoding, dialect, errors)
+    return dialect, header, _accumulate(parser, rows, len(header),
+                                        max_distinct)
+
+
+def _drop_last_line(data_str: str) -> str:
+    """
+    :param data_str: the first chunk of a file
+    :return: the chunk, without the last (truncated) line
+    """
+    i = data_str.rfind("\n")
+    if i == -1:
+        return data_str
+    return data_str[:i + 1]
+
 
-        reader = csv.reader(io.StringIO(data_str), dialect)
-        header = next(reader)
+def _accumulate(parser: Parser, rows: Iterable[Sequence[str]], width: int,
+                max_distinct: int) -> List[ColumnAccumulator]:
+    """
+    :param parser: the parser
+    :param rows: the rows
+    :param width: the number of columns
+    :param max_distinct: the maximum number of distinct values per column
+    :return: for every column, an accumulator fed with the values
+    """
+    accumulators = [ColumnAccumulator.create(parser, max_distinct=max_distinct)
+                    for _ in range(width)]
+    for row in rows:
+        for accumulator, value in zip(accumulators, row):
+            accumulator.feed((value,))
+    return accumulators
+
+
+PackedCounts = Tuple[str, array, array]
+
+_parser_by_settings = {}
+
+
+def _parse_in_processes(accumulators: Sequence[ColumnAccumulator],
+                        names: Sequence[str], workers: int,
+                        threshold: float,
+                        prefer_dot_as_decimal_separator: bool,
+                        stats: Optional[ParserStats],
+                        locale_selection: Optional[LocaleSelection]
+                        ) -> Tuple[FieldDescription, ...]:
+    """
+    Parse the columns in a pool of processes. The order of the results is
+    the order of the columns. The stats of the workers are added to `stats`.
+    """
+    packed_counts = [_pack_counts(a.counts()) for a in accumulators]
+    settings = [(threshold, prefer_dot_as_decimal_separator,
+                 stats is not None, locale_selection)] * len(packed_counts)
+    with ProcessPoolExecutor(workers) as executor:
+        results = list(executor.map(_parse_packed_counts, settings,
+                                    packed_counts, names))
+    if stats is not None:
+        for _, worker_stats in results:
+            for column_stats in worker_stats.columns:
+                stats.add(column_stats)
+    return tuple(description for description, _ in results)
+
+
+def _pack_counts(counts: Mapping[str, int]) -> PackedCounts:
+    """
+    :param counts: the counts of the distinct values
+    :return: a compact form: all the values in one string, the lengths of
+    the values and the counts.
+    """
+    return ("".join(counts.keys()), array("i", map(len, counts.keys())),
+            array("q", counts.values()))
+
+
+def _unpack_counts(packed_counts: PackedCounts) -> Mapping[str, int]:
+    joined, lengths, counts = packed_counts
+    unpacked = {}
+    start = 0
+    for length, count in zip(lengths, counts):
+        unpacked[joined[start:start + length]] = count
+        start += length
+    return unpacked
+
+
+def _parse_packed_counts(settings: Tuple[float, bool, bool,
+                                         Optional[LocaleSelection]],
+                         packed_counts: PackedCounts, name: str
+                         ) -> Tuple[FieldDescription, Optional[ParserStats]]:
+    """
+    Executed in a worker process. The parser is created once per process.
+    """
+    parser, stats = _parser_by_settings.get(settings, (None, None))
+    if parser is None:
+        (threshold, prefer_dot_as_decimal_separator, with_stats,
+         locale_selection) = settings
+        stats = ParserStats() if with_stats else None
+        if locale_selection is None:
+            locale_selection = LocaleSelection(None, ())
         parser = Parser.create(threshold=threshold,
                                prefer_dot_as_decimal_separator=
-                               prefer_dot_as_decimal_separator)
-        cols = list(zip(*reader))
-        return MetaCSVData(path, encoding, dialect(), header,
-                           tuple(parser.parse(col) for col in cols))
+                               prefer_dot_as_decimal_separator,
+                               stats=stats,
+                               locales=locale_selection.locales,
+                               preferred_locales=
+                               locale_selection.preferred_locales)
+        _parser_by_settings[settings] = parser, stats
+    description = parser.parse_counts(_unpack_counts(packed_counts), name)
+    if stats is None:
+        return description, None
+    worker_stats = ParserStats()
+    for column_stats in stats.columns:
+        worker_stats.add(column_stats)
+    stats.clear()
+    return description, worker_stats
@@ -18,9 +18,10 @@
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import collections
+from array import array
 from enum import Enum
 from typing import TypeVar, Optional, Tuple, Callable, Mapping, Sequence, \
-    Counter, Sized, Iterable, Iterator
+    Counter, Sized, Iterable, Iterator, List
 
 T = TypeVar('T')
 LocaleType = Optional[Tuple[str, str]]
@@ -68,61 +69,240 @@ class OpCode(Enum):
 
 Token = collections.namedtuple('Token', ['opcode', 'text'])
 
+OPCODE_BY_VALUE = {opcode.value: opcode for opcode in OpCode}
+
 
 class TokenRow(Iterable[Token], Sized):
-    def __init__(self, tokens: Sequence[Token]):
+    """
+    A view on a sequence of tokens. `pop`, `shift`, `lstrip`, `rstrip` and
+    `copy` only move the bounds of the view: the tokens are never copied.
+    """
+    __slots__ = ("_tokens", "_start", "_end", "weight")
+
+    def __init__(self, tokens: Sequence[Token], weight: int = 1,
+                 start: int = 0, end: Optional[int] = None):
+        """
+        :param tokens: the tokens
+        :param weight: the number of occurrences of this row in the column
+        :param start: the index of the first token of the view
+        :param end: the index after the last token of the view, None for
+                    the end of `tokens`
+        """
         self._tokens = tokens
+        self._start = start
+        self._end = len(tokens) if end is None else end
+        self.weight = weight
 
     def __len__(self):
-        return len(self._tokens)
+        return self._end - self._start
 
     def __iter__(self) -> Iterator[Token]:
-        return iter(self._tokens)
+        tokens = self._tokens
+        for i in range(self._start, self._end):
+            yield tokens[i]
+
+    def __getitem__(self, i: int) -> Token:
+        if i < 0:
+            i += self._end - self._start
+        if not 0 <= i < self._end - self._start:
+            raise IndexError(i)
+        return self._tokens[self._start + i]
 
     @property
     def first_text(self) -> str:
-        return self._tokens[0].text
+        return self[0].text
 
     @property
     def last_opcode(self) -> OpCode:
-        return self._tokens[-1].opcode
+        return self[-1].opcode
 
     @property
     def last_text(self) -> str:
-        return self._tokens[-1].text
+        return self[-1].text
 
     @property
     def only(self) -> Token:
-        assert len(self._tokens) == 1
-        return self._tokens[0]
+        assert self._end - self._start == 1
+        return self._tokens[self._start]
 
     def lstrip(self, func: Callable[[Token], bool]) -> "TokenRow":
-        i = 0
-        while i < len(self._tokens) and func(self._tokens[i]):
+        i = self._start
+        while i < self._end and func(self._tokens[i]):
             i += 1
-        return TokenRow(self._tokens[i:])
+        return TokenRow(self._tokens, self.weight, i, self._end)
 
     def rstrip(self, func: Callable[[Token], bool]) -> "TokenRow":
-        i = len(self._tokens)
-        while i > 0 and func(self._tokens[i - 1]):
+        i = self._end
+        while i > self._start and func(self._tokens[i - 1]):
             i -= 1
-        return TokenRow(self._tokens[:i])
+        return TokenRow(self._tokens, self.weight, self._start, i)
 
     def pop(self) -> Token:
-        ret = self._tokens[-1]
-        self._tokens = self._tokens[:-1]
-        return ret
+        if self._end == self._start:
+            raise IndexError("pop from an empty row")
+        self._end -= 1
+        return self._tokens[self._end]
 
     def shift(self) -> Token:
-        ret = self._tokens[0]
-        self._tokens = self._tokens[1:]
+        if self._end == self._start:
+            raise IndexError("shift from an empty row")
+        ret = self._tokens[self._start]
+        self._start += 1
         return ret
 
+    def copy(self) -> "TokenRow":
+        """
+        :return: a row that can be popped/shifted without modifying this
+        row.
+        """
+        return TokenRow(self._tokens, self.weight, self._start, self._end)
+
+    def align(self, values: Sequence[T]) -> Sequence[T]:
+        """
+        :param values: the values of the underlying tokens, e.g. their
+                       weights
+        :return: the values of the tokens of the view
+        """
+        return values[self._start:self._end]
+
+    def shape(self) -> Tuple:
+        """
+        :return: the opcode/width signature of the row. Numbers are replaced
+        by their width, other tokens are kept.
+        """
+        return tuple((t.opcode, len(t.text)) if t.opcode == OpCode.NUMBER
+                     else t for t in self)
+
     def first(self) -> Token:
-        return self._tokens[0]
+        return self[0]
 
     def last(self) -> Token:
-        return self._tokens[-1]
+        return self[-1]
+
+
+class LexedColumn(Sized):
+    """
+    A lexed column, in a columnar layout: flat arrays of opcodes (values),
+    offsets and lengths of the tokens, and the number of tokens of every row.
+    Offsets are relative to the (stripped) text of the row. If the rows are
+    distinct texts, `weights` are the number of occurrences of every row.
+
+    `Token`s are only built on demand.
+    """
+
+    def __init__(self, texts: Sequence[str], opcodes: array, offsets: array,
+                 lengths: array, counts: array,
+                 weights: Optional[Sequence[int]] = None):
+        self.texts = texts
+        self.opcodes = opcodes
+        self.offsets = offsets
+        self.lengths = lengths
+        self.counts = counts
+        self.weights = weights
+        self._starts = None
+
+    def __len__(self):
+        return len(self.counts)
+
+    @property
+    def starts(self) -> array:
+        """
+        :return: the index of the first token of every row.
+        """
+        if self._starts is None:
+            starts = array("i")
+            start = 0
+            for count in self.counts:
+                starts.append(start)
+                start += count
+            self._starts = starts
+        return self._starts
+
+    def token(self, i: int, j: int) -> Token:
+        """
+        :param i: the index of the row
+        :param j: the index of the token in the token array
+        :return: the token
+        """
+        offset = self.offsets[j]
+        return Token(OPCODE_BY_VALUE[self.opcodes[j]],
+                     self.texts[i][offset:offset + self.lengths[j]])
+
+    def tokens(self, i: int) -> List[Token]:
+        start = self.starts[i]
+        return [self.token(i, j) for j in range(start, start + self.counts[i])]
+
+    def weight(self, i: int) -> int:
+        return 1 if self.weights is None else self.weights[i]
+
+    def token_rows(self, size: Optional[int] = None) -> List["TokenRow"]:
+        """
+        :param size: if not None, the size of the rows to keep.
+        :return: the non empty rows, as token rows
+        """
+        if size is None:
+            return [TokenRow(self.tokens(i), self.weight(i)) for i, count in
+                    enumerate(self.counts) if count]
+        else:
+            return [TokenRow(self.tokens(i), self.weight(i)) for i, count in
+                    enumerate(self.counts) if count == size]
+
+    def token_columns(self, size: int
+                      ) -> Tuple[List[List[Token]], List[int]]:
+        """
+        Read the rows of a given size position by position, without
+        building a `TokenRow` per row.
+
+        :param size: the size of the rows
+        :return: the tokens at every position of the rows of this size, and
+        the weights of these rows.
+        """
+        indices = [i for i, count in enumerate(self.counts) if count == size]
+        if not indices:
+            return [], []
+        starts = self.starts
+        columns = [[self.token(i, starts[i] + k) for i in indices]
+                   for k in range(size)]
+        return columns, [self.weight(i) for i in indices]
+
+    def sizes(self) -> Counter[int]:
+        """
+        :return: a counter of the sizes of the non empty rows
+        """
+        if self.weights is None:
+            sizes = collections.Counter(self.counts)
+        else:
+            sizes = collections.Counter()
+            for count, weight in zip(self.counts, self.weights):
+                sizes[count] += weight
+        del sizes[0]
+        return sizes
+
+    def first_tokens(self) -> Counter[Token]:
+        """
+        :return: a counter of the first tokens of the non empty rows
+        """
+        return self._count_tokens(0)
+
+    def last_tokens(self) -> Counter[Token]:
+        """
+        :return: a counter of the last tokens of the non empty rows
+        """
+        return self._count_tokens(-1)
+
+    def _count_tokens(self, delta: int) -> Counter[Token]:
+        counter = collections.Counter()
+        starts = self.starts
+        for i, count in enumerate(self.counts):
+            if count:
+                j = starts[i] + (delta % count)
+                offset = self.offsets[j]
+                counter[self.opcodes[j],
+                        self.texts[i][offset:offset + self.lengths[j]]
+                        ] += self.weight(i)
+        return collections.Counter(
+            {Token(OPCODE_BY_VALUE[op], text): count for (op, text), count in
+             counter.items()})
 
 
 class ColumnInfos:
@@ -131,34 +311,95 @@ class ColumnInfos:
     """
 
     @staticmethod
-    def create(tokens: TokenRow,
+    def create(tokens: Iterable[Token],
                is_null: Optional[Callable[[Token], bool]] = None,
-               threshold: float = 1.0) -> "ColumnInfos":
+               threshold: float = 1.0,
+               weights: Optional[Sequence[int]] = None) -> "ColumnInfos":
         """
 
         :param tokens: the tokens of the column
         :param is_null: a function that returns True if the token is null
         :param threshold: the _threshold
+        :param weights: the number of occurrences of every token, None if
+                        every token occurs once.
         :return: column infos
         """
+        tokens = list(tokens)
+        if weights is None:
+            weights = [1] * len(tokens)
         if is_null is None:
-            non_null_tokens = [t for t in tokens if
-                               t.opcode != OpCode.SPACE]
+            non_null = [(t, w) for t, w in zip(tokens, weights) if
+                        t.opcode != OpCode.SPACE]
         else:
-            non_null_tokens = [t for t in tokens if is_null(t.opcode)]
-        return ColumnInfos(tokens, TokenRow(non_null_tokens), threshold)
+            non_null = [(t, w) for t, w in zip(tokens, weights) if
+                        is_null(t.opcode)]
+        if non_null:
+            non_null_tokens, non_null_weights = zip(*non_null)
+        else:
+            non_null_tokens, non_null_weights = [], []
+        return ColumnInfos(TokenRow(tokens), TokenRow(non_null_tokens),
+                           threshold, weights, non_null_weights)
+
+    __slots__ = ("_tokens", "_non_null_tokens", "_threshold", "_weights",
+                 "_non_null_weights", "_counts", "_non_null_counts",
+                 "_opcodes", "_widths", "_texts")
 
     def __init__(self, tokens: TokenRow,
                  non_null_tokens: TokenRow,
-                 threshold: float):
+                 threshold: float,
+                 weights: Optional[Sequence[int]] = None,
+                 non_null_weights: Optional[Sequence[int]] = None):
         self._tokens = tokens
         self._non_null_tokens = non_null_tokens
         self._threshold = threshold
+        if weights is None:
+            weights = [1] * len(tokens)
+        if non_null_weights is None:
+            non_null_weights = [1] * len(non_null_tokens)
+        self._weights = weights
+        self._non_null_weights = non_null_weights
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Drop the cached counters. To call if the tokens were modified.
+        """
+        self._counts = None
+        self._non_null_counts = None
+        self._opcodes = None
+        self._widths = None
+        self._texts = None
+
+    def _get_counts(self) -> Counter[Token]:
+        """
+        :return: the weighted counts of the tokens, computed in one pass
+        """
+        if self._counts is None:
+            self._counts = _weighted_counter(
+                self._tokens, self._tokens.align(self._weights))
+        return self._counts
+
+    def _get_non_null_counts(self) -> Counter[Token]:
+        if self._non_null_counts is None:
+            self._non_null_counts = _weighted_counter(
+                self._non_null_tokens,
+                self._non_null_tokens.align(self._non_null_weights))
+        return self._non_null_counts
+
+    def _get_unique_counts(self) -> Counter[Token]:
+        """
+        :return: the counts used to find the unique values: the non null
+        tokens, or all the tokens if every token is null.
+        """
+        if self._non_null_tokens:
+            return self._get_non_null_counts()
+        else:
+            return self._get_counts()
 
     def stats(self) -> Mapping[Token, float]:
-        counter = collections.Counter(self._tokens)
-        return {k: v / len(self._tokens) for k, v in
-                counter.items()}
+        counter = self._get_counts()
+        total = sum(self._tokens.align(self._weights))
+        return {k: v / total for k, v in counter.items()}
 
     @property
     def non_null_tokens(self):
@@ -166,42 +407,68 @@ class ColumnInfos:
 
     @property
     def opcodes(self) -> Mapping[OpCode, int]:
-        return collections.Counter([t.opcode for t in self._non_null_tokens])
+        if self._opcodes is None:
+            self._opcodes = _aggregate(self._get_non_null_counts(),
+                                       lambda t: t.opcode)
+        return self._opcodes
 
     @property
     def unique_width(self) -> int:
-        return self._unique(lambda t: len(t.text))
+        if self._widths is None:
+            self._widths = _aggregate(self._get_unique_counts(),
+                                      lambda t: len(t.text))
+        return get_unique(self._widths, self._threshold)
 
     @property
     def unique_token(self):
-        return self._unique(lambda t: t)
+        return get_unique(self._get_unique_counts(), self._threshold)
 
     @property
     def unique_opcode(self):
-        return self._unique(lambda t: t.opcode)
-
-    @property
-    def texts(self):
-        return set([t.text.casefold() for t in self._tokens])
-
-    def _unique(self, func: Callable[[Token], T]) -> T:
         if self._non_null_tokens:
-            tokens = self.non_null_tokens
+            counter = self.opcodes
         else:
-            tokens = self._tokens
-        counter = collections.Counter(func(t) for t in tokens)
+            counter = _aggregate(self._get_counts(), lambda t: t.opcode)
         return get_unique(counter, self._threshold)
 
+    @property
+    def texts(self):
+        if self._texts is None:
+            self._texts = frozenset(t.text.casefold()
+                                    for t in self._get_counts())
+        return self._texts
+
     def split_at(self, n) -> Tuple["ColumnInfos", "ColumnInfos"]:
+        weights = self._tokens.align(self._weights)
+        non_null_weights = self._non_null_tokens.align(self._non_null_weights)
         tokens = [Token(t.opcode, t.text[:n]) for t in self._tokens]
         non_null_tokens = [Token(t.opcode, t.text[:n]) for t in
                            self._non_null_tokens]
         first = ColumnInfos(TokenRow(tokens), TokenRow(non_null_tokens),
-                            self._threshold)
+                            self._threshold, weights, non_null_weights)
 
         tokens = [Token(t.opcode, t.text[n:]) for t in self._tokens]
         non_null_tokens = [Token(t.opcode, t.text[n:]) for t in
                            self._non_null_tokens]
         second = ColumnInfos(TokenRow(tokens), TokenRow(non_null_tokens),
-                             self._threshold)
+                             self._threshold, weights, non_null_weights)
         return first, second
+
+
+def _weighted_counter(values: Iterable[T], weights: Sequence[int]
+                      ) -> Counter[T]:
+    counter = collections.Counter()
+    for value, weight in zip(values, weights):
+        counter[value] += weight
+    return counter
+
+
+def _aggregate(counter: Mapping[Token, int], func: Callable[[Token], T]
+               ) -> Counter[T]:
+    """
+    :return: the counts of the values of func, from the counts of the tokens
+    """
+    aggregated = collections.Counter()
+    for token, count in counter.items():
+        aggregated[func(token)] += count
+    return aggregated
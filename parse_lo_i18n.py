@@ -17,82 +17,166 @@
 #
 #   You should have received a copy of the GNU General Public License
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Build the locale data of ColumnDet from the LibreOffice locale data:
+
+    python parse_lo_i18n.py path/to/i18npool/source/localedata/data [dir]
+
+Writes `dir/i18n_data.py` (the tables) and `dir/i18n_index.bin` (the
+compiled index, see `columndet.i18n_index`). `dir` defaults to the
+`columndet` directory. The candidate separators and currencies are printed
+to help to update the curated sets of `columndet/i18n.py`.
+"""
+import collections
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
-import collections
+from typing import Dict, List, Sequence, Tuple
+
+from columndet.i18n_index import (names_entries, true_false_entries,
+                                  write_index)
+
+LocaleData = collections.namedtuple(
+    "LocaleData", ["true_false_by_locale", "names_by_datecode_by_locale",
+                   "counter_by_constant"])
 
-if len(sys.argv) != 2:
-    raise Exception("First arg should be a path to i18npool/source/localedata/data directory of LibreOffice.")
-else:
-    source = sys.argv[1]
-
-true_false_by_locale = {}
-number_seps = collections.Counter()
-datetime_seps = collections.Counter()
-curr_codes = collections.Counter()
-curr_symbols = collections.Counter()
-names_by_datecode_by_locale = {}
-
-for source in Path(source).glob("*.xml"):
-    tree = ET.parse(source)
-    root = tree.getroot()
-    for separators in root.findall("./LC_MISC/ReservedWords"):
-        true_false_by_locale[source.stem] = (
-            separators.find("trueWord").text.casefold(),
-            separators.find("falseWord").text.casefold())
-    for separators in root.findall("./LC_CTYPE/Separators"):
-        number_seps[separators.find("ThousandSeparator").text.casefold()] += 1
-        number_seps[separators.find("DecimalSeparator").text.casefold()] += 1
-        datetime_seps[separators.find("DateSeparator").text.casefold()] += 1
-        datetime_seps[separators.find("TimeSeparator").text.casefold()] += 1
-
-    for separators in root.findall("./LC_CURRENCY/Currency"):
-        curr_symbols[separators.find("CurrencySymbol").text.casefold()] += 1
-        curr_codes[separators.find("CurrencyID").text.casefold()] += 1
-
-    name_by_datecode = names_by_datecode_by_locale.setdefault(source.stem, {})
-    for day in root.findall("./LC_CALENDAR/Calendar/DaysOfWeek/Day"):
-        name_by_datecode.setdefault("day", set()).add(
-            day.find("DefaultFullName").text.casefold()),
-        name_by_datecode.setdefault("dy", set()).add(
-            day.find("DefaultAbbrvName").text.casefold())
-
-    for month in root.findall("./LC_CALENDAR/Calendar/MonthsOfYear/Month"):
-        name_by_datecode.setdefault("month", []).append(
-            month.find("DefaultFullName").text.casefold()),
-        name_by_datecode.setdefault("mon", []).append(
-            month.find("DefaultAbbrvName").text.casefold())
-
-print("""# coding: utf-8
+DATA_HEADER = """# coding: utf-8
+
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+\"\"\"
+The large locale tables, loaded by `columndet.i18n` on first access. Use
+the accessors of `columndet.i18n` rather than this module.
 
+Generated by parse_lo_i18n.py: do not edit.
+\"\"\"
 # Data is retrieved from LibreOffice:
 # https://github.com/LibreOffice/core/tree/master/i18npool/source/localedata/data
-""")
-
-print("TRUE_FALSE_BY_LOCALE_NAME = {")
-for k, (t, f) in sorted(true_false_by_locale.items()):
-    print(f"    {repr(k)}: ({repr(t)}, {repr(f)}),")
-print("}")
-
-for constant, counter in [("NUMBER_SEPARATORS", number_seps),
-                          ("DATETIME_SEPARATORS", datetime_seps),
-                          ("CURRENCY_SYMBOLS", curr_symbols),
-                          ("CURRENCY_CODES", curr_codes),
-                          ]:
-    print()
-    print(f"{constant} = {{")
-    print(", ".join(repr(sep) for sep, _c in counter.most_common()))
-    print("}")
-
-print("PERCENTAGE_SIGNS = {\"%\"}")
-
-print()
-print("NAMES_BY_DATECODE_BY_LOCALE = {")
-for locale, names_by_datecode in names_by_datecode_by_locale.items():
-    print(f"    {repr(locale)}: {{")
-    for datecode, names in names_by_datecode.items():
-        names = ", ".join(repr(n) for n in names)
-        print(f"        {repr(datecode)}: {{{names}}},")
-    print("    },")
-print("}")
+"""
+
+
+def main(argv: List[str]):
+    if len(argv) not in (2, 3):
+        raise Exception("First arg should be a path to "
+                        "i18npool/source/localedata/data directory of "
+                        "LibreOffice.")
+    source = Path(argv[1])
+    if len(argv) == 3:
+        dest = Path(argv[2])
+    else:
+        dest = Path(__file__).parent / "columndet"
+
+    data = parse(source)
+    write_data_module(dest / "i18n_data.py", data)
+    # written after the data module: an older index is ignored
+    write_index(str(dest / "i18n_index.bin"), {
+        "names": names_entries(data.names_by_datecode_by_locale),
+        "true_false": true_false_entries(data.true_false_by_locale)})
+    for constant, counter in data.counter_by_constant.items():
+        print(f"{constant}: " + ", ".join(
+            repr(value) for value, _c in counter.most_common()))
+
+
+def parse(source: Path) -> LocaleData:
+    """
+    :param source: the i18npool/source/localedata/data directory
+    :return: the data of every locale
+    """
+    true_false_by_locale = {}  # type: Dict[str, Tuple[str, str]]
+    number_seps = collections.Counter()
+    datetime_seps = collections.Counter()
+    curr_codes = collections.Counter()
+    curr_symbols = collections.Counter()
+    names_by_datecode_by_locale = {}  # type: Dict[str, Dict[str, List[str]]]
+
+    # not sorted: the order of the locales decides which locale wins the
+    # first match lookups, and the shipped data follows the directory order
+    for path in source.glob("*.xml"):
+        root = ET.parse(path).getroot()
+        for separators in root.findall("./LC_MISC/ReservedWords"):
+            true_false_by_locale[path.stem] = (
+                separators.find("trueWord").text.casefold(),
+                separators.find("falseWord").text.casefold())
+        for separators in root.findall("./LC_CTYPE/Separators"):
+            number_seps[_find_text(separators, "ThousandSeparator")] += 1
+            number_seps[_find_text(separators, "DecimalSeparator")] += 1
+            datetime_seps[_find_text(separators, "DateSeparator")] += 1
+            datetime_seps[_find_text(separators, "TimeSeparator")] += 1
+
+        for currency in root.findall("./LC_CURRENCY/Currency"):
+            curr_symbols[_find_text(currency, "CurrencySymbol")] += 1
+            curr_codes[_find_text(currency, "CurrencyID")] += 1
+
+        names_by_datecode = names_by_datecode_by_locale.setdefault(path.stem,
+                                                                   {})
+        for day in root.findall("./LC_CALENDAR/Calendar/DaysOfWeek/Day"):
+            _add_name(names_by_datecode, "day", day, "DefaultFullName")
+            _add_name(names_by_datecode, "dy", day, "DefaultAbbrvName")
+
+        for month in root.findall(
+                "./LC_CALENDAR/Calendar/MonthsOfYear/Month"):
+            _add_name(names_by_datecode, "month", month, "DefaultFullName")
+            _add_name(names_by_datecode, "mon", month, "DefaultAbbrvName")
+
+    return LocaleData(
+        dict(sorted(true_false_by_locale.items())),
+        names_by_datecode_by_locale,
+        collections.OrderedDict([("NUMBER_SEPARATORS", number_seps),
+                                 ("DATETIME_SEPARATORS", datetime_seps),
+                                 ("CURRENCY_SYMBOLS", curr_symbols),
+                                 ("CURRENCY_CODES", curr_codes)]))
+
+
+def _find_text(element: ET.Element, tag: str) -> str:
+    return element.find(tag).text.casefold()
+
+
+def _add_name(names_by_datecode: Dict[str, List[str]], datecode: str,
+              element: ET.Element, tag: str):
+    names = names_by_datecode.setdefault(datecode, [])
+    name = _find_text(element, tag)
+    if name not in names:
+        names.append(name)
+
+
+def write_data_module(path: Path, data: LocaleData):
+    """
+    :param path: the path of the module
+    :param data: the data
+    """
+    lines = [DATA_HEADER, "TRUE_FALSE_BY_LOCALE_NAME = {"]
+    for locale, (t, f) in data.true_false_by_locale.items():
+        lines.append(f"    {locale!r}: ({t!r}, {f!r}),")
+    lines.append("}")
+    lines.append("")
+    lines.append("NAMES_BY_DATECODE_BY_LOCALE = {")
+    for locale, names_by_datecode in data.names_by_datecode_by_locale.items():
+        lines.append(f"    {locale!r}: {{")
+        for datecode, names in names_by_datecode.items():
+            lines.append(f"        {datecode!r}: {_set_literal(names)},")
+        lines.append("    },")
+    lines.append("}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _set_literal(names: Sequence[str]) -> str:
+    return "{" + ", ".join(repr(name) for name in names) + "}"
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -32,14 +32,14 @@ setup(
     author='Julien Férard',
     license='GPLv3',
     packages=['columndet'],
-    python_requires='>=3.6',
+    package_data={'columndet': ['i18n_data.marshal', 'i18n_index.bin']},
+    python_requires='>=3.7',
     url='https://github.com/jferard/columndet',
     classifiers=[
         'Development Status :: 1 - Planning',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: GNU General Public License v3 (GPLv3)',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
@@ -55,5 +55,8 @@ setup(
     install_requires=[
         "chardet>=3.0.4",
         "mcsv"
-    ]
+    ],
+    extras_require={
+        "numpy": ["numpy>=1.15"],
+    }
 )
@@ -0,0 +1,57 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import unittest
+
+from columndet.accumulator import ColumnAccumulator
+from columndet.parser import Parser
+
+
+class AccumulatorTest(unittest.TestCase):
+    def test_batches(self):
+        parser = Parser.create()
+        accumulator = ColumnAccumulator.create(parser)
+        texts = ["1 234,5", "12,25", "3", "-7 654,75"] * 10
+        for i in range(0, len(texts), 7):
+            accumulator.feed(texts[i:i + 7])
+        self.assertEqual(str(parser.parse(texts)), str(accumulator.result()))
+
+    def test_summaries(self):
+        parser = Parser.create()
+        accumulator = ColumnAccumulator.create(parser, max_distinct=5)
+        accumulator.feed(f"{d:02}/{m:02}/20{y:02}" for y in range(10, 20)
+                         for m in range(1, 13) for d in range(1, 29))
+        self.assertEqual("date/dd\\/MM\\/yyyy", str(accumulator.result()))
+        self.assertEqual(0, accumulator.dropped)
+
+    def test_dropped(self):
+        parser = Parser.create()
+        accumulator = ColumnAccumulator.create(parser, max_distinct=5,
+                                               max_shapes=3)
+        self.assertIs(parser.lexer, accumulator._lexer)
+        accumulator.feed(str(i) for i in range(1, 1000))  # 3 shapes
+        accumulator.feed(f"{'x' * a} {'y' * b}" for a in range(1, 11)
+                         for b in range(1, 11))
+        self.assertEqual(100, accumulator.dropped)
+        self.assertEqual(1099, sum(accumulator.counts().values()))
+        self.assertEqual("text", str(accumulator.result()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import unittest
+
+from columndet.cache import ShapeCache, LRUCache, fingerprint
+from columndet.parser import Parser
+from columndet.stats import ParserStats
+
+
+class CacheTest(unittest.TestCase):
+    def test_lru(self):
+        cache = ShapeCache(2)
+        self.assertEqual(1, cache.get_or_compute("a", lambda: 1))
+        self.assertEqual(2, cache.get_or_compute("b", lambda: 2))
+        self.assertEqual(1, cache.get_or_compute("a", lambda: 10))
+        self.assertEqual(3, cache.get_or_compute("c", lambda: 3))
+        self.assertEqual(20, cache.get_or_compute("b", lambda: 20))
+        self.assertEqual({"size": 2, "maxsize": 2, "hits": 1, "misses": 4,
+                          "evictions": 2}, cache.stats())
+
+    def test_parser(self):
+        cache = ShapeCache()
+        parser = Parser.create(shape_cache=cache)
+        texts = ["1,234.5", "12.25", "3,456.75", "1.5"] * 10
+        self.assertEqual("float/,/.", str(parser.parse(texts)))
+        misses = cache.misses
+        self.assertEqual("float/,/.", str(parser.parse(texts)))
+        self.assertEqual(misses, cache.misses)
+        self.assertLess(0, cache.hits)
+
+    def test_ttl(self):
+        now = [0.0]
+        cache = LRUCache(ttl=10, clock=lambda: now[0])
+        self.assertEqual(1, cache.get_or_compute("a", lambda: 1))
+        now[0] = 9.0
+        self.assertEqual(1, cache.get_or_compute("a", lambda: 2))
+        now[0] = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual({"size": 0, "maxsize": 4096, "hits": 1, "misses": 2,
+                          "evictions": 1}, cache.stats())
+
+    def test_none_value(self):
+        cache = LRUCache()
+        self.assertIsNone(cache.get_or_compute("a", lambda: None))
+        self.assertIsNone(cache.get_or_compute("a", lambda: 1))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint({"a": 1, "b": 2}),
+                         fingerprint({"b": 2, "a": 1}))
+        self.assertNotEqual(fingerprint({"a": 1, "b": 2}),
+                            fingerprint({"a": 2, "b": 1}))
+        self.assertNotEqual(fingerprint({"ab": 1, "c": 1}),
+                            fingerprint({"a": 1, "bc": 1}))
+
+    def test_column_cache(self):
+        stats = ParserStats()
+        parser = Parser.create(stats=stats, column_cache_size=16)
+        self.assertEqual("float/,/.", str(parser.parse(
+            ["1,234.5", "12.25", "3,456.75", "1.5"] * 10)))
+        self.assertEqual("float/,/.", str(parser.parse(
+            ["1.5", "3,456.75", "12.25", "1,234.5"] * 10)))
+        self.assertNotIn("column cache", stats.columns[0].branches)
+        self.assertEqual(["column cache"], stats.columns[1].branches)
+
+
+if __name__ == '__main__':
+    unittest.main()
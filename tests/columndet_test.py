@@ -17,12 +17,32 @@
 #   along with this program.  If not, see <http://www.gnu.org/licenses/>.
 #
 
+import os
+import subprocess
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-from columndet.parser import Parser
+from columndet.booldet import get_true_false_index
+from columndet.datedet import get_names_index
+from columndet.i18n import LocaleSelection, SELECTION_CACHE_SIZE
+from columndet.lexer import Lexer
+from columndet.parser import Parser, ColumnAnalysis
+from columndet.stats import ParserStats
 
 
 class ColumnDetTest(unittest.TestCase):
+    def test_lazy_import(self):
+        # a fresh interpreter: the modules of the tests are already imported
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, columndet; print('numpy' in sys.modules)"],
+            cwd=root, check=True, stdout=subprocess.PIPE,
+            universal_newlines=True).stdout
+        self.assertEqual("False", output.strip())
+
     def test(self):
         parser = Parser.create()
         self.assertEqual("text", str(parser.parse(["entrée"] * 100)))
@@ -40,6 +60,133 @@ class ColumnDetTest(unittest.TestCase):
              '20201104', '20201108', '20201111', '20201113', '20201117',
              '20201120', '20201124'])))
 
+    def test_parse_counts(self):
+        parser = Parser.create()
+        texts = ['1 234,5', '12,25', '1 234,5', '3', '1 234,5', 'entrée']
+        self.assertEqual(str(parser.parse(texts * 50)), str(parser.parse_counts(
+            {'1 234,5': 150, '12,25': 50, '3': 50, 'entrée': 50})))
+
+    def test_shared_parser(self):
+        parser = Parser.create()
+        datetimes = ['2020-09-18 10:20:30', '2020-09-20 23:59:01',
+                     '2020-10-01 00:00:00', '2020-10-11 12:30:45']
+        dates = ['20200918', '20200920', '20201001', '20201124']
+        expected = ['datetime/yyyy-MM-dd HH:mm:ss', 'date/yyyyMMdd'] * 20
+        with ThreadPoolExecutor(4) as executor:
+            descriptions = executor.map(parser.parse,
+                                        [datetimes, dates] * 20)
+            self.assertEqual(expected, [str(d) for d in descriptions])
+
+    def test_confidence(self):
+        parser = Parser.create(confidence=0.99)
+        texts = [str(i * 7) for i in range(100000)]
+        consumed = []
+
+        def iter_texts():
+            for text in texts:
+                consumed.append(text)
+                yield text
+
+        self.assertEqual("integer", str(parser.parse(iter_texts())))
+        self.assertLess(len(consumed), len(texts))
+        self.assertEqual("integer", str(parser.parse(texts[:100])))
+
+    def test_confidence_bounds(self):
+        for confidence in (0.0, 1.0, -0.5, 1.5):
+            with self.assertRaises(ValueError):
+                Parser.create(confidence=confidence)
+
+        texts = [str(i * 7) for i in range(10000)]
+        for confidence in (0.01, 0.999999):
+            self.assertEqual("integer", str(
+                Parser.create(confidence=confidence).parse(texts)))
+
+    def test_confidence_sorted(self):
+        # sorted: the days of the first 1320 texts are <= 12
+        texts = [f"2020-{m:02d}-{d:02d}" for d in range(1, 29)
+                 for m in range(1, 13) for _ in range(10)]
+        self.assertEqual("date/yyyy-MM-dd", str(Parser.create().parse(texts)))
+        self.assertEqual("date/yyyy-MM-dd",
+                         str(Parser.create(confidence=0.99).parse(texts)))
+
+    def test_confidence_stats(self):
+        stats = ParserStats()
+        parser = Parser.create(confidence=0.99, stats=stats)
+        texts = (str(i * 7) for i in range(100000))
+        self.assertEqual("integer", str(parser.parse(texts, "n")))
+        self.assertEqual(1, stats.summary()["columns"])
+        column_stats, = stats.columns
+        self.assertEqual("n", column_stats.name)
+        batches = [b for b in column_stats.branches if b.startswith("batch")]
+        self.assertLess(1, len(batches))
+        self.assertEqual(sum((64, 256, 1024, 4096)[:len(batches)]),
+                         column_stats.rows)
+
+    def test_stats(self):
+        stats = ParserStats()
+        parser = Parser.create(stats=stats)
+        parser.parse(['1 234,5', '12,25', '3'] * 10, "amount")
+        column_stats, = stats.columns
+        self.assertEqual("amount", column_stats.name)
+        self.assertEqual(30, column_stats.rows)
+        self.assertEqual(3, column_stats.distinct)
+        self.assertEqual("no unique size", column_stats.branches[0])
+        self.assertEqual(["lex", "rows_infos"],
+                         list(column_stats.seconds_by_stage)[:2])
+        self.assertIn("amount", stats.report())
+        self.assertEqual(1, stats.summary()["columns"])
+
+    def test_column_analysis(self):
+        column = Lexer().lex_many(["12/05/2020", "1,5", "12/06/2020"])
+        analysis = ColumnAnalysis(column, 0.95)
+        self.assertEqual({5: 2, 3: 1}, analysis.rows_infos.sizes)
+        row = analysis.token_rows(3)[0]
+        row.pop()
+        self.assertEqual(3, len(analysis.token_rows(3)[0]))
+        self.assertIs(analysis.column_infos(5), analysis.column_infos(5))
+        self.assertEqual(5, len(analysis.column_infos(5)))
+
+    def test_column_analysis_sized_rows(self):
+        column = Lexer().lex_many(["12/05/2020", "1,5", "12/06/2020"])
+        analysis = ColumnAnalysis(column, 0.95)
+        with mock.patch.object(column, "token_rows",
+                               wraps=column.token_rows) as token_rows:
+            self.assertEqual(2, len(analysis.token_rows(5)))
+            self.assertEqual(5, len(analysis.column_infos(5)))
+            token_rows.assert_called_once_with(5)
+            self.assertEqual(3, len(analysis.token_rows()))
+            self.assertEqual(1, len(analysis.token_rows(3)))
+            token_rows.assert_called_with()
+            self.assertEqual(2, token_rows.call_count)
+
+        # the column infos are read from the arrays
+        analysis = ColumnAnalysis(column, 0.95)
+        with mock.patch.object(column, "token_rows") as token_rows:
+            self.assertEqual(5, len(analysis.column_infos(5)))
+            token_rows.assert_not_called()
+
+    def test_locales(self):
+        texts = ["mercredi 26 septembre 2040", "mardi 30 novembre 2021",
+                 "dimanche 10 octobre 2004", "vendredi 29 septembre 2023"]
+        self.assertEqual("date/day dd month yyyy/ngz_CG",
+                         str(Parser.create().parse(texts)))
+        self.assertEqual("date/day dd month yyyy/fr_FR",
+                         str(Parser.create(preferred_locales=["fr_FR"]
+                                           ).parse(texts)))
+        self.assertEqual("date/day dd month yyyy/fr_FR",
+                         str(Parser.create(locales=["fr_FR", "en_US"]
+                                           ).parse(texts)))
+
+    def test_locale_selection_cache(self):
+        for i in range(SELECTION_CACHE_SIZE + 8):
+            selection = LocaleSelection.create(preferred_locales=[f"xx_{i}"])
+            get_names_index(selection)
+            get_true_false_index(selection)
+        self.assertGreaterEqual(SELECTION_CACHE_SIZE,
+                                get_names_index.cache_info().currsize)
+        self.assertGreaterEqual(SELECTION_CACHE_SIZE,
+                                get_true_false_index.cache_info().currsize)
+
 
 if __name__ == '__main__':
     unittest.main()
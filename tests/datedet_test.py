@@ -19,8 +19,10 @@
 
 import unittest
 
-from columndet import (YMDColumnTypeSniffer, HMSColumnTypeSniffer, DateSniffer)
-from columndet.util import Token, OpCode, TokenRow
+from columndet import (YMDColumnTypeSniffer, HMSColumnTypeSniffer, DateSniffer,
+                       YMDBlockSniffer, HMSBlockSniffer)
+from columndet.cache import ShapeCache
+from columndet.util import Token, OpCode, TokenRow, ColumnInfos
 
 
 class DateDetTest(unittest.TestCase):
@@ -34,6 +36,38 @@ class DateDetTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             sniffer.sniff()
 
+    def test_blocks(self):
+        ymd_col_type_sniffer = YMDColumnTypeSniffer.create(0.95)
+        dates = ColumnInfos.create(
+            [Token(OpCode.NUMBER, t) for t in ["20201001", "19991231"]],
+            None, 0.95)
+        self.assertEqual("yyyyMMdd", YMDBlockSniffer(ymd_col_type_sniffer,
+                                                     dates).sniff())
+        dates = ColumnInfos.create(
+            [Token(OpCode.NUMBER, t) for t in ["311299", "010120"]],
+            None, 0.95)
+        self.assertEqual("ddMMyy", YMDBlockSniffer(ymd_col_type_sniffer,
+                                                   dates).sniff())
+        times = ColumnInfos.create(
+            [Token(OpCode.NUMBER, t) for t in ["235959", "000000"]],
+            None, 0.95)
+        self.assertEqual("HHmmss", HMSBlockSniffer(times).sniff())
+        times = ColumnInfos.create(
+            [Token(OpCode.NUMBER, t) for t in ["246000", "000000"]],
+            None, 0.95)
+        with self.assertRaises(ValueError):
+            HMSBlockSniffer(times).sniff()
+
+    def test_day_month_shape_cache(self):
+        shape_cache = ShapeCache()
+        months = ColumnInfos.create(
+            [Token(OpCode.TEXT, t) for t in ["janvier", "mars"]], None, 0.95)
+        self.assertNotEqual("xx_XX", YMDColumnTypeSniffer.create(
+            0.95, shape_cache).find_day_month_part(months).locale)
+        custom = YMDColumnTypeSniffer(0.95, {"xx_XX": {
+            "month": ["janvier", "mars"]}}, shape_cache)
+        self.assertEqual("xx_XX", custom.find_day_month_part(months).locale)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,52 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+import unittest
+
+from columndet.encoding import detect_encoding, DetectedEncoding
+
+
+class EncodingTest(unittest.TestCase):
+    def test_bom(self):
+        self.assertEqual(DetectedEncoding("UTF-8-SIG", "bom"),
+                         detect_encoding("a;é\n".encode("utf-8-sig")))
+        self.assertEqual(DetectedEncoding("UTF-16", "bom"),
+                         detect_encoding("a;é\n".encode("utf-16")))
+        self.assertEqual(DetectedEncoding("UTF-32", "bom"),
+                         detect_encoding("a;é\n".encode("utf-32")))
+
+    def test_ascii(self):
+        self.assertEqual(DetectedEncoding("utf-8", "ascii"),
+                         detect_encoding(b"a,b\n1,2\n"))
+
+    def test_utf8(self):
+        self.assertEqual(DetectedEncoding("utf-8", "utf-8"),
+                         detect_encoding("a;é\n1;€".encode("utf-8")))
+
+    def test_truncated_utf8(self):
+        self.assertEqual(DetectedEncoding("utf-8", "utf-8"),
+                         detect_encoding("a;é\n1;€".encode("utf-8")[:-1]))
+
+    def test_chardet(self):
+        data = ("\nПривет мир, как дела\n" * 50).encode("cp1251")
+        self.assertEqual(DetectedEncoding("cp1251", "chardet"),
+                         detect_encoding(data))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import tempfile
+import unittest
+
+from columndet.i18n_index import open_index, write_index
+from columndet.index import InvertedIndex
+
+
+class I18nIndexTest(unittest.TestCase):
+    def test_same_as_inverted_index(self):
+        entries = [(("fr_FR", "month"), ["janvier", "février", "mars"]),
+                   (("es_ES", "month"), ["enero", "febrero", "marzo"]),
+                   (("xx_XX", "month"), ["mars", "marzo"])]
+        expected = InvertedIndex.create(entries)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.bin")
+            write_index(path, {"names": entries})
+            index = open_index(path)["names"]
+            self.assertEqual(3, len(index))
+            for words in [{"mars"}, {"Marzo"}, {"mars", "marzo"},
+                          {"février"}, {"mars", "enero"}, {"avril"}, set()]:
+                self.assertEqual(expected.find_first(words),
+                                 index.find_first(words))
+
+    def test_invalid(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.bin")
+            self.assertIsNone(open_index(path))
+            with open(path, "wb") as dest:
+                dest.write(b"garbage")
+            self.assertIsNone(open_index(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
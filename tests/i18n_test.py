@@ -0,0 +1,62 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import tempfile
+import unittest
+
+from columndet import i18n
+
+
+class I18nTest(unittest.TestCase):
+    def test_accessors(self):
+        self.assertEqual(('vrai', 'faux'),
+                         i18n.get_true_false_by_locale_name()['fr_FR'])
+        self.assertIn('janvier',
+                      i18n.get_names_by_datecode_by_locale()['fr_FR']['month'])
+        self.assertIs(i18n.get_names_by_datecode_by_locale(),
+                      i18n.NAMES_BY_DATECODE_BY_LOCALE)
+        with self.assertRaises(AttributeError):
+            i18n.FOO
+
+    def test_blob(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "i18n_data.marshal")
+            self.assertIsNone(i18n._load_blob(path))
+            i18n.write_blob(path)
+            tables = i18n._load_blob(path)
+            self.assertEqual(list(i18n.get_true_false_by_locale_name()),
+                             list(tables["TRUE_FALSE_BY_LOCALE_NAME"]))
+            with open(path, "wb") as dest:
+                dest.write(b"garbage")
+            self.assertIsNone(i18n._load_blob(path))
+
+    def test_locale_selection(self):
+        self.assertIsNone(i18n.LocaleSelection.create())
+        table = {"a": 1, "b": 2, "c": 3, "d": 4}
+        selection = i18n.LocaleSelection.create(preferred_locales=["c", "z"])
+        self.assertEqual(["c", "a", "b", "d"], list(selection.select(table)))
+        selection = i18n.LocaleSelection.create(["b", "c"], ["c"])
+        self.assertEqual(["c", "b"], list(selection.select(table)))
+        self.assertEqual(hash(selection),
+                         hash(i18n.LocaleSelection.create({"c", "b"}, ["c"])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,7 +20,7 @@
 import unittest
 
 from columndet import OpCode
-from columndet.lexer import Lexer
+from columndet.lexer import Lexer, TableLexer
 from columndet.util import Token
 
 
@@ -29,6 +29,34 @@ class LexerTest(unittest.TestCase):
         lexer = Lexer()
         self.assertEqual([Token(OpCode.TEXT, 'entrée')], lexer.lex("entrée"))
 
+    def test_table_lexer(self):
+        lexer = Lexer()
+        table_lexer = TableLexer()
+        for text in ["entrée", " 26 sept. 40 ", "1 234,56 €", "-12.5%",
+                     "2020-09-18T10:20:30,5+01:00", "a..b.,c", ".5", "٣٫٥",
+                     "x²", "", "  "]:
+            self.assertEqual(lexer.lex(text), table_lexer.lex(text))
+
+    def test_lex_many(self):
+        texts = ["12,5 €", "", " 1 234,5 € ", "entrée"]
+        for lexer in [Lexer(), TableLexer()]:
+            column = lexer.lex_many(texts)
+            self.assertEqual(4, len(column))
+            self.assertEqual([5, 0, 7, 1], list(column.counts))
+            self.assertEqual([Token(OpCode.NUMBER, '1'),
+                              Token(OpCode.SPACE, ' '),
+                              Token(OpCode.NUMBER, '234'),
+                              Token(OpCode.PUNCTUATION, ','),
+                              Token(OpCode.NUMBER, '5'),
+                              Token(OpCode.SPACE, ' ')],
+                             column.tokens(2)[:6])
+            self.assertEqual({5: 1, 7: 1, 1: 1}, column.sizes())
+            self.assertEqual({Token(OpCode.TEXT, '€'): 2,
+                              Token(OpCode.TEXT, 'entrée'): 1},
+                             column.last_tokens())
+            self.assertEqual(([[Token(OpCode.TEXT, 'entrée')]], [1]),
+                             column.token_columns(1))
+
 
 if __name__ == '__main__':
     unittest.main()
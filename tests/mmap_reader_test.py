@@ -0,0 +1,74 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+import tempfile
+import unittest
+from pathlib import Path
+
+from columndet.mmap_reader import MmapReader, is_ascii_compatible
+
+
+class MmapReaderTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = Path(self._directory.name, "data.csv")
+        self.lines = [f"{i};é{i}\n" for i in range(1000)]
+        self.path.write_text("".join(self.lines), encoding="utf-8")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_line_range(self):
+        with MmapReader.open(self.path) as reader:
+            self.assertEqual((0, 0), reader.line_range(0, 5))
+            self.assertEqual("1;é1\n2;é2\n3;é3\n", reader.decode(
+                reader.line_range(1, 20), "utf-8"))
+            self.assertEqual((reader.size, reader.size),
+                             reader.line_range(reader.size - 3, 10))
+
+    def test_spread_ranges(self):
+        with MmapReader.open(self.path) as reader:
+            ranges = reader.spread_ranges(100)
+            self.assertEqual(3, len(ranges))
+            self.assertEqual(0, ranges[0][0])
+            self.assertEqual(reader.size, ranges[-1][1])
+            for (_, end), (start, _) in zip(ranges, ranges[1:]):
+                self.assertLess(end, start)
+            for byte_range in ranges:
+                text = reader.decode(byte_range, "utf-8")
+                self.assertTrue(text.endswith("\n"))
+                for line in text.splitlines(keepends=True):
+                    self.assertIn(line, self.lines)
+
+    def test_small_file(self):
+        with MmapReader.open(self.path) as reader:
+            self.assertEqual([(0, reader.size)], reader.spread_ranges(10000))
+        self.path.write_bytes(b"")
+        with MmapReader.open(self.path) as reader:
+            self.assertEqual("", reader.decode(reader.spread_ranges(10)[0],
+                                               "utf-8"))
+
+    def test_is_ascii_compatible(self):
+        self.assertTrue(is_ascii_compatible("utf-8-sig"))
+        self.assertTrue(is_ascii_compatible("latin-1"))
+        self.assertFalse(is_ascii_compatible("utf-16"))
+        self.assertFalse(is_ascii_compatible("unknown"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import unittest
+from unittest import mock
+
+from columndet.lexer import Lexer
+from columndet.parser import Parser
+from columndet.npcolumn import (HAS_NUMPY, NumpyLexedColumn,
+                                digit_slot_bounds)
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class NumpyLexedColumnTest(unittest.TestCase):
+    def test_same_as_column(self):
+        texts = ["12,5 €", "", " 1 234,5 € ", "entrée", "12,5 €"]
+        column = Lexer().lex_many(texts, [2, 1, 3, 1, 1])
+        np_column = NumpyLexedColumn.from_column(column)
+        self.assertEqual([0, 5, 5, 12, 13], np_column.starts.tolist())
+        self.assertEqual(column.sizes(), np_column.sizes())
+        self.assertEqual(column.first_tokens(), np_column.first_tokens())
+        self.assertEqual(column.last_tokens(), np_column.last_tokens())
+        self.assertEqual([(list(row), row.weight)
+                          for row in column.token_rows(5)],
+                         [(list(row), row.weight)
+                          for row in np_column.token_rows(5)])
+        self.assertEqual(column.token_columns(5), np_column.token_columns(5))
+        self.assertEqual(([], []), np_column.token_columns(4))
+
+    def test_sized_rows(self):
+        parser = Parser.create(numpy_backend=True)
+        texts = ["2020-01-13", "2020-02-14", "2021-12-31", "2019-06-15"] * 5
+        with mock.patch.object(NumpyLexedColumn, "token_rows", autospec=True,
+                               side_effect=NumpyLexedColumn.token_rows
+                               ) as token_rows:
+            self.assertEqual("date/yyyy-MM-dd", str(parser.parse(texts)))
+        self.assertTrue(token_rows.called)
+        for call in token_rows.call_args_list:
+            _, size = call[0]
+            self.assertEqual(5, size)
+
+    def test_digit_slot_bounds(self):
+        self.assertEqual([(19, 20), (10, 12), (1, 31)],
+                         digit_slot_bounds(["201001", "191231"]))
+        self.assertIsNone(digit_slot_bounds(["20100", "191231"]))
+        self.assertIsNone(digit_slot_bounds(["٢٠١٠٠١"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
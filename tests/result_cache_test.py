@@ -0,0 +1,81 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from columndet.result_cache import ResultCache
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+        self.path = self.directory / "data.csv"
+        self.path.write_text("a,b\n1,2\n")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_get_put(self):
+        cache = ResultCache(self.directory / "cache")
+        key = cache.key(self.path, (0.95, True))
+        self.assertIsNone(cache.get(key))
+        cache.put(key, ("ascii", ["a", "b"]))
+        self.assertEqual(("ascii", ["a", "b"]), cache.get(key))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        self.assertNotEqual(key, cache.key(self.path, (0.9, True)))
+
+        self.path.write_text("a,b\n1,2\n3,4\n")
+        self.assertNotEqual(key, cache.key(self.path, (0.95, True)))
+
+    def test_invalidate(self):
+        cache = ResultCache(self.directory / "cache")
+        key1 = cache.key(self.path, (0.95,))
+        key2 = cache.key(self.path, (0.9,))
+        cache.put(key1, 1)
+        cache.put(key2, 2)
+        cache.invalidate(self.path)
+        self.assertIsNone(cache.get(key1))
+        self.assertIsNone(cache.get(key2))
+
+    def test_eviction(self):
+        cache = ResultCache(self.directory / "cache", max_bytes=250)
+        keys = [cache.key(self.path, (i,)) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, "x" * 100)
+            os.utime(str(cache.directory / (key + ".pickle")),
+                     ns=(i * 10 ** 9, i * 10 ** 9))
+        cache.put(cache.key(self.path, (3,)), "x" * 100)
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertIsNotNone(cache.get(keys[2]))
+
+    def test_corrupted(self):
+        cache = ResultCache(self.directory / "cache")
+        key = cache.key(self.path, ())
+        (cache.directory / (key + ".pickle")).write_bytes(b"garbage")
+        self.assertIsNone(cache.get(key))
+        self.assertFalse((cache.directory / (key + ".pickle")).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+import csv
+import tempfile
+import unittest
+from pathlib import Path
+
+from columndet.sampling import (Sampler, HeadSampler, FullSampler,
+                                ReservoirSampler, SpreadSampler,
+                                UniformSampler, StratifiedSampler,
+                                _MmapSampler)
+
+
+class SemicolonDialect(csv.excel):
+    delimiter = ";"
+
+
+class SamplingTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.path = Path(self._directory.name, "sorted.csv")
+        self.path.write_text("id;value\n" + "".join(
+            f"{i};v{i}\n" for i in range(10000)), encoding="utf-8")
+        self.first_chunk = self.path.read_text()[:1000].rsplit("\n", 1)[0]
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def _ids(self, sampler):
+        rows = list(sampler.rows(self.path, self.first_chunk, "utf-8",
+                                 SemicolonDialect))
+        for row in rows:
+            self.assertEqual([row[0], f"v{row[0]}"], list(row))
+        return [int(row[0]) for row in rows]
+
+    def test_head(self):
+        self.assertEqual(list(range(self.first_chunk.count("\n"))),
+                         self._ids(HeadSampler()))
+        self.assertEqual([0, 1, 2], self._ids(HeadSampler(3)))
+
+    def test_full(self):
+        self.assertEqual(list(range(10000)), self._ids(FullSampler()))
+
+    def test_reservoir(self):
+        ids = self._ids(ReservoirSampler(100, seed=1))
+        self.assertEqual(100, len(set(ids)))
+        self.assertLess(5000, max(ids))
+
+    def test_spread(self):
+        ids = self._ids(SpreadSampler(1000))
+        self.assertEqual(0, ids[0])
+        self.assertEqual(9999, ids[-1])
+        self.assertIn(ids[len(ids) // 2] // 1000, (4, 5))
+
+    def test_uniform(self):
+        ids = self._ids(UniformSampler(100, 1000, seed=1))
+        self.assertLessEqual(len(ids), 100)
+        self.assertEqual(sorted(set(ids)), ids)
+        self.assertLess(9000, max(ids))
+
+    def test_stratified(self):
+        ids = self._ids(StratifiedSampler(1000, 40, strata=4, seed=1))
+        self.assertLessEqual(len(ids), 40)
+        self.assertEqual({0, 1, 2, 3}, {i // 2500 for i in ids})
+
+    def test_small_file(self):
+        self.assertEqual(list(range(10000)),
+                         self._ids(UniformSampler(byte_budget=10 ** 6)))
+
+    def test_not_ascii_compatible(self):
+        rows = list(StratifiedSampler(1000, 2).rows(
+            self.path, self.first_chunk, "utf-16", SemicolonDialect))
+        self.assertEqual([["0", "v0"], ["1", "v1"]], rows)
+
+    def test_errors(self):
+        with self.path.open("ab") as dest:
+            dest.write(b"10000;v\xe9\n")
+        for sampler in (FullSampler(), SpreadSampler(1000)):
+            with self.assertRaises(UnicodeDecodeError):
+                list(sampler.rows(self.path, self.first_chunk, "utf-8",
+                                  SemicolonDialect))
+            rows = list(sampler.rows(self.path, self.first_chunk, "utf-8",
+                                     SemicolonDialect, "replace"))
+            self.assertEqual(["10000", "v\ufffd"], rows[-1])
+
+    def test_key(self):
+        self.assertEqual(UniformSampler(10, seed=2).key(),
+                         UniformSampler(10, seed=2).key())
+        self.assertNotEqual(UniformSampler(10, seed=2).key(),
+                            UniformSampler(10, seed=3).key())
+        self.assertEqual("ReservoirSampler(row_budget=10, seed=0)",
+                         repr(ReservoirSampler(10)))
+        self.assertNotEqual(SpreadSampler(1000).key(),
+                            StratifiedSampler(1000).key())
+
+    def test_abstract(self):
+        class NoRangesSampler(_MmapSampler):
+            def key(self):
+                return "NoRangesSampler",
+
+        with self.assertRaises(TypeError):
+            NoRangesSampler()
+        with self.assertRaises(TypeError):
+            Sampler()
+
+
+if __name__ == '__main__':
+    unittest.main()
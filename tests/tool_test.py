@@ -19,9 +19,13 @@
 import io
 import os
 import sys
+import tempfile
 import unittest
 
-from columndet.tool import csv_det
+from columndet.result_cache import ResultCache
+from columndet.sampling import StratifiedSampler
+from columndet.stats import ParserStats
+from columndet.tool import csv_det, SamplingMode, _drop_last_line
 
 
 class ToolTest(unittest.TestCase):
@@ -45,7 +49,7 @@ class ToolTest(unittest.TestCase):
         meta_csv_data.write(out)
 
         self.assertEqual("""domain,key,value
-file,encoding,ascii
+file,encoding,utf-8
 csv,double_quote,false
 data,col/0/type,date/yyyy-MM-dd
 data,col/1/type,integer
@@ -94,6 +98,122 @@ data,col/10/type,float//.
 data,col/12/type,date/yyyy-MM-dd
 """.replace("\n", "\r\n"), out.getvalue())
 
+    def test_sampling(self):
+        path = self._get_fixture("csv/20201001-bal-216402149.csv")
+        expected = [str(d) for d in csv_det(path).field_descriptions]
+        for sampling in SamplingMode:
+            meta_csv_data = csv_det(path, sampling=sampling)
+            self.assertEqual(
+                expected, [str(d) for d in meta_csv_data.field_descriptions])
+
+    def test_workers(self):
+        path = self._get_fixture("csv/20201001-bal-216402149.csv")
+        expected = [str(d) for d in csv_det(path).field_descriptions]
+        meta_csv_data = csv_det(path, workers=2)
+        self.assertEqual(
+            expected, [str(d) for d in meta_csv_data.field_descriptions])
+
+    def test_truncated_chunk(self):
+        path = self._get_fixture("csv/20201001-bal-216402149.csv")
+        with open(path, "rb") as source:
+            data = source.read(4096)
+        self.assertFalse(data.endswith(b"\n"))
+        complete_rows = data.count(b"\n") - 1  # without the header
+        stats = ParserStats()
+        meta_csv_data = csv_det(path, chunk_size=4096, stats=stats)
+        self.assertEqual(16, len(meta_csv_data.field_descriptions))
+        # the truncated last row does not reach the accumulators
+        self.assertEqual([complete_rows] * 16,
+                         [column.rows for column in stats.columns])
+
+    def test_drop_last_line(self):
+        self.assertEqual("a;b\n1;2\n", _drop_last_line("a;b\n1;2\n3;"))
+        self.assertEqual("a;b", _drop_last_line("a;b"))
+
+    def test_spread(self):
+        with tempfile.TemporaryDirectory() as directory:
+            # sorted: the days of the first rows are all <= 12
+            path = os.path.join(directory, "sorted.csv")
+            with open(path, "w", encoding="ascii", newline="") as dest:
+                dest.write("id;date\n")
+                for i in range(3000):
+                    day = 1 + i % 12 if i < 1000 else 13 + i % 16
+                    dest.write(f"{i};2020-{1 + i % 12:02d}-{day:02d}\n")
+            self.assertEqual('text', str(csv_det(
+                path, chunk_size=4096,
+                sampling=SamplingMode.HEAD).field_descriptions[1]))
+            self.assertEqual('date/yyyy-MM-dd', str(csv_det(
+                path, chunk_size=4096,
+                sampling=SamplingMode.SPREAD).field_descriptions[1]))
+
+    def test_non_ascii_after_first_chunk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "late.csv")
+            with open(path, "w", encoding="utf-8", newline="") as dest:
+                dest.write("id;amount\n")
+                for i in range(3000):
+                    dest.write(f"{i};\n")
+                for i in range(3000, 3200):
+                    dest.write(f"{i};{i % 97},{i % 10}5 €\n")
+            for sampling in (SamplingMode.FULL, SamplingMode.SPREAD):
+                meta_csv_data = csv_det(path, chunk_size=4096,
+                                        sampling=sampling)
+                self.assertEqual("utf-8", meta_csv_data.encoding)
+                self.assertEqual(
+                    "currency",
+                    str(meta_csv_data.field_descriptions[1]).split("/")[0])
+
+    def test_other_encoding_after_first_chunk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "late.csv")
+            with open(path, "w", encoding="cp1251", newline="") as dest:
+                dest.write("id;amount;comment\n")
+                for i in range(3000):
+                    dest.write(f"{i};{i % 97}.{i % 10}5;\n")
+                for i in range(3000, 3200):
+                    dest.write(f"{i};{i % 97}.{i % 10}5;"
+                               f"Привет мир, как дела\n")
+            for sampling in (SamplingMode.FULL, SamplingMode.SPREAD):
+                stats = ParserStats()
+                meta_csv_data = csv_det(path, chunk_size=4096,
+                                        sampling=sampling, stats=stats)
+                self.assertEqual("cp1251", meta_csv_data.encoding)
+                self.assertEqual(("cp1251", "chardet"), stats.encoding)
+                self.assertEqual(
+                    "float",
+                    str(meta_csv_data.field_descriptions[1]).split("/")[0])
+
+    def test_sampler(self):
+        path = self._get_fixture("csv/20201001-bal-216402149.csv")
+        meta_csv_data = csv_det(path, chunk_size=4096,
+                                sampling=StratifiedSampler(4096, 50))
+        self.assertEqual(16, len(meta_csv_data.field_descriptions))
+        self.assertEqual('date/yyyy-MM-dd',
+                         str(meta_csv_data.field_descriptions[12]))
+
+    def test_encoding_tier(self):
+        stats = ParserStats()
+        csv_det(self._get_fixture("csv/20201001-bal-216402149.csv"),
+                stats=stats)
+        self.assertEqual(("UTF-8-SIG", "bom"), stats.encoding)
+        self.assertIn("Encoding: UTF-8-SIG (tier bom)", stats.report())
+
+    def test_cache(self):
+        path = self._get_fixture("csv/20201001-bal-216402149.csv")
+        expected = csv_det(path)
+        expected_out = io.StringIO()
+        expected.write(expected_out)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            for _ in range(2):
+                meta_csv_data = csv_det(path, cache=cache)
+                out = io.StringIO()
+                meta_csv_data.write(out)
+                self.assertEqual(expected_out.getvalue(), out.getvalue())
+            self.assertEqual((1, 1), (cache.hits, cache.misses))
+            csv_det(path, threshold=0.9, cache=cache)
+            self.assertEqual((1, 2), (cache.hits, cache.misses))
+
     def _get_fixture(self, fixture_name: str) -> str:
         return os.path.abspath(
         os.path.join(__file__, "../fixtures", fixture_name))
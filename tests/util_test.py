@@ -0,0 +1,75 @@
+#  ColumnDet - A column type detector
+#      Copyright (C) 2020 J. Férard <https://github.com/jferard>
+#
+#   This file is part of ColumnDet.
+#
+#   ColumnDet is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   ColumnDet is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+import unittest
+
+from columndet.util import ColumnInfos, OpCode, Token, TokenRow
+
+
+class ColumnInfosTest(unittest.TestCase):
+    def test_cached(self):
+        infos = ColumnInfos.create(
+            [Token(OpCode.NUMBER, "12"), Token(OpCode.SPACE, " "),
+             Token(OpCode.NUMBER, "34")], None, 0.9, [3, 1, 2])
+        self.assertEqual(2, infos.unique_width)
+        self.assertEqual(OpCode.NUMBER, infos.unique_opcode)
+        self.assertEqual({OpCode.NUMBER: 5}, infos.opcodes)
+        self.assertEqual({"12", " ", "34"}, infos.texts)
+        self.assertIs(infos.texts, infos.texts)
+        with self.assertRaises(ValueError):
+            infos.unique_token
+
+    def test_invalidate(self):
+        infos = ColumnInfos.create([Token(OpCode.NUMBER, "12"),
+                                    Token(OpCode.NUMBER, "34")], None, 0.9)
+        self.assertEqual({"12", "34"}, infos.texts)
+        infos.non_null_tokens.pop()
+        infos.invalidate()
+        self.assertEqual(Token(OpCode.NUMBER, "12"), infos.unique_token)
+
+        # the weights follow the view
+        infos = ColumnInfos.create([Token(OpCode.NUMBER, "12"),
+                                    Token(OpCode.NUMBER, "34")], None, 0.9,
+                                   [5, 1])
+        infos.non_null_tokens.shift()
+        infos.invalidate()
+        self.assertEqual(Token(OpCode.NUMBER, "34"), infos.unique_token)
+        self.assertEqual({OpCode.NUMBER: 1}, infos.opcodes)
+
+
+class TokenRowTest(unittest.TestCase):
+    def test_view(self):
+        tokens = [Token(OpCode.NUMBER, "1"), Token(OpCode.PUNCTUATION, ","),
+                  Token(OpCode.NUMBER, "234"), Token(OpCode.SPACE, " ")]
+        row = TokenRow(tokens, 3).rstrip(lambda t: t.opcode == OpCode.SPACE)
+        copy = row.copy()
+        self.assertEqual(Token(OpCode.NUMBER, "234"), row.pop())
+        self.assertEqual(Token(OpCode.NUMBER, "1"), row.shift())
+        self.assertEqual([Token(OpCode.PUNCTUATION, ",")], list(row))
+        self.assertEqual(",", row[-1].text)
+        self.assertEqual(3, len(copy))
+        self.assertEqual(3, copy.weight)
+        self.assertEqual(4, len(tokens))
+        row.pop()
+        with self.assertRaises(IndexError):
+            row.last()
+
+
+if __name__ == '__main__':
+    unittest.main()